@@ -1,11 +1,41 @@
+const apiHeaders = () => ({ 'X-API-Key': Cypress.env('apiKey') });
+
+// POST /refresh only starts the pipeline (202 + jobId); poll the job until it
+// leaves "running" so the specs see the seeded signals
+const waitForRefreshJob = (jobId: string, attemptsLeft = 60): void => {
+  cy.request({
+    url: `${Cypress.env('apiUrl')}/refresh/${jobId}`,
+    headers: apiHeaders(),
+  }).then((response) => {
+    if (response.body.status !== 'running') {
+      return;
+    }
+    if (attemptsLeft <= 1) {
+      throw new Error(`Pipeline run ${jobId} still running`);
+    }
+    cy.wait(1000);
+    waitForRefreshJob(jobId, attemptsLeft - 1);
+  });
+};
+
 describe('Signals Workflow', () => {
   beforeEach(() => {
     // Reset and seed test data
     cy.request({
       method: 'POST',
       url: `${Cypress.env('apiUrl')}/refresh`,
-      headers: { 'X-API-Key': Cypress.env('apiKey') },
+      headers: apiHeaders(),
       failOnStatusCode: false,
+    }).then((response) => {
+      if (response.status === 202) {
+        waitForRefreshJob(response.body.jobId);
+      } else if (response.status === 409) {
+        // A run from an earlier spec is still going; wait for that one
+        const running = /Pipeline run (\S+) already in progress/.exec(response.body.detail);
+        if (running) {
+          waitForRefreshJob(running[1]);
+        }
+      }
     });
   });
 
@@ -17,7 +17,7 @@ const routes = {
   trendingTopics: "/topics/trending",
   entity: (id: string) => `/entities/${encodeURIComponent(id)}`,
   topicTimeline: (topic: string) => `/topics/${encodeURIComponent(topic)}/timeline`,
-  refresh: "/refresh",
+  refresh: "/discoveries/refresh",
 };
 
 /**
@@ -27,6 +27,7 @@ export type Paginated<T> = {
   total: number;
   page: number;
   pageSize: number;
+  nextCursor?: string | null;
 };
 
 export type SignalsListParams = {
@@ -1,40 +1,69 @@
 from __future__ import annotations
 
 import asyncio
+import gzip
+import inspect
 import logging
 import json
 import os
 import sqlite3
+import threading
 import time
-import uuid
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from datetime import datetime, timezone
+from decimal import Decimal
 from enum import Enum
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Literal, cast
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Literal, Tuple, cast
 
+import numpy as np
+import orjson
+from anyio import to_thread
+from prometheus_client import CONTENT_TYPE_LATEST
 from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.routing import serialize_response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
-from pydantic import BaseModel
-from starlette.middleware.base import BaseHTTPMiddleware
-
-from . import __version__
-from .cache import cached, get_cache_stats, invalidate_cache
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    GetJsonSchemaHandler,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    model_serializer,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import (
+    __version__,
+    analytics,
+    discovery_scoring,
+    identity_resolution,
+    pipeline,
+    relationship_detection,
+    topic_evolution,
+)
+from . import db as db_module
+from . import experiment as experiment_module
+from .cache import cached_response, get_cache_stats, invalidate_cache
+from .compression import CompressionMiddleware, accepted_encodings
 from .config import Settings, load_settings
-from .db import get_tweet, init_db, list_top, run_migrations
+from .db import get_tweet, init_db, run_migrations
+from .db_pool import ConnectionPool, init_pool
 from .health import HealthCheckResponse, check_liveness, check_readiness, check_startup
 from .logger import get_logger
 from .metrics import get_metrics
 from .pipeline import run_pipeline
 from .rate_limiter import RateLimitTier, get_rate_limiter
-from .validation import (
-    validate_api_key,
-    validate_hours,
-    validate_limit,
-    validate_salience,
-    validate_tweet_id,
-)
+from .utils import utc_now_iso
+from .validation import validate_api_key, validate_tweet_id
 
 log = get_logger(__name__)
 
@@ -43,6 +72,31 @@ log = get_logger(__name__)
 # Pydantic Models
 # ============================================================================
 
+# Shared config for read-only response models: immutable once built and
+# constructible straight from sqlite3.Row / attribute objects.
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", from_attributes=True)
+
+
+class CompactResponseModel(BaseModel):
+    """Base for sparse response models whose optional fields are mostly unset.
+
+    ``None`` values are dropped on serialization, so list payloads only carry
+    the keys a row actually has. Envelope models (cursors, ``hasMore``) keep
+    their explicit nulls.
+    """
+
+    @model_serializer(mode="wrap")
+    def _omit_none(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        # Document the declared fields, not the serializer's plain dict return
+        field_schema = {key: value for key, value in core_schema.items() if key != "serialization"}
+        return handler(cast(CoreSchema, field_schema))
+
 class SignalStatus(str, Enum):
     """Signal status enum matching frontend types."""
     active = "active"
@@ -53,6 +107,8 @@ class SignalStatus(str, Enum):
 
 class Signal(BaseModel):
     """Signal response model matching frontend types."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     source: str
@@ -81,14 +137,19 @@ class UpdateSignalInput(BaseModel):
 
 class PaginatedSignals(BaseModel):
     """Paginated signals response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: List[Signal]
     total: int
     page: int
     pageSize: int
+    nextCursor: Optional[str] = None
 
 
 class SignalsStats(BaseModel):
     """Signal statistics response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     total: int
     active: int
     paused: int
@@ -105,6 +166,8 @@ class SnapshotStatus(str, Enum):
 
 class Snapshot(BaseModel):
     """Snapshot response model."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
     signalId: str
     signalName: Optional[str] = None
@@ -115,6 +178,8 @@ class Snapshot(BaseModel):
 
 class PaginatedSnapshots(BaseModel):
     """Paginated snapshots response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: List[Snapshot]
     total: int
     page: int
@@ -129,6 +194,8 @@ class BulkScope(BaseModel):
 
 class BulkJobResponse(BaseModel):
     """Bulk job creation response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     jobId: str
     total: int
 
@@ -143,6 +210,8 @@ class BulkJobStatusEnum(str, Enum):
 
 class BulkJobStatus(BaseModel):
     """Bulk job status response."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     jobId: str
     status: BulkJobStatusEnum
     total: int
@@ -161,8 +230,10 @@ class BulkSetStatusInput(BaseModel):
 # Discovery Pydantic Models (Phase One)
 # ============================================================================
 
-class Discovery(BaseModel):
+class Discovery(CompactResponseModel):
     """Discovery response model matching frontend types."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     artifactId: int
     artifactType: str
@@ -187,8 +258,10 @@ class Discovery(BaseModel):
     updatedAt: str  # ISO string
 
 
-class Topic(BaseModel):
+class Topic(CompactResponseModel):
     """Topic response model matching frontend types."""
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: int
     name: str
     taxonomyPath: Optional[str] = None
@@ -199,7 +272,7 @@ class Topic(BaseModel):
     updatedAt: Optional[str] = None  # ISO string
 
 
-class Entity(BaseModel):
+class Entity(CompactResponseModel):
     """Entity response model matching frontend types."""
     id: int
     entityType: str  # person, lab, organization
@@ -355,6 +428,13 @@ class EntityAccount(BaseModel):
     updatedAt: Optional[str] = None
 
 
+# Entity forward-references EntityAccount; resolve now so the validator and
+# serializer are built at import rather than on the first entity request
+Entity.model_rebuild()
+PaginatedEntities.model_rebuild()
+EntitySearchResult.model_rebuild()
+
+
 class EntityStats(BaseModel):
     """Entity statistics model."""
     entityId: int
@@ -487,8 +567,469 @@ class CreateExperimentRequest(BaseModel):
     baselineId: Optional[int] = None
 
 
-# In-memory bulk jobs storage (for MVP)
-bulk_jobs: Dict[str, Dict[str, Any]] = {}
+class LabelRequest(BaseModel):
+    """Ground truth label entry for bulk labelling."""
+    artifactId: int
+    label: str
+    confidence: float = 1.0
+    annotator: Optional[str] = None
+    notes: Optional[str] = None
+
+
+# Labels per POST /labels/bulk; 7 bound parameters each keeps one statement under SQLite's limit
+MAX_BULK_LABELS = 100
+
+
+# ============================================================================
+# Response Classes
+# ============================================================================
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse rendered with orjson (datetime, UUID, numpy and Decimal aware)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+# /top is polled by dashboards; a few seconds of staleness saves a scan per poll
+TOP_CACHE_TTL_SECONDS = 5
+
+# Rows encoded per chunk when streaming unbounded list responses
+STREAM_BATCH_SIZE = 200
+
+# Pipeline runs kept for GET /refresh/{job_id}; only one runs at a time
+MAX_PIPELINE_JOBS = 50
+
+
+async def _stream_json_list(key: str, items: List[Dict[str, Any]], **extra: Any) -> AsyncIterator[bytes]:
+    """Yield ``{key: items, **extra}`` as JSON, encoding ``items`` in batches.
+
+    The client starts receiving rows before the last one is encoded and the
+    whole document is never held as one bytestring.
+    """
+    yield b'{' + orjson.dumps(key) + b':['
+    for start in range(0, len(items), STREAM_BATCH_SIZE):
+        batch = orjson.dumps(items[start:start + STREAM_BATCH_SIZE], default=_orjson_default)
+        yield (b"," if start else b"") + batch[1:-1]
+    yield b"]"
+    for name, value in extra.items():
+        yield b"," + orjson.dumps(name) + b":" + orjson.dumps(value, default=_orjson_default)
+    yield b"}"
+
+
+# Newer FastAPI releases serialize response models straight to JSON bytes with
+# pydantic-core, but only while the route keeps the default response class.
+# Older releases go through jsonable_encoder + json.dumps, where orjson wins.
+FASTAPI_DUMPS_JSON = "dump_json" in inspect.signature(serialize_response).parameters
+
+
+class PydanticResponse(Response):
+    """JSON response rendered directly from a Pydantic model.
+
+    Routes return this for models they have already built from trusted data, so
+    FastAPI skips re-validating the value against ``response_model`` and the
+    ``jsonable_encoder`` pass. The decorator's ``response_model`` still
+    documents the schema.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        return bytes(super().render(content))
+
+
+# List serializers built once at import; used for bare-list response bodies
+_DISCOVERIES_ADAPTER: TypeAdapter[List[Discovery]] = TypeAdapter(List[Discovery])
+_TOPICS_ADAPTER: TypeAdapter[List[Topic]] = TypeAdapter(List[Topic])
+
+
+def _construct_signal(row: Dict[str, Any]) -> Signal:
+    """Build a Signal from a trusted ``db.list_signals`` row without validation."""
+    row["status"] = SignalStatus(row["status"])
+    return Signal.model_construct(**row)
+
+
+def _construct_snapshot(row: Dict[str, Any]) -> Snapshot:
+    """Build a Snapshot from a trusted ``db.list_snapshots`` row without validation."""
+    row["status"] = SnapshotStatus(row["status"])
+    return Snapshot.model_construct(**row)
+
+
+def _construct_discovery(row: Dict[str, Any]) -> Discovery:
+    """Build a Discovery from a trusted discoveries query row without validation.
+
+    The DB layer is the validation boundary: rows were validated on write and
+    the list queries normalize tags/topics/urgency, so only the column names
+    need mapping here.
+    """
+    return Discovery.model_construct(
+        id=row["id"],
+        artifactId=row["artifact_id"],
+        artifactType=row["artifact_type"],
+        source=row["source"],
+        sourceId=row["source_id"],
+        title=row["title"],
+        text=row.get("text"),
+        url=row.get("url"),
+        publishedAt=row["published_at"],
+        novelty=row.get("novelty"),
+        emergence=row.get("emergence"),
+        obscurity=row.get("obscurity"),
+        discoveryScore=row.get("discovery_score"),
+        computedAt=row.get("computed_at"),
+        category=row.get("category"),
+        sentiment=row.get("sentiment"),
+        urgency=row.get("urgency"),
+        tags=row.get("tags"),
+        topics=row.get("topics"),
+        reasoning=row.get("reasoning"),
+        createdAt=row["created_at"],
+        updatedAt=row["updated_at"],
+    )
+
+
+def _construct_topic(row: Dict[str, Any]) -> Topic:
+    """Build a Topic from a trusted trending-topics query row without validation."""
+    return Topic.model_construct(
+        id=row["id"],
+        name=row["name"],
+        taxonomyPath=row.get("taxonomy_path"),
+        description=row.get("description"),
+        artifactCount=row.get("artifact_count"),
+        avgDiscoveryScore=row.get("avg_discovery_score"),
+        createdAt=row.get("created_at"),
+        updatedAt=row.get("updated_at"),
+    )
+
+
+def _construct_timeline_point(row: Dict[str, Any]) -> TopicTimeline:
+    """Build a TopicTimeline point from a trusted ``db.get_topic_timeline`` row."""
+    return TopicTimeline.model_construct(
+        date=row["date"],
+        artifactCount=row["artifact_count"],
+        avgDiscoveryScore=row.get("avg_discovery_score"),
+    )
+
+
+def _discoveries_page_response(db_path: str, **query: Any) -> Response:
+    """Query, build and encode one discoveries page; runs in a worker thread."""
+    raw_discoveries, next_cursor, has_more = db_module.list_top_discoveries_paginated(db_path, **query)
+    return PydanticResponse(PaginatedDiscoveries.model_construct(
+        items=[_construct_discovery(d) for d in raw_discoveries],
+        nextCursor=next_cursor,
+        hasMore=has_more,
+    ))
+
+
+def _topics_page_response(db_path: str, **query: Any) -> Response:
+    """Query, build and encode one trending topics page; runs in a worker thread."""
+    raw_topics, next_cursor, has_more = db_module.get_trending_topics_paginated(db_path, **query)
+    return PydanticResponse(PaginatedTopics.model_construct(
+        items=[_construct_topic(t) for t in raw_topics],
+        nextCursor=next_cursor,
+        hasMore=has_more,
+    ))
+
+
+# Default security headers as raw ASGI (name, value) pairs, encoded once
+SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+    # HSTS is meaningful over HTTPS; harmless if not
+    (b"strict-transport-security", b"max-age=63072000; includeSubDomains; preload"),
+)
+
+
+# In-memory bulk jobs storage (for MVP), capped so finished jobs don't leak.
+# Kept in least-recently-used order; only finished jobs are evicted.
+MAX_BULK_JOBS = 1_000
+FINISHED_BULK_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Finished jobs are also dropped this long after they finish, swept on an interval
+BULK_JOB_TTL_SECONDS = 3600.0
+BULK_JOB_SWEEP_SECONDS = 60.0
+
+# Signals per UPDATE/DELETE statement in bulk jobs (below SQLite's 999 bound-parameter floor)
+BULK_JOB_CHUNK_SIZE = 500
+
+# Idle SSE streams send a comment frame this often so proxies keep them open
+SSE_KEEPALIVE_SECONDS = 15.0
+SSE_KEEPALIVE_FRAME = b": ping\n\n"
+
+# The registry is split into independently locked shards keyed by job id, so
+# concurrent endpoints touching different jobs don't serialize on one lock/dict.
+# Each shard holds an equal slice of MAX_BULK_JOBS.
+BULK_JOB_SHARDS = 16
+bulk_jobs_shards: List[OrderedDict[str, Dict[str, Any]]] = [OrderedDict() for _ in range(BULK_JOB_SHARDS)]
+# Sync endpoints touch the registry from threadpool workers
+_bulk_jobs_locks = [threading.Lock() for _ in range(BULK_JOB_SHARDS)]
+
+
+def _new_job_id() -> str:
+    """Return a random 128-bit hex job id (no UUID object or hyphen formatting)."""
+    return os.urandom(16).hex()
+
+
+def _bulk_job_shard(job_id: str) -> Tuple[threading.Lock, OrderedDict[str, Dict[str, Any]]]:
+    """Return the lock and registry shard that own ``job_id``."""
+    index = hash(job_id) % BULK_JOB_SHARDS
+    return _bulk_jobs_locks[index], bulk_jobs_shards[index]
+
+
+def _register_bulk_job(job_id: str, job: Dict[str, Any]) -> None:
+    """Store a new bulk job, evicting least recently used finished jobs beyond the shard's cap."""
+    lock, shard = _bulk_job_shard(job_id)
+    shard_cap = max(1, MAX_BULK_JOBS // BULK_JOB_SHARDS)
+    with lock:
+        shard[job_id] = job
+        shard.move_to_end(job_id)
+        excess = len(shard) - shard_cap
+        if excess > 0:
+            finished = (
+                jid for jid, entry in shard.items()
+                if entry.get("status") in FINISHED_BULK_JOB_STATUSES
+            )
+            for jid in list(islice(finished, excess)):
+                del shard[jid]
+
+
+def _get_bulk_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a bulk job and mark it as recently used."""
+    lock, shard = _bulk_job_shard(job_id)
+    with lock:
+        job = shard.get(job_id)
+        if job is not None:
+            shard.move_to_end(job_id)
+        return job
+
+
+def _sweep_bulk_jobs(now: Optional[float] = None) -> int:
+    """Drop finished jobs whose TTL has elapsed; returns the number removed.
+
+    Attached SSE streams hold their own reference to the job and still finish normally.
+    """
+    now = time.monotonic() if now is None else now
+    removed = 0
+    for lock, shard in zip(_bulk_jobs_locks, bulk_jobs_shards):
+        with lock:
+            expired = [
+                jid for jid, entry in shard.items()
+                if "expires_at" in entry and entry["expires_at"] <= now
+            ]
+            for jid in expired:
+                del shard[jid]
+            removed += len(expired)
+    return removed
+
+
+def _publish_bulk_job_progress(job: Dict[str, Any]) -> None:
+    """Publish an immutable progress snapshot and its SSE frame for ``job``.
+
+    Readers (the status endpoint runs in a worker thread) only ever see
+    ``job["progress"]``, swapped in as a single reference, so status, done and
+    fail are always read as one consistent set without a lock.
+    """
+    progress = {
+        "jobId": job["jobId"],
+        "status": job["status"],
+        "total": job["total"],
+        "done": job["done"],
+        "fail": job["fail"],
+    }
+    job["latest_frame"] = b"data: " + orjson.dumps(progress) + b"\n\n"
+    job["progress"] = progress
+
+
+def _new_bulk_job(job_id: str, **fields: Any) -> Dict[str, Any]:
+    """Build a running bulk job entry; must be called on the event loop."""
+    job: Dict[str, Any] = {
+        "jobId": job_id,
+        "status": "running",
+        "done": 0,
+        "fail": 0,
+        # Bumped on every progress/status change; SSE subscribers wait on the event
+        "seq": 0,
+        "progress_event": asyncio.Event(),
+        **fields,
+    }
+    _publish_bulk_job_progress(job)
+    return job
+
+
+def _notify_bulk_job(job: Dict[str, Any]) -> None:
+    """Wake every SSE subscriber of ``job``; must be called on the event loop."""
+    if job["status"] in FINISHED_BULK_JOB_STATUSES and "expires_at" not in job:
+        job["expires_at"] = time.monotonic() + BULK_JOB_TTL_SECONDS
+    # Encode once per change; every subscriber sends these same bytes
+    _publish_bulk_job_progress(job)
+    job["seq"] += 1
+    # Swap in a fresh event and set the old one (rather than set/clear), so a
+    # subscriber that grabbed it but hasn't started waiting yet still wakes
+    event: asyncio.Event = job["progress_event"]
+    job["progress_event"] = asyncio.Event()
+    event.set()
+
+
+# /metrics aggregates are refreshed in the background on this interval
+METRICS_CACHE_TTL_SECONDS = 15.0
+
+# Expired in-memory rate limit buckets are swept on this interval
+RATE_LIMIT_SWEEP_SECONDS = 30.0
+
+
+@contextmanager
+def _monitoring_connection(db_path: str, pool: Optional[ConnectionPool] = None) -> Iterator[sqlite3.Connection]:
+    """Yield a connection for monitoring queries, from ``pool`` when available."""
+    if pool is not None:
+        with pool.connection() as conn:
+            yield conn
+        return
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def _pooled_connection(pool: Optional[ConnectionPool]) -> Iterator[Optional[sqlite3.Connection]]:
+    """Lend a pooled connection to ``db`` helpers, or ``None`` so they open their own."""
+    if pool is None:
+        yield None
+        return
+    with pool.connection() as conn:
+        yield conn
+
+
+def _read_page_size(db_path: str) -> Optional[int]:
+    """Read the SQLite page size, which is fixed once the database exists."""
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            return int(conn.execute("PRAGMA page_size;").fetchone()[0])
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        log.warning(f"Could not read SQLite page size: {e}")
+        return None
+
+
+def _database_size(db_path: str, page_size: Optional[int]) -> Dict[str, Any]:
+    """Size the SQLite database from its files (WAL included) without querying it."""
+    main_bytes = os.stat(db_path).st_size
+    try:
+        wal_bytes = os.stat(f"{db_path}-wal").st_size
+    except FileNotFoundError:
+        wal_bytes = 0
+    size_bytes = main_bytes + wal_bytes
+    return {
+        "size_bytes": size_bytes,
+        "size_human": f"{size_bytes / 1024 / 1024:.2f} MB",
+        "page_count": main_bytes // page_size if page_size else None,
+    }
+
+
+def _collect_metrics(
+    db_path: str,
+    pool: Optional[ConnectionPool] = None,
+    page_size: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run the /metrics aggregate queries against ``db_path``.
+
+    ``page_size`` may be passed in when already known, saving a connection per pass.
+    """
+    metrics_data: Dict[str, Any] = {
+        "database": {},
+        "tweets": {},
+        "performance": {},
+    }
+    
+    try:
+        if page_size is None:
+            page_size = _read_page_size(db_path)
+        metrics_data["database"] = _database_size(db_path, page_size)
+        with _monitoring_connection(db_path, pool) as conn:
+            _collect_metrics_into(conn, metrics_data)
+    except Exception as e:
+        log.error(f"Error collecting metrics: {e}")
+        metrics_data["error"] = str(e)
+
+    return metrics_data
+
+
+def _collect_metrics_into(conn: sqlite3.Connection, metrics_data: Dict[str, Any]) -> None:
+    """Fill ``metrics_data`` from the aggregate queries on ``conn``."""
+    # Tweet statistics in a single scan; 24h window for recent activity
+    day_ago = int(time.time()) - 24 * 3600
+    cursor = conn.execute(
+        """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(salience IS NOT NULL), 0),
+            COALESCE(SUM(category IS NOT NULL), 0),
+            COALESCE(SUM(notified_at IS NOT NULL), 0),
+            COALESCE(SUM(created_at_epoch > ?), 0),
+            AVG(salience),
+            MAX(salience),
+            AVG(CASE WHEN salience IS NOT NULL THEN urgency END)
+        FROM tweets;
+        """,
+        (day_ago,),
+    )
+    (
+        total_tweets,
+        scored_tweets,
+        analyzed_tweets,
+        notified_tweets,
+        recent_tweets,
+        avg_salience,
+        max_salience,
+        avg_urgency,
+    ) = cursor.fetchone()
+    
+    tweet_metrics: Dict[str, Any] = {
+        "total": total_tweets,
+        "scored": scored_tweets,
+        "analyzed": analyzed_tweets,
+        "notified": notified_tweets,
+        "recent_24h": recent_tweets,
+    }
+
+    # Category distribution
+    cursor = conn.execute(
+        "SELECT category, COUNT(*) FROM tweets WHERE category IS NOT NULL GROUP BY category;"
+    )
+    category_dist = {row[0]: row[1] for row in cursor.fetchall()}
+    tweet_metrics["by_category"] = category_dist
+
+    metrics_data["tweets"] = tweet_metrics
+
+    # Average metrics (over scored tweets)
+    performance_metrics: Dict[str, Any] = {}
+    if avg_salience is not None:
+        performance_metrics["avg_salience"] = round(avg_salience, 2)
+        performance_metrics["max_salience"] = round(max_salience, 2)
+        performance_metrics["avg_urgency"] = round(avg_urgency, 2)
+
+    metrics_data["performance"] = performance_metrics
 
 
 def init_sentry() -> None:
@@ -528,9 +1069,7 @@ def init_sentry() -> None:
 
 async def _process_bulk_job(job_id: str) -> None:
     """Process a bulk job in the background."""
-    from . import db as db_module
-    
-    job = bulk_jobs.get(job_id)
+    job = _get_bulk_job(job_id)
     if not job:
         return
     
@@ -539,25 +1078,27 @@ async def _process_bulk_job(job_id: str) -> None:
         target_ids = job["target_ids"]
         db_path = job["db_path"]
         
-        for signal_id in target_ids:
+        for start in range(0, len(target_ids), BULK_JOB_CHUNK_SIZE):
             # Check if cancelled
             if job["status"] == "cancelled":
                 break
             
+            chunk = target_ids[start:start + BULK_JOB_CHUNK_SIZE]
             try:
+                # SQLite writes block, so run them off the event loop
                 if operation == "set_status":
                     target_status = job["target_status"]
-                    db_module.update_signal(db_path, signal_id, {"status": target_status})
+                    await to_thread.run_sync(
+                        db_module.bulk_update_signals, db_path, chunk, {"status": target_status}
+                    )
                 elif operation == "delete":
-                    db_module.delete_signal(db_path, signal_id)
+                    await to_thread.run_sync(db_module.bulk_delete_signals, db_path, chunk)
                 
-                job["done"] += 1
+                job["done"] += len(chunk)
             except Exception as e:
-                log.error(f"Error processing signal {signal_id}: {e}")
-                job["fail"] += 1
-            
-            # Small delay to avoid blocking
-            await asyncio.sleep(0.01)
+                log.error(f"Error processing signals {chunk[0]}..{chunk[-1]}: {e}")
+                job["fail"] += len(chunk)
+            _notify_bulk_job(job)
         
         # Mark as completed if not cancelled
         if job["status"] == "running":
@@ -565,6 +1106,7 @@ async def _process_bulk_job(job_id: str) -> None:
     except Exception as e:
         log.error(f"Bulk job {job_id} failed: {e}")
         job["status"] = "failed"
+    _notify_bulk_job(job)
 
 
 # Pydantic models for request bodies
@@ -581,6 +1123,9 @@ class ExperimentRequest(BaseModel):
 def create_app(settings_path: Optional[str] = None) -> FastAPI:
     # Initialize Sentry first to catch any errors during setup
     init_sentry()
+    app_options: Dict[str, Any] = {}
+    if not FASTAPI_DUMPS_JSON:
+        app_options["default_response_class"] = OrjsonResponse
     app = FastAPI(
         title="Signal Harvester API",
         version="0.1.0",
@@ -625,21 +1170,35 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
                 "description": "Health checks and monitoring",
             },
         ],
+        **app_options,
     )
 
-    class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-        async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-            response = await call_next(request)
-            response.headers.setdefault("X-Content-Type-Options", "nosniff")
-            response.headers.setdefault("X-Frame-Options", "DENY")
-            response.headers.setdefault("Referrer-Policy", "no-referrer")
-            # HSTS is meaningful over HTTPS; harmless if not
-            response.headers.setdefault("Strict-Transport-Security", "max-age=63072000; includeSubDomains; preload")
-            return response
+    class SecurityHeadersMiddleware:
+        def __init__(self, app: ASGIApp) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Append only the defaults the route didn't set itself
+                    raw = list(message.get("headers", ()))
+                    present = {name.lower() for name, _ in raw}
+                    raw.extend(item for item in SECURITY_HEADERS if item[0] not in present)
+                    message["headers"] = raw
+                await send(message)
+
+            await self.app(scope, receive, send_with_headers)
 
     state: Dict[str, Any] = {}
     state["settings_path"] = settings_path
-    state["api_key"] = os.getenv("HARVEST_API_KEY")
+    # Settings and the API key are fixed for the app's lifetime; dependencies
+    # read them from these closure variables rather than the state dict
+    api_key = os.getenv("HARVEST_API_KEY")
+    state["api_key"] = api_key
 
     # Load settings and ensure DB
     settings = load_settings(settings_path)
@@ -649,14 +1208,18 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     
     # Initialize SQLite connection pool only when using SQLite
     is_sqlite = settings.app.database.is_sqlite
+    # page_size never changes after creation; read it once for /metrics
+    state["page_size"] = _read_page_size(settings.app.database_path) if is_sqlite else None
     if settings.app.connection_pool.enabled and is_sqlite:
-        from .db_pool import init_pool
+        # Every pooled consumer (signal/snapshot lookups, /metrics, health
+        # probes) only reads; writes open their own connections via db.connect
         pool = init_pool(
             db_path=settings.app.database_path,
             pool_size=settings.app.connection_pool.pool_size,
             max_overflow=settings.app.connection_pool.max_overflow,
             pool_timeout=settings.app.connection_pool.pool_timeout,
             pool_recycle=settings.app.connection_pool.pool_recycle,
+            read_only=True,
         )
         state["connection_pool"] = pool
         log.info(
@@ -678,19 +1241,17 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     )
     app.add_middleware(SecurityHeadersMiddleware)
     
-    # Add GZip compression for responses > 1KB
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Compress responses > 1KB: zstd/Brotli when installed and accepted, else gzip
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
     
     # Add distributed rate limiting middleware
-    def get_tier_from_request(request: Request) -> RateLimitTier:
-        """Determine rate limit tier from request API key."""
-        api_key = request.headers.get("x-api-key")
-        if not api_key:
+    def get_tier_for_api_key(request_key: Optional[str]) -> RateLimitTier:
+        """Determine rate limit tier from the request's API key."""
+        if not request_key:
             return RateLimitTier.ANONYMOUS
         
         # Check if API key is valid
-        expected = state["api_key"]
-        if api_key == expected:
+        if request_key == api_key:
             # For now, all authenticated users get API_KEY tier
             # In the future, check database for premium/admin status
             return RateLimitTier.API_KEY
@@ -698,55 +1259,103 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         # Invalid API key still counts as anonymous
         return RateLimitTier.ANONYMOUS
     
-    @app.middleware("http")
-    async def rate_limit_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    class RateLimitMiddleware:
         """Distributed rate limiting middleware with X-RateLimit-* headers."""
-        # Get rate limiter instance
-        limiter = get_rate_limiter()
-        
-        # Generate client identifier from IP address
-        identifier = request.client.host if request.client else "unknown"
-        
-        # Determine tier from API key
-        tier = get_tier_from_request(request)
-        
-        # Check rate limit
-        result = limiter.check_rate_limit(identifier, tier)
-        
-        if not result.allowed:
-            # Rate limit exceeded - return 429
-            return JSONResponse(
-                status_code=429,
-                content={"detail": f"Rate limit exceeded. Retry after {result.retry_after} seconds."},
-                headers={
-                    "Retry-After": str(result.retry_after),
-                    "X-RateLimit-Limit": str(result.limit),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(result.reset_at),
-                }
-            )
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers to response
-        response.headers["X-RateLimit-Limit"] = str(result.limit)
-        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
-        response.headers["X-RateLimit-Reset"] = str(result.reset_at)
-        
-        return response
+
+        def __init__(self, app: ASGIApp) -> None:
+            self.app = app
+
+        async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+            if scope["type"] != "http":
+                await self.app(scope, receive, send)
+                return
+
+            # Get rate limiter instance
+            limiter = get_rate_limiter()
+            
+            # Client IP and API key come straight from the ASGI scope; no
+            # Request/Headers objects are built for every request
+            client = scope.get("client")
+            identifier = client[0] if client else "unknown"
+            request_key = next((value for name, value in scope["headers"] if name == b"x-api-key"), None)
+            
+            # Determine tier from API key
+            tier = get_tier_for_api_key(request_key.decode("latin-1") if request_key is not None else None)
+            
+            # Check rate limit
+            result = limiter.check_rate_limit(identifier, tier)
+            
+            if not result.allowed:
+                # Rate limit exceeded - return 429
+                response = OrjsonResponse(
+                    status_code=429,
+                    content={"detail": f"Rate limit exceeded. Retry after {result.retry_after} seconds."},
+                    headers={
+                        "Retry-After": str(result.retry_after),
+                        "X-RateLimit-Limit": str(result.limit),
+                        "X-RateLimit-Remaining": "0",
+                        "X-RateLimit-Reset": str(result.reset_at),
+                    }
+                )
+                await response(scope, receive, send)
+                return
+
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Add rate limit headers to response
+                    headers = MutableHeaders(scope=message)
+                    headers["X-RateLimit-Limit"] = str(result.limit)
+                    headers["X-RateLimit-Remaining"] = str(result.remaining)
+                    headers["X-RateLimit-Reset"] = str(result.reset_at)
+                await send(message)
+
+            # Process request
+            await self.app(scope, receive, send_with_headers)
+
+    app.add_middleware(RateLimitMiddleware)
 
     def get_settings_dep() -> Settings:
-        return cast(Settings, state["settings"])
+        return settings
 
     def require_api_key(x_api_key: Optional[str] = Header(default=None)) -> None:
-        expected = state["api_key"]
-        if expected:
+        if api_key:
             # Validate API key format
             validated_key = validate_api_key(x_api_key)
-            if (validated_key or "") != expected:
+            if (validated_key or "") != api_key:
                 raise HTTPException(status_code=401, detail="Invalid API key")
 
+    def etag_matches(request: Request, response: Response, fingerprint: str) -> bool:
+        """Set a weak ETag for ``fingerprint`` and report whether the client copy is current."""
+        etag = f'W/"{fingerprint}"'
+        response.headers["ETag"] = etag
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        return etag in candidates or "*" in candidates
+
+    def not_modified_response(response: Response) -> Response:
+        return Response(status_code=304, headers={"ETag": response.headers["ETag"]})
+
+    @cached_response(prefix='top', ttl=TOP_CACHE_TTL_SECONDS)
+    def _get_top_cached(
+        db_path: str,
+        limit: int,
+        min_salience: float,
+        hours: Optional[int]
+    ) -> bytes:
+        """Cached top tweets (encoded JSON body)."""
+        
+        rows = db_module.list_top(
+            db_path,
+            limit=limit,
+            min_salience=min_salience,
+            hours=hours,
+            with_url=True,
+        )
+        # Plain DB rows: encode directly instead of validating against List[Dict[str, Any]]
+        return orjson.dumps(rows, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
     @app.get(
         "/top",
         tags=["tweets"],
@@ -759,23 +1368,10 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         min_salience: float = Query(0.0, ge=0.0, le=100.0, description="Minimum salience score filter"),
         hours: Optional[int] = Query(None, ge=1, le=168, description="Filter to tweets from last N hours"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> List[Dict[str, Any]]:
-        # Validate and sanitize inputs
-        validated_limit = validate_limit(limit, min_val=1, max_val=200)
-        validated_min_salience = validate_salience(min_salience, min_val=0.0, max_val=100.0)
-        validated_hours = validate_hours(hours, min_val=1, max_val=168) if hours is not None else None
-        
-        rows = list_top(
-            settings.app.database_path,
-            limit=validated_limit,
-            min_salience=validated_min_salience,
-            hours=validated_hours
-        )
-        for r in rows:
-            tid = r.get("tweet_id")
-            user = r.get("author_username")
-            r["url"] = f"https://x.com/{user}/status/{tid}" if user else f"https://x.com/i/web/status/{tid}"
-        return rows
+    ) -> Response:
+        # Bounds are enforced by the Query declarations above
+        body = _get_top_cached(settings.app.database_path, limit, min_salience, hours)
+        return Response(content=body, media_type="application/json")
 
     @app.get(
         "/tweet/{tweet_id}",
@@ -787,32 +1383,38 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def get(
         tweet_id: str,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Dict[str, Any]:
+    ) -> Response:
         # Validate tweet ID
         validated_tweet_id = validate_tweet_id(tweet_id)
         
-        row = get_tweet(settings.app.database_path, validated_tweet_id)
+        row = get_tweet(settings.app.database_path, validated_tweet_id, with_url=True)
         if not row:
             raise HTTPException(status_code=404, detail="Not found")
-        tid = row.get("tweet_id")
-        user = row.get("author_username")
-        row["url"] = f"https://x.com/{user}/status/{tid}" if user else f"https://x.com/i/web/status/{tid}"
-        return row
+        # Plain DB row: encode directly, as /top does, instead of validating against Dict[str, Any]
+        return OrjsonResponse(row)
+
+    # Pipeline runs fetch and call the LLM for minutes; they go to a dedicated
+    # worker and the client polls GET /refresh/{job_id} instead of holding the request
+    state["pipeline_executor"] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pipeline")
+    pipeline_jobs: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+    state["pipeline_jobs"] = pipeline_jobs
 
     @app.post(
         "/refresh",
         tags=["pipeline"],
         summary="Run the harvest pipeline",
         description="""
-        Execute the complete pipeline: fetch tweets, analyze content, compute salience scores,
-        and send notifications for high-priority items.
+        Start the complete pipeline in the background: fetch tweets, analyze content,
+        compute salience scores, and send notifications for high-priority items.
+        Returns a job id to poll with GET /refresh/{job_id}.
         
         Requires API key authentication.
         """,
-        response_model=Dict[str, int],
+        response_model=Dict[str, Any],
+        status_code=202,
         dependencies=[Depends(require_api_key)],
     )
-    def refresh(
+    async def refresh(
         notify_threshold: Optional[float] = Query(
             None, ge=0.0, le=100.0, description="Minimum salience score for notifications"
         ),
@@ -821,27 +1423,57 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             None, ge=1, le=168, description="Only consider tweets from last N hours"
         ),
         settings: Settings = Depends(get_settings_dep),
-    ) -> Dict[str, int]:
-        # Validate parameters
-        validated_threshold = (
-            validate_salience(notify_threshold, min_val=0.0, max_val=100.0)
-            if notify_threshold is not None
-            else None
-        )
-        validated_limit = validate_limit(notify_limit, min_val=0, max_val=50)
-        validated_hours = (
-            validate_hours(notify_hours, min_val=1, max_val=168)
-            if notify_hours is not None
-            else None
-        )
-        
-        stats = run_pipeline(
+    ) -> Dict[str, Any]:
+        # Bounds are enforced by the Query declarations above
+        # One run at a time; runs share the same tweets and notification quota
+        running = next((jid for jid, job in pipeline_jobs.items() if not job["future"].done()), None)
+        if running is not None:
+            raise HTTPException(status_code=409, detail=f"Pipeline run {running} already in progress")
+        
+        job_id = _new_job_id()
+        future = state["pipeline_executor"].submit(
+            run_pipeline,
             settings,
-            notify_threshold=validated_threshold,
-            notify_limit=validated_limit,
-            notify_hours=validated_hours
+            notify_threshold=notify_threshold,
+            notify_limit=notify_limit,
+            notify_hours=notify_hours,
         )
-        return stats
+        pipeline_jobs[job_id] = {
+            "future": future,
+            "startedAt": datetime.now(timezone.utc).isoformat(),
+        }
+        # Only the newest job can still be running, so the oldest are safe to drop
+        while len(pipeline_jobs) > MAX_PIPELINE_JOBS:
+            pipeline_jobs.popitem(last=False)
+        
+        return {"jobId": job_id, "status": "running"}
+
+    @app.get(
+        "/refresh/{job_id}",
+        tags=["pipeline"],
+        summary="Get pipeline run status",
+        description="Poll a pipeline run started with POST /refresh; completed runs include their stats.",
+        response_model=Dict[str, Any],
+        dependencies=[Depends(require_api_key)],
+    )
+    def get_refresh_job(job_id: str) -> Dict[str, Any]:
+        job = pipeline_jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Pipeline run not found")
+        
+        future = job["future"]
+        result: Dict[str, Any] = {"jobId": job_id, "startedAt": job["startedAt"]}
+        if not future.done():
+            result["status"] = "running"
+        elif future.cancelled():
+            result["status"] = "cancelled"
+        elif future.exception() is not None:
+            result["status"] = "failed"
+            result["error"] = str(future.exception())
+        else:
+            result["status"] = "completed"
+            result["stats"] = future.result()
+        return result
 
     @app.get(
         "/health",
@@ -861,9 +1493,10 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         description="Comprehensive Prometheus metrics from new metrics module.",
         response_class=PlainTextResponse,
     )
-    def metrics_prometheus() -> bytes:
+    def metrics_prometheus() -> Response:
         """Prometheus metrics endpoint with comprehensive instrumentation."""
-        return get_metrics()
+        # Hand the exposition bytes straight to the response; no encoder pass
+        return Response(content=get_metrics(), media_type=CONTENT_TYPE_LATEST)
     
     @app.get(
         "/health/live",
@@ -919,8 +1552,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         stats["enabled"] = True
         
         # Add configuration details
-        settings = state.get("settings")
-        if settings and hasattr(settings, "app") and hasattr(settings.app, "connection_pool"):
+        if hasattr(settings.app, "connection_pool"):
             pool_config = settings.app.connection_pool
             stats["config"] = {
                 "pool_size": pool_config.pool_size,
@@ -938,92 +1570,22 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         description="Retrieve system performance and usage metrics.",
         response_model=Dict[str, Any],
     )
-    def metrics(settings: Settings = Depends(get_settings_dep)) -> Dict[str, Any]:
+    def metrics(settings: Settings = Depends(get_settings_dep)) -> Response:
         """Get system metrics and statistics."""
-        import sqlite3
-
-        db_path = settings.app.database_path
-        metrics_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "database": {},
-            "tweets": {},
-            "performance": {},
-        }
-        
-        try:
-            conn = sqlite3.connect(db_path)
-            
-            # Database size
-            cursor = conn.execute("PRAGMA page_count;")
-            page_count = cursor.fetchone()[0]
-            cursor = conn.execute("PRAGMA page_size;")
-            page_size = cursor.fetchone()[0]
-            db_size_bytes = page_count * page_size
-            
-            metrics_data["database"] = {
-                "size_bytes": db_size_bytes,
-                "size_human": f"{db_size_bytes / 1024 / 1024:.2f} MB",
-                "page_count": page_count,
-            }
-            
-            # Tweet statistics
-            cursor = conn.execute("SELECT COUNT(*) FROM tweets;")
-            total_tweets = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM tweets WHERE salience IS NOT NULL;")
-            scored_tweets = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM tweets WHERE category IS NOT NULL;")
-            analyzed_tweets = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM tweets WHERE notified_at IS NOT NULL;")
-            notified_tweets = cursor.fetchone()[0]
-            
-            # Recent activity (last 24 hours)
-            day_ago = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat().replace("+00:00", "Z")
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM tweets WHERE created_at > ?;",
-                (day_ago,)
-            )
-            recent_tweets = cursor.fetchone()[0]
-            
-            tweet_metrics: Dict[str, Any] = {
-                "total": total_tweets,
-                "scored": scored_tweets,
-                "analyzed": analyzed_tweets,
-                "notified": notified_tweets,
-                "recent_24h": recent_tweets,
-            }
-
-            # Category distribution
-            cursor = conn.execute(
-                "SELECT category, COUNT(*) FROM tweets WHERE category IS NOT NULL GROUP BY category;"
+        cached_metrics = state.get("metrics_cache")
+        if cached_metrics is None or time.monotonic() - cached_metrics[0] > 2 * METRICS_CACHE_TTL_SECONDS:
+            # Refresher not running (or stalled): collect inline and prime the cache
+            cached_metrics = (
+                time.monotonic(),
+                _collect_metrics(settings.app.database_path, state["connection_pool"], state["page_size"]),
             )
-            category_dist = {row[0]: row[1] for row in cursor.fetchall()}
-            tweet_metrics["by_category"] = category_dist
-
-            metrics_data["tweets"] = tweet_metrics
+            state["metrics_cache"] = cached_metrics
 
-            # Average metrics
-            cursor = conn.execute(
-                "SELECT AVG(salience), MAX(salience), AVG(urgency) FROM tweets WHERE salience IS NOT NULL;"
-            )
-            avg_row = cursor.fetchone()
-            performance_metrics: Dict[str, Any] = {}
-            if avg_row and avg_row[0] is not None:
-                performance_metrics["avg_salience"] = round(avg_row[0], 2)
-                performance_metrics["max_salience"] = round(avg_row[1], 2)
-                performance_metrics["avg_urgency"] = round(avg_row[2], 2)
-
-            metrics_data["performance"] = performance_metrics
-            
-            conn.close()
-            
-        except Exception as e:
-            log.error(f"Error collecting metrics: {e}")
-            metrics_data["error"] = str(e)
-        
-        return metrics_data
+        metrics_data = {
+            "timestamp": utc_now_iso(),
+            **cached_metrics[1],
+        }
+        return OrjsonResponse(metrics_data)
 
     # ========================================================================
     # Signals & Snapshots Endpoints
@@ -1037,6 +1599,8 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         response_model=PaginatedSignals,
     )
     def list_signals_endpoint(
+        request: Request,
+        response: Response,
         page: int = Query(1, ge=1, description="Page number"),
         pageSize: int = Query(20, ge=1, le=100, description="Page size"),
         search: Optional[str] = Query(None, description="Search query"),
@@ -1044,27 +1608,40 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         source: Optional[str] = Query(None, description="Filter by source"),
         sort: str = Query("createdAt", description="Sort field"),
         order: str = Query("desc", description="Sort order (asc/desc)"),
+        cursor: Optional[str] = Query(None, description="Cursor for pagination (from previous response)"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> PaginatedSignals:
+    ) -> Response:
         """List signals with pagination and filters."""
-        from . import db as db_module
+        fingerprint = db_module.get_signals_fingerprint(settings.app.database_path)
+        if etag_matches(request, response, fingerprint):
+            return not_modified_response(response)
         
-        signals, total = db_module.list_signals(
-            settings.app.database_path,
-            page=page,
-            page_size=pageSize,
-            search=search,
-            status=status.value if status else None,
-            source=source,
-            sort=sort,
-            order=order,
-        )
+        try:
+            signals, total, next_cursor = db_module.list_signals(
+                settings.app.database_path,
+                page=page,
+                page_size=pageSize,
+                search=search,
+                status=status.value if status else None,
+                source=source,
+                sort=sort,
+                order=order,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        return PaginatedSignals(
-            items=[Signal(**s) for s in signals],
-            total=total,
-            page=page,
-            pageSize=pageSize,
+        # db._tweet_to_signal rows already have Signal's fields in Signal's order,
+        # so the whole page is encoded in one orjson call with no per-row models
+        return OrjsonResponse(
+            {
+                "items": signals,
+                "total": total,
+                "page": page,
+                "pageSize": pageSize,
+                "nextCursor": next_cursor,
+            },
+            headers={"ETag": response.headers["ETag"]},
         )
 
     @app.get(
@@ -1075,13 +1652,17 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         response_model=SignalsStats,
     )
     def get_signals_stats_endpoint(
+        request: Request,
+        response: Response,
         settings: Settings = Depends(get_settings_dep),
-    ) -> SignalsStats:
+    ) -> Response:
         """Get signal statistics."""
-        from . import db as db_module
+        fingerprint = db_module.get_signals_fingerprint(settings.app.database_path)
+        if etag_matches(request, response, fingerprint):
+            return not_modified_response(response)
         
         stats = db_module.get_signals_stats(settings.app.database_path)
-        return SignalsStats(**stats)
+        return PydanticResponse(SignalsStats(**stats), headers={"ETag": response.headers["ETag"]})
 
     @app.get(
         "/signals/{signal_id}",
@@ -1093,14 +1674,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def get_signal_endpoint(
         signal_id: str,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Signal:
+    ) -> PydanticResponse:
         """Get a specific signal by ID."""
-        from . import db as db_module
-        
-        signal = db_module.get_signal(settings.app.database_path, signal_id)
+        with _pooled_connection(state["connection_pool"]) as conn:
+            signal = db_module.get_signal(settings.app.database_path, signal_id, conn=conn)
         if not signal:
             raise HTTPException(status_code=404, detail="Signal not found")
-        return Signal(**signal)
+        return PydanticResponse(_construct_signal(signal))
 
     @app.post(
         "/signals",
@@ -1113,10 +1693,8 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def create_signal_endpoint(
         input_data: CreateSignalInput,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Signal:
+    ) -> PydanticResponse:
         """Create a new signal."""
-        from . import db as db_module
-        
         signal = db_module.create_signal(
             settings.app.database_path,
             name=input_data.name,
@@ -1124,7 +1702,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             status=input_data.status.value,
             tags=input_data.tags,
         )
-        return Signal(**signal)
+        return PydanticResponse(_construct_signal(signal), status_code=201)
 
     @app.patch(
         "/signals/{signal_id}",
@@ -1137,10 +1715,8 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         signal_id: str,
         input_data: UpdateSignalInput,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Signal:
+    ) -> PydanticResponse:
         """Update a signal."""
-        from . import db as db_module
-        
         updates = input_data.model_dump(exclude_unset=True)
         
         # Convert enum to value if present
@@ -1150,7 +1726,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         signal = db_module.update_signal(settings.app.database_path, signal_id, updates)
         if not signal:
             raise HTTPException(status_code=404, detail="Signal not found")
-        return Signal(**signal)
+        return PydanticResponse(_construct_signal(signal))
 
     @app.delete(
         "/signals/{signal_id}",
@@ -1165,8 +1741,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> None:
         """Delete a signal."""
-        from . import db as db_module
-        
         deleted = db_module.delete_signal(settings.app.database_path, signal_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Signal not found")
@@ -1185,10 +1759,8 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         status: Optional[SnapshotStatus] = Query(None, description="Filter by status"),
         signalId: Optional[str] = Query(None, description="Filter by signal ID"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> PaginatedSnapshots:
+    ) -> PydanticResponse:
         """List snapshots with pagination and filters."""
-        from . import db as db_module
-        
         snapshots, total = db_module.list_snapshots(
             settings.app.database_path,
             page=page,
@@ -1198,12 +1770,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             signal_id=signalId,
         )
         
-        return PaginatedSnapshots(
-            items=[Snapshot(**s) for s in snapshots],
+        page_model = PaginatedSnapshots.model_construct(
+            items=[_construct_snapshot(s) for s in snapshots],
             total=total,
             page=page,
             pageSize=pageSize,
         )
+        return PydanticResponse(page_model)
 
     @app.get(
         "/snapshots/{snapshot_id}",
@@ -1215,14 +1788,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def get_snapshot_endpoint(
         snapshot_id: str,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Snapshot:
+    ) -> PydanticResponse:
         """Get a specific snapshot by ID."""
-        from . import db as db_module
-        
-        snapshot = db_module.get_snapshot(settings.app.database_path, snapshot_id)
+        with _pooled_connection(state["connection_pool"]) as conn:
+            snapshot = db_module.get_snapshot(settings.app.database_path, snapshot_id, conn=conn)
         if not snapshot:
             raise HTTPException(status_code=404, detail="Snapshot not found")
-        return Snapshot(**snapshot)
+        return PydanticResponse(_construct_snapshot(snapshot))
 
     @app.post(
         "/snapshots",
@@ -1235,10 +1807,8 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def create_snapshot_endpoint(
         signalId: str = Body(..., embed=True),
         settings: Settings = Depends(get_settings_dep),
-    ) -> Snapshot:
+    ) -> PydanticResponse:
         """Create a new snapshot for a signal."""
-        from . import db as db_module
-        
         # Verify signal exists
         signal = db_module.get_signal(settings.app.database_path, signalId)
         if not signal:
@@ -1249,7 +1819,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             settings.app.database_path,
             signal_id=signalId,
         )
-        return Snapshot(**snapshot)
+        return PydanticResponse(_construct_snapshot(snapshot), status_code=201)
 
     # ========================================================================
     # Bulk Operations Endpoints
@@ -1267,38 +1837,33 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> BulkJobResponse:
         """Start a bulk signal status update job."""
-        from . import db as db_module
-        
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
         
         # Determine which signals to update
         target_ids = []
         if input_data.ids:
             target_ids = input_data.ids
         elif input_data.filters:
-            # Query signals matching filters
-            signals, _ = db_module.list_signals(
-                settings.app.database_path,
-                page=1,
-                page_size=10000,  # Large page to get all matching
-                search=input_data.filters.get("search"),
-                status=input_data.filters.get("status"),
-                source=input_data.filters.get("source"),
+            # Only the matching ids are needed; query them off the event loop
+            target_ids = await to_thread.run_sync(
+                partial(
+                    db_module.list_signal_ids,
+                    settings.app.database_path,
+                    search=input_data.filters.get("search"),
+                    status=input_data.filters.get("status"),
+                    source=input_data.filters.get("source"),
+                ),
             )
-            target_ids = [s["id"] for s in signals]
         
         # Create job
-        bulk_jobs[job_id] = {
-            "jobId": job_id,
-            "status": "running",
-            "total": len(target_ids),
-            "done": 0,
-            "fail": 0,
-            "operation": "set_status",
-            "target_ids": target_ids,
-            "target_status": input_data.status.value,
-            "db_path": settings.app.database_path,
-        }
+        _register_bulk_job(job_id, _new_bulk_job(
+            job_id,
+            total=len(target_ids),
+            operation="set_status",
+            target_ids=target_ids,
+            target_status=input_data.status.value,
+            db_path=settings.app.database_path,
+        ))
         
         # Start background task
         asyncio.create_task(_process_bulk_job(job_id))
@@ -1317,37 +1882,32 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> BulkJobResponse:
         """Start a bulk signal delete job."""
-        from . import db as db_module
-        
-        job_id = str(uuid.uuid4())
+        job_id = _new_job_id()
         
         # Determine which signals to delete
         target_ids = []
         if scope.ids:
             target_ids = scope.ids
         elif scope.filters:
-            # Query signals matching filters
-            signals, _ = db_module.list_signals(
-                settings.app.database_path,
-                page=1,
-                page_size=10000,  # Large page to get all matching
-                search=scope.filters.get("search"),
-                status=scope.filters.get("status"),
-                source=scope.filters.get("source"),
+            # Only the matching ids are needed; query them off the event loop
+            target_ids = await to_thread.run_sync(
+                partial(
+                    db_module.list_signal_ids,
+                    settings.app.database_path,
+                    search=scope.filters.get("search"),
+                    status=scope.filters.get("status"),
+                    source=scope.filters.get("source"),
+                ),
             )
-            target_ids = [s["id"] for s in signals]
         
         # Create job
-        bulk_jobs[job_id] = {
-            "jobId": job_id,
-            "status": "running",
-            "total": len(target_ids),
-            "done": 0,
-            "fail": 0,
-            "operation": "delete",
-            "target_ids": target_ids,
-            "db_path": settings.app.database_path,
-        }
+        _register_bulk_job(job_id, _new_bulk_job(
+            job_id,
+            total=len(target_ids),
+            operation="delete",
+            target_ids=target_ids,
+            db_path=settings.app.database_path,
+        ))
         
         # Start background task
         asyncio.create_task(_process_bulk_job(job_id))
@@ -1363,17 +1923,12 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     )
     def get_bulk_job(job_id: str) -> BulkJobStatus:
         """Get bulk job status."""
-        if job_id not in bulk_jobs:
+        job = _get_bulk_job(job_id)
+        if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        job = bulk_jobs[job_id]
-        return BulkJobStatus(
-            jobId=job["jobId"],
-            status=job["status"],
-            total=job["total"],
-            done=job["done"],
-            fail=job["fail"],
-        )
+        # Published snapshot: fields are consistent while the worker updates the job
+        return BulkJobStatus(**job["progress"])
 
     @app.post(
         "/bulk-jobs/{job_id}/cancel",
@@ -1383,14 +1938,15 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         status_code=204,
         response_model=None,
     )
-    def cancel_bulk_job(job_id: str) -> None:
+    async def cancel_bulk_job(job_id: str) -> None:
         """Cancel a bulk job."""
-        if job_id not in bulk_jobs:
+        job = _get_bulk_job(job_id)
+        if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
         
-        job = bulk_jobs[job_id]
         if job["status"] == "running":
             job["status"] = "cancelled"
+            _notify_bulk_job(job)
 
     @app.get(
         "/bulk-jobs/{job_id}/stream",
@@ -1400,38 +1956,33 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     )
     async def stream_bulk_job(job_id: str) -> StreamingResponse:
         """Stream bulk job updates via SSE."""
-        if job_id not in bulk_jobs:
+        job = _get_bulk_job(job_id)
+        if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
         
         async def event_generator():  # type: ignore[no-untyped-def]
             """Generate SSE events for job updates."""
             try:
-                job = bulk_jobs[job_id]
-                last_done = -1
+                last_seq = -1
                 
                 while True:
-                    # Check if job state changed
-                    current_done = job["done"]
-                    current_status = job["status"]
+                    if job["seq"] == last_seq:
+                        # Nothing new: sleep until the worker or a cancel notifies us
+                        event: asyncio.Event = job["progress_event"]
+                        try:
+                            await asyncio.wait_for(event.wait(), timeout=SSE_KEEPALIVE_SECONDS)
+                        except asyncio.TimeoutError:
+                            yield SSE_KEEPALIVE_FRAME
+                        continue
                     
-                    if current_done != last_done or current_status != "running":
-                        # Send update
-                        status_data = BulkJobStatus(
-                            jobId=job["jobId"],
-                            status=job["status"],
-                            total=job["total"],
-                            done=job["done"],
-                            fail=job["fail"],
-                        )
-                        yield f"data: {status_data.model_dump_json()}\n\n"
-                        last_done = current_done
+                    # Frame shared by all subscribers, encoded once per change
+                    last_seq = job["seq"]
+                    current_status = job["progress"]["status"]
+                    yield job["latest_frame"]
                     
                     # Exit if job finished
-                    if current_status in ["completed", "cancelled", "failed"]:
+                    if current_status in FINISHED_BULK_JOB_STATUSES:
                         break
-                    
-                    # Wait before next check
-                    await asyncio.sleep(0.5)
             except Exception as e:
                 log.error(f"Error in SSE stream: {e}")
         
@@ -1446,54 +1997,25 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
 
     # Phase One: Deep Tech Discovery endpoints
     
-    # Cached helper function for discoveries
-    @cached(prefix='discovery', ttl_key='discovery_ttl')
+    # Cached helper function for discoveries; caches the encoded JSON body
+    @cached_response(prefix='discovery', ttl_key='discovery_ttl')
     def _get_discoveries_cached(
         db_path: str,
         min_score: float,
         limit: int,
         hours: Optional[int]
-    ) -> List[Discovery]:
+    ) -> bytes:
         """Cached discovery results."""
-        from .db import list_top_discoveries
-        
-        raw_discoveries = list_top_discoveries(
+        raw_discoveries = db_module.list_top_discoveries(
             db_path,
             min_score=min_score,
             limit=limit,
             hours=hours
         )
         
-        # Convert raw dict results to Discovery models
-        discoveries = []
-        for d in raw_discoveries:
-            discovery = Discovery(
-                id=d["id"],
-                artifactId=d["artifact_id"],
-                artifactType=d["artifact_type"],
-                source=d["source"],
-                sourceId=d["source_id"],
-                title=d["title"],
-                text=d.get("text"),
-                url=d.get("url"),
-                publishedAt=d["published_at"],
-                novelty=d.get("novelty"),
-                emergence=d.get("emergence"),
-                obscurity=d.get("obscurity"),
-                discoveryScore=d.get("discovery_score"),
-                computedAt=d.get("computed_at"),
-                category=d.get("category"),
-                sentiment=d.get("sentiment"),
-                urgency=d.get("urgency"),
-                tags=d.get("tags"),
-                topics=d.get("topics"),
-                reasoning=d.get("reasoning"),
-                createdAt=d["created_at"],
-                updatedAt=d["updated_at"],
-            )
-            discoveries.append(discovery)
+        discoveries = [_construct_discovery(d) for d in raw_discoveries]
         
-        return discoveries
+        return _DISCOVERIES_ADAPTER.dump_json(discoveries)
     
     @app.get(
         "/discoveries",
@@ -1507,14 +2029,15 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
         hours: Optional[int] = Query(None, ge=1, le=168, description="Filter by hours since publication"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> List[Discovery]:
+    ) -> Response:
         """Get top discoveries by discovery score."""
-        return _get_discoveries_cached(
+        body = _get_discoveries_cached(
             settings.app.database_path,
             min_score,
             limit,
             hours
         )
+        return Response(content=body, media_type="application/json")
 
     @app.get(
         "/discoveries/paginated",
@@ -1523,91 +2046,42 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         description="Get top discoveries with cursor-based pagination for efficient large dataset traversal.",
         response_model=PaginatedDiscoveries,
     )
-    def get_discoveries_paginated(
+    async def get_discoveries_paginated(
         min_score: float = Query(80.0, ge=0.0, le=100.0, description="Minimum discovery score"),
         limit: int = Query(50, ge=1, le=200, description="Maximum number of results"),
         hours: Optional[int] = Query(None, ge=1, le=168, description="Filter by hours since publication"),
         cursor: Optional[str] = Query(None, description="Cursor for pagination (from previous response)"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> PaginatedDiscoveries:
+    ) -> Response:
         """Get top discoveries with cursor-based pagination."""
-        from .db import list_top_discoveries_paginated
-        
-        raw_discoveries, next_cursor, has_more = list_top_discoveries_paginated(
-            settings.app.database_path,
-            min_score=min_score,
-            limit=limit,
-            hours=hours,
-            cursor=cursor,
-        )
-        
-        # Convert raw dict results to Discovery models
-        discoveries = []
-        for d in raw_discoveries:
-            discovery = Discovery(
-                id=d["id"],
-                artifactId=d["artifact_id"],
-                artifactType=d["artifact_type"],
-                source=d["source"],
-                sourceId=d["source_id"],
-                title=d["title"],
-                text=d.get("text"),
-                url=d.get("url"),
-                publishedAt=d["published_at"],
-                novelty=d.get("novelty"),
-                emergence=d.get("emergence"),
-                obscurity=d.get("obscurity"),
-                discoveryScore=d.get("discovery_score"),
-                computedAt=d.get("computed_at"),
-                category=d.get("category"),
-                sentiment=d.get("sentiment"),
-                urgency=d.get("urgency"),
-                tags=d.get("tags"),
-                topics=d.get("topics"),
-                reasoning=d.get("reasoning"),
-                createdAt=d["created_at"],
-                updatedAt=d["updated_at"],
-            )
-            discoveries.append(discovery)
-        
-        return PaginatedDiscoveries(
-            items=discoveries,
-            nextCursor=next_cursor,
-            hasMore=has_more,
+        return await to_thread.run_sync(
+            partial(
+                _discoveries_page_response,
+                settings.app.database_path,
+                min_score=min_score,
+                limit=limit,
+                hours=hours,
+                cursor=cursor,
+            ),
         )
 
-    # Cached helper function for trending topics
-    @cached(prefix='topic', ttl_key='topic_ttl')
+    # Cached helper function for trending topics; caches the encoded JSON body
+    @cached_response(prefix='topic', ttl_key='topic_ttl')
     def _get_trending_topics_cached(
         db_path: str,
         window_days: int,
         limit: int
-    ) -> List[Topic]:
+    ) -> bytes:
         """Cached trending topics results."""
-        from .db import get_trending_topics
-        
-        raw_topics = get_trending_topics(
+        raw_topics = db_module.get_trending_topics(
             db_path,
             window_days=window_days,
             limit=limit
         )
         
-        # Convert raw dict results to Topic models
-        topics = []
-        for t in raw_topics:
-            topic = Topic(
-                id=t["id"],
-                name=t["name"],
-                taxonomyPath=t.get("taxonomy_path"),
-                description=t.get("description"),
-                artifactCount=t.get("artifact_count"),
-                avgDiscoveryScore=t.get("avg_discovery_score"),
-                createdAt=t.get("created_at"),
-                updatedAt=t.get("updated_at"),
-            )
-            topics.append(topic)
+        topics = [_construct_topic(t) for t in raw_topics]
         
-        return topics
+        return _TOPICS_ADAPTER.dump_json(topics)
 
     @app.get(
         "/topics/trending",
@@ -1620,13 +2094,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         window_days: int = Query(14, ge=1, le=365, alias="window", description="Time window in days"),
         limit: int = Query(20, ge=1, le=200, description="Maximum number of topics"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> List[Topic]:
+    ) -> Response:
         """Get trending research topics."""
-        return _get_trending_topics_cached(
+        body = _get_trending_topics_cached(
             settings.app.database_path,
             window_days,
             limit
         )
+        return Response(content=body, media_type="application/json")
 
     @app.get(
         "/topics/trending/paginated",
@@ -1635,41 +2110,21 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         description="Get trending research topics with cursor-based pagination.",
         response_model=PaginatedTopics,
     )
-    def get_trending_topics_paginated(
+    async def get_trending_topics_paginated(
         window_days: int = Query(14, ge=1, le=365, alias="window", description="Time window in days"),
         limit: int = Query(20, ge=1, le=200, description="Maximum number of topics"),
         cursor: Optional[str] = Query(None, description="Cursor for pagination (from previous response)"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> PaginatedTopics:
+    ) -> Response:
         """Get trending research topics with cursor-based pagination."""
-        from .db import get_trending_topics_paginated
-        
-        raw_topics, next_cursor, has_more = get_trending_topics_paginated(
-            settings.app.database_path,
-            window_days=window_days,
-            limit=limit,
-            cursor=cursor,
-        )
-        
-        # Convert raw dict results to Topic models
-        topics = []
-        for t in raw_topics:
-            topic = Topic(
-                id=t["id"],
-                name=t["name"],
-                taxonomyPath=t.get("taxonomy_path"),
-                description=t.get("description"),
-                artifactCount=t.get("artifact_count"),
-                avgDiscoveryScore=t.get("avg_discovery_score"),
-                createdAt=t.get("created_at"),
-                updatedAt=t.get("updated_at"),
-            )
-            topics.append(topic)
-        
-        return PaginatedTopics(
-            items=topics,
-            nextCursor=next_cursor,
-            hasMore=has_more,
+        return await to_thread.run_sync(
+            partial(
+                _topics_page_response,
+                settings.app.database_path,
+                window_days=window_days,
+                limit=limit,
+                cursor=cursor,
+            ),
         )
 
     # Cached helper function for entity details
@@ -1750,16 +2205,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         )
 
 
-    @cached(prefix='entity', ttl_key='entity_ttl')
-    def _get_entity_cached(db_path: str, entity_id: int) -> Optional[Entity]:
-        """Cached entity details results."""
-        from .db import get_entity_with_accounts
-        
-        raw_entity = get_entity_with_accounts(db_path, entity_id)
+    @cached_response(prefix='entity', ttl_key='entity_ttl')
+    def _get_entity_cached(db_path: str, entity_id: int) -> Optional[bytes]:
+        """Cached entity details results (encoded JSON body)."""
+        raw_entity = db_module.get_entity_with_accounts(db_path, entity_id)
         if not raw_entity:
             return None
         
-        return _build_entity_model(raw_entity)
+        return _build_entity_model(raw_entity).model_dump_json().encode()
 
     @app.get(
         "/entities",
@@ -1778,9 +2231,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> PaginatedEntities:
         """List entities with filtering and pagination."""
-        from .db import list_entities
-        
-        raw_entities, total = list_entities(
+        raw_entities, total = db_module.list_entities(
             settings.app.database_path,
             entity_type=entity_type,
             search=search,
@@ -1809,13 +2260,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def get_entity(
         entity_id: int,
         settings: Settings = Depends(get_settings_dep),
-    ) -> Entity:
+    ) -> Response:
         """Get entity details with accounts and artifacts."""
-        entity = _get_entity_cached(settings.app.database_path, entity_id)
-        if not entity:
+        body = _get_entity_cached(settings.app.database_path, entity_id)
+        if body is None:
             raise HTTPException(status_code=404, detail="Entity not found")
         
-        return entity
+        return Response(content=body, media_type="application/json")
 
     @app.get(
         "/entities/search",
@@ -1831,9 +2282,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> List[EntitySearchResult]:
         """Search entities with relevance scoring."""
-        from .db import search_entities
-        
-        raw_results = search_entities(
+        raw_results = db_module.search_entities(
             settings.app.database_path,
             query=q,
             entity_type=entity_type,
@@ -1864,9 +2313,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> EntityStats:
         """Get entity statistics."""
-        from .db import get_entity_stats
-        
-        stats = get_entity_stats(settings.app.database_path, entity_id, days)
+        stats = db_module.get_entity_stats(settings.app.database_path, entity_id, days)
         if not stats:
             raise HTTPException(status_code=404, detail="Entity not found or no stats available")
         
@@ -1885,16 +2332,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         threshold: float = Query(0.7, ge=0.0, le=1.0, description="Minimum similarity score"),
         settings: Settings = Depends(get_settings_dep),
     ) -> List[EntityCandidate]:
-        from .db import get_entity_with_accounts, list_all_entities
-        from .identity_resolution import find_candidate_matches_detailed
 
         db_path = settings.app.database_path
-        entity = get_entity_with_accounts(db_path, entity_id)
+        entity = db_module.get_entity_with_accounts(db_path, entity_id)
         if not entity:
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        all_entities = [e for e in list_all_entities(db_path) if not e.get("merged_into_id")]
-        matches = find_candidate_matches_detailed(entity, all_entities, threshold=threshold)
+        all_entities = [e for e in db_module.list_all_entities(db_path) if not e.get("merged_into_id")]
+        matches = identity_resolution.find_candidate_matches_detailed(entity, all_entities, threshold=threshold)
 
         candidates: List[EntityCandidate] = []
         for candidate, similarity, components in matches[:limit]:
@@ -1920,26 +2365,24 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
         _: None = Depends(require_api_key),
     ) -> MergeEntityResponse:
-        from .db import get_entity_with_accounts, record_entity_merge_history
-        from .identity_resolution import merge_entities
 
         db_path = settings.app.database_path
         if entity_id == payload.candidateEntityId:
             raise HTTPException(status_code=400, detail="Cannot merge an entity with itself")
 
-        primary = get_entity_with_accounts(db_path, entity_id)
+        primary = db_module.get_entity_with_accounts(db_path, entity_id)
         if not primary:
             raise HTTPException(status_code=404, detail="Primary entity not found")
 
-        candidate = get_entity_with_accounts(db_path, payload.candidateEntityId)
+        candidate = db_module.get_entity_with_accounts(db_path, payload.candidateEntityId)
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate entity not found")
 
-        merged = merge_entities(db_path, entity_id, payload.candidateEntityId)
+        merged = identity_resolution.merge_entities(db_path, entity_id, payload.candidateEntityId)
         if not merged:
             raise HTTPException(status_code=409, detail="Unable to merge entities")
 
-        record_entity_merge_history(
+        db_module.record_entity_merge_history(
             db_path,
             primary_entity_id=entity_id,
             candidate_entity_id=payload.candidateEntityId,
@@ -1967,22 +2410,17 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
         _: None = Depends(require_api_key),
     ) -> EntityMergeHistoryItem:
-        from .db import (
-            get_entity_with_accounts,
-            list_entity_merge_history,
-            record_entity_merge_history,
-        )
 
         db_path = settings.app.database_path
-        entity = get_entity_with_accounts(db_path, entity_id)
+        entity = db_module.get_entity_with_accounts(db_path, entity_id)
         if not entity:
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        candidate = get_entity_with_accounts(db_path, payload.candidateEntityId)
+        candidate = db_module.get_entity_with_accounts(db_path, payload.candidateEntityId)
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate entity not found")
 
-        record_entity_merge_history(
+        db_module.record_entity_merge_history(
             db_path,
             primary_entity_id=entity_id,
             candidate_entity_id=payload.candidateEntityId,
@@ -1992,7 +2430,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             notes=payload.notes,
         )
 
-        history_rows = list_entity_merge_history(db_path, entity_id=entity_id, limit=1)
+        history_rows = db_module.list_entity_merge_history(db_path, entity_id=entity_id, limit=1)
         if not history_rows:
             raise HTTPException(status_code=500, detail="Failed to persist decision")
 
@@ -2009,14 +2447,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         limit: int = Query(50, ge=1, le=200, description="Maximum number of history entries"),
         settings: Settings = Depends(get_settings_dep),
     ) -> List[EntityMergeHistoryItem]:
-        from .db import get_entity_with_accounts, list_entity_merge_history
 
         db_path = settings.app.database_path
-        entity = get_entity_with_accounts(db_path, entity_id)
+        entity = db_module.get_entity_with_accounts(db_path, entity_id)
         if not entity:
             raise HTTPException(status_code=404, detail="Entity not found")
 
-        history_rows = list_entity_merge_history(db_path, entity_id=entity_id, limit=limit)
+        history_rows = db_module.list_entity_merge_history(db_path, entity_id=entity_id, limit=limit)
         return [_serialize_history_entry(row) for row in history_rows]
 
     @app.get(
@@ -2035,9 +2472,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> PaginatedArtifacts:
         """Get artifacts for an entity."""
-        from .db import get_entity_artifacts
-        
-        raw_artifacts, total = get_entity_artifacts(
+        raw_artifacts, total = db_module.get_entity_artifacts(
             settings.app.database_path,
             entity_id,
             source=source,
@@ -2089,25 +2524,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> List[TopicTimeline]:
         """Get timeline data for a specific topic."""
-        from .db import get_topic_timeline
-        
-        raw_timeline = get_topic_timeline(
+        raw_timeline = db_module.get_topic_timeline(
             settings.app.database_path,
             topic_name=topic_name,
             days=days
         )
         
-        # Convert raw dict results to TopicTimeline models
-        timeline = []
-        for t in raw_timeline:
-            timeline_point = TopicTimeline(
-                date=t["date"],
-                artifactCount=t["artifact_count"],
-                avgDiscoveryScore=t.get("avg_discovery_score"),
-            )
-            timeline.append(timeline_point)
-        
-        return timeline
+        # Trusted aggregate rows: map column names without revalidating
+        return [_construct_timeline_point(t) for t in raw_timeline]
 
     @app.get(
         "/topics/{topic_id}/evolution",
@@ -2123,9 +2547,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> List[TopicEvolutionEvent]:
         """Get evolution events for a topic."""
-        from .db import get_topic_evolution_events
-        
-        events = get_topic_evolution_events(
+        events = db_module.get_topic_evolution_events(
             settings.app.database_path,
             topic_id=topic_id,
             event_type=event_type,
@@ -2161,24 +2583,20 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> TopicStats:
         """Get comprehensive statistics for a topic."""
-        from .topic_evolution import compute_topic_emergence, predict_topic_growth, find_related_topics
-        from .db import get_topic_by_id, get_topic_artifact_history
-        import numpy as np
-        
         # Get basic topic info
-        topic = get_topic_by_id(settings.app.database_path, topic_id)
+        topic = db_module.get_topic_by_id(settings.app.database_path, topic_id)
         if not topic:
             raise HTTPException(status_code=404, detail="Topic not found")
         
         # Get timeline data
-        timeline = get_topic_timeline(
+        timeline = db_module.get_topic_timeline(
             settings.app.database_path,
             topic_name=topic["name"],
             days=window_days
         )
         
         # Compute emergence metrics
-        emergence_metrics = compute_topic_emergence(topic_id, settings.app.database_path, window_days)
+        emergence_metrics = topic_evolution.compute_topic_emergence(topic_id, settings.app.database_path, window_days)
         emergence_model = TopicEmergenceMetrics(
             growthRate=emergence_metrics["growth_rate"],
             acceleration=emergence_metrics["acceleration"],
@@ -2187,7 +2605,9 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         )
         
         # Predict growth
-        growth_prediction = predict_topic_growth(topic_id, settings.app.database_path, days_to_predict=14)
+        growth_prediction = topic_evolution.predict_topic_growth(
+            topic_id, settings.app.database_path, days_to_predict=14
+        )
         growth_model = TopicGrowthPrediction(
             dailyGrowthRate=growth_prediction["daily_growth_rate"],
             predictedCounts=growth_prediction["predicted_counts"],
@@ -2197,7 +2617,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         )
         
         # Get related topics
-        related = find_related_topics(topic_id, settings.app.database_path, limit=20)
+        related = topic_evolution.find_related_topics(topic_id, settings.app.database_path, limit=20)
         related_topics = []
         for rel in related:
             related_topics.append(RelatedTopic(
@@ -2208,21 +2628,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             ))
         
         # Get evolution events
-        from .db import get_topic_evolution_events
-        recent_events = get_topic_evolution_events(
+        recent_events = db_module.get_topic_evolution_events(
             settings.app.database_path,
             topic_id=topic_id,
             limit=10
         )
         
         # Convert timeline to TopicTimeline models
-        timeline_models = []
-        for t in timeline:
-            timeline_models.append(TopicTimeline(
-                date=t["date"],
-                artifactCount=t["artifact_count"],
-                avgDiscoveryScore=t.get("avg_discovery_score"),
-            ))
+        timeline_models = [_construct_timeline_point(t) for t in timeline]
         
         # Convert evolution events
         evolution_events = []
@@ -2239,7 +2652,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             ))
         
         # Get artifact statistics
-        history = get_topic_artifact_history(topic_id, settings.app.database_path, window_days)
+        history = db_module.get_topic_artifact_history(topic_id, settings.app.database_path, window_days)
         total_artifacts = sum(h["artifact_count"] for h in history)
         avg_score = float(np.mean([h.get("avg_discovery_score", 0) or 0 for h in history])) if history else 0.0
         
@@ -2269,9 +2682,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> List[TopicMergeCandidate]:
         """Get detected topic merge candidates."""
-        from .topic_evolution import detect_topic_merges
-        
-        merge_candidates = detect_topic_merges(
+        merge_candidates = topic_evolution.detect_topic_merges(
             settings.app.database_path,
             window_days=window_days,
             similarity_threshold=similarity_threshold
@@ -2281,12 +2692,12 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         candidates = []
         for candidate in merge_candidates:
             candidates.append(TopicMergeCandidate(
-                primaryTopic=Topic(
+                primaryTopic=Topic.model_construct(
                     id=candidate["primary_topic"]["id"],
                     name=candidate["primary_topic"]["name"],
                     taxonomyPath=candidate["primary_topic"].get("taxonomy_path"),
                 ),
-                secondaryTopic=Topic(
+                secondaryTopic=Topic.model_construct(
                     id=candidate["secondary_topic"]["id"],
                     name=candidate["secondary_topic"]["name"],
                     taxonomyPath=candidate["secondary_topic"].get("taxonomy_path"),
@@ -2313,9 +2724,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> List[TopicSplitDetection]:
         """Get detected topic split candidates."""
-        from .topic_evolution import detect_topic_splits
-        
-        split_candidates = detect_topic_splits(
+        split_candidates = topic_evolution.detect_topic_splits(
             settings.app.database_path,
             window_days=window_days,
             diversity_threshold=diversity_threshold
@@ -2325,7 +2734,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         candidates = []
         for candidate in split_candidates:
             candidates.append(TopicSplitDetection(
-                primaryTopic=Topic(
+                primaryTopic=Topic.model_construct(
                     id=candidate["primary_topic"]["id"],
                     name=candidate["primary_topic"]["name"],
                     taxonomyPath=candidate["primary_topic"].get("taxonomy_path"),
@@ -2353,9 +2762,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get relationships for an artifact."""
-        from .db import get_artifact_relationships as get_relationships
-        
-        relationships = get_relationships(
+        relationships = db_module.get_artifact_relationships(
             settings.app.database_path,
             artifact_id=artifact_id,
             direction=direction,
@@ -2384,12 +2791,10 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get citation graph for an artifact."""
-        from .relationship_detection import get_citation_graph
-        
         # Clamp depth to reasonable range
         depth = max(1, min(3, depth))
         
-        graph = get_citation_graph(
+        graph = relationship_detection.get_citation_graph(
             db_path=settings.app.database_path,
             artifact_id=artifact_id,
             depth=depth,
@@ -2409,9 +2814,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get relationship statistics."""
-        from .db import get_relationship_stats
-        
-        return get_relationship_stats(settings.app.database_path)
+        return db_module.get_relationship_stats(settings.app.database_path)
     
     @app.post(
         "/relationships/detect",
@@ -2428,9 +2831,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         _: None = Depends(require_api_key),
     ) -> Dict[str, Any]:
         """Run relationship detection."""
-        from .relationship_detection import run_relationship_detection
-        
-        stats = run_relationship_detection(
+        stats = relationship_detection.run_relationship_detection(
             db_path=settings.app.database_path,
             artifact_id=artifact_id,
             enable_semantic=enable_semantic,
@@ -2439,8 +2840,10 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         
         return stats
 
+    refresh_lock = asyncio.Lock()
+
     @app.post(
-        "/refresh",
+        "/discoveries/refresh",
         tags=["discovery"],
         summary="Refresh discovery pipeline",
         description="Run fetch, analyze, and score for discoveries.",
@@ -2452,28 +2855,32 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         _: None = Depends(require_api_key),
     ) -> Dict[str, Any]:
         """Run discovery pipeline refresh."""
-        from .discovery_scoring import run_discovery_scoring
-        from .pipeline import analyze_unanalyzed, fetch_once
+        # One refresh at a time; the stages share the same rows
+        if refresh_lock.locked():
+            raise HTTPException(status_code=409, detail="Refresh already in progress")
         
         stats = {}
         
-        if refresh_type in ["all", "discovery"]:
-            # Fetch from all enabled sources
-            f_stats = fetch_once(settings)
-            stats["fetch"] = f_stats
-            
-            # Analyze unanalyzed artifacts
-            # Note: This would need to be updated to handle artifacts, not just tweets
-            a_count = analyze_unanalyzed(settings, limit=300)
-            stats["analyze"] = {"count": a_count}
-            
-            # Score discoveries
-            s_count = await run_discovery_scoring(
-                settings.app.database_path,
-                settings.model_dump(),
-                limit=1000
-            )
-            stats["score"] = {"count": s_count}
+        async with refresh_lock:
+            if refresh_type in ["all", "discovery"]:
+                # Fetch from all enabled sources (blocking I/O, kept off the event loop)
+                f_stats = await to_thread.run_sync(pipeline.fetch_once, settings)
+                stats["fetch"] = f_stats
+                
+                # Analyze unanalyzed artifacts; depends on the fetched rows
+                # Note: This would need to be updated to handle artifacts, not just tweets
+                a_count = await to_thread.run_sync(
+                    partial(pipeline.analyze_unanalyzed, settings, limit=300)
+                )
+                stats["analyze"] = {"count": a_count}
+                
+                # Score discoveries
+                s_count = await discovery_scoring.run_discovery_scoring(
+                    settings.app.database_path,
+                    settings.model_dump(),
+                    limit=1000
+                )
+                stats["score"] = {"count": s_count}
         
         return {
             "status": "success",
@@ -2492,8 +2899,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get source distribution analytics."""
-        from . import analytics
-        
         return analytics.get_source_distribution(
             settings.app.database_path,
             hours=hours
@@ -2511,8 +2916,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get temporal trend analytics."""
-        from . import analytics
-        
         return analytics.get_temporal_trends(
             settings.app.database_path,
             days=days
@@ -2530,8 +2933,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get cross-source correlation analytics."""
-        from . import analytics
-        
         return analytics.get_cross_source_correlations(
             settings.app.database_path,
             hours=hours
@@ -2548,8 +2949,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get score distribution analytics."""
-        from . import analytics
-        
         return analytics.get_score_distributions(settings.app.database_path)
 
     @app.get(
@@ -2563,8 +2962,6 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get system health analytics."""
-        from . import analytics
-        
         return analytics.get_system_health(
             settings.app.database_path,
             settings
@@ -2577,34 +2974,27 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         description="Get all dashboard analytics data in a single call.",
         response_model=Dict[str, Any],
     )
-    def get_dashboard_analytics(
+    async def get_dashboard_analytics(
         days: int = Query(30, description="Number of days for trend analysis"),
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get comprehensive dashboard analytics."""
-        from . import analytics
-        
-        return {
-            "source_distribution": analytics.get_source_distribution(
-                settings.app.database_path,
-                hours=days*24
-            ),
-            "temporal_trends": analytics.get_temporal_trends(
-                settings.app.database_path,
-                days=days
-            ),
-            "cross_source_correlations": analytics.get_cross_source_correlations(
-                settings.app.database_path,
-                hours=days*24
-            ),
-            "score_distributions": analytics.get_score_distributions(
-                settings.app.database_path
+        db_path = settings.app.database_path
+        # Independent read-only queries, each on its own connection: run them
+        # concurrently so latency is the slowest query rather than the sum
+        sections = {
+            "source_distribution": partial(analytics.get_source_distribution, db_path, hours=days*24),
+            "temporal_trends": partial(analytics.get_temporal_trends, db_path, days=days),
+            "cross_source_correlations": partial(
+                analytics.get_cross_source_correlations, db_path, hours=days*24
             ),
-            "system_health": analytics.get_system_health(
-                settings.app.database_path,
-                settings
-            )
+            "score_distributions": partial(analytics.get_score_distributions, db_path),
+            "system_health": partial(analytics.get_system_health, db_path, settings),
         }
+        results = await asyncio.gather(
+            *(to_thread.run_sync(section) for section in sections.values())
+        )
+        return dict(zip(sections, results))
     
     # Experiment & Backtesting Endpoints
     
@@ -2621,9 +3011,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         _: None = Depends(require_api_key),
     ) -> Dict[str, Any]:
         """Create a new experiment."""
-        from .experiment import ExperimentConfig, create_experiment
-        
-        config = ExperimentConfig(
+        config = experiment_module.ExperimentConfig(
             scoring_weights=request.scoring_weights,
             min_score_threshold=request.min_score_threshold,
             lookback_days=request.lookback_days,
@@ -2631,7 +3019,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         )
         
         try:
-            experiment_id = create_experiment(
+            experiment_id = experiment_module.create_experiment(
                 settings.app.database_path,
                 request.name,
                 config,
@@ -2669,14 +3057,37 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """List all experiments."""
-        from .experiment import list_experiments
-        
-        experiments = list_experiments(settings.app.database_path, status)
+        experiments = experiment_module.list_experiments(settings.app.database_path, status)
         return {
             "experiments": experiments,
             "count": len(experiments),
         }
     
+    @app.get(
+        "/experiments/compare",
+        tags=["experiments"],
+        summary="Compare experiments",
+        description="Compare results of two experiments.",
+        response_model=Dict[str, Any],
+    )
+    def compare_experiments_endpoint(
+        experiment_a: int = Query(..., description="First experiment ID"),
+        experiment_b: int = Query(..., description="Second experiment ID"),
+        settings: Settings = Depends(get_settings_dep),
+    ) -> Dict[str, Any]:
+        """Compare two experiments."""
+        # Registered before /experiments/{experiment_id} so "compare" isn't parsed as an id
+        comparison = experiment_module.compare_experiments(
+            settings.app.database_path,
+            experiment_a,
+            experiment_b,
+        )
+        
+        if "error" in comparison:
+            raise HTTPException(status_code=400, detail=comparison.get("error", "Comparison failed"))
+        
+        return comparison
+    
     @app.get(
         "/experiments/{experiment_id}",
         tags=["experiments"],
@@ -2689,9 +3100,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get experiment details."""
-        from .experiment import get_experiment
-        
-        experiment = get_experiment(settings.app.database_path, experiment_id)
+        experiment = experiment_module.get_experiment(settings.app.database_path, experiment_id)
         if not experiment:
             raise HTTPException(status_code=404, detail="Experiment not found")
         return experiment
@@ -2708,41 +3117,13 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         settings: Settings = Depends(get_settings_dep),
     ) -> Dict[str, Any]:
         """Get experiment runs."""
-        from .experiment import get_experiment_runs
-        
-        runs = get_experiment_runs(settings.app.database_path, experiment_id)
+        runs = experiment_module.get_experiment_runs(settings.app.database_path, experiment_id)
         return {
             "experimentId": experiment_id,
             "runs": runs,
             "count": len(runs),
         }
     
-    @app.get(
-        "/experiments/compare",
-        tags=["experiments"],
-        summary="Compare experiments",
-        description="Compare results of two experiments.",
-        response_model=Dict[str, Any],
-    )
-    def compare_experiments_endpoint(
-        experiment_a: int = Query(..., description="First experiment ID"),
-        experiment_b: int = Query(..., description="Second experiment ID"),
-        settings: Settings = Depends(get_settings_dep),
-    ) -> Dict[str, Any]:
-        """Compare two experiments."""
-        from .experiment import compare_experiments
-        
-        comparison = compare_experiments(
-            settings.app.database_path,
-            experiment_a,
-            experiment_b,
-        )
-        
-        if "error" in comparison:
-            raise HTTPException(status_code=400, detail=comparison.get("error", "Comparison failed"))
-        
-        return comparison
-    
     @app.get(
         "/labels",
         tags=["experiments"],
@@ -2753,15 +3134,14 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
     def get_labels_endpoint(
         label: Optional[str] = Query(None, description="Filter by label type"),
         settings: Settings = Depends(get_settings_dep),
-    ) -> Dict[str, Any]:
+    ) -> StreamingResponse:
         """Get labeled artifacts."""
-        from .experiment import get_labeled_artifacts
-        
-        labels = get_labeled_artifacts(settings.app.database_path, label)
-        return {
-            "labels": labels,
-            "count": len(labels),
-        }
+        # Unbounded result set: stream it instead of encoding one large body
+        labels = experiment_module.get_labeled_artifacts(settings.app.database_path, label)
+        return StreamingResponse(
+            _stream_json_list("labels", labels, count=len(labels)),
+            media_type="application/json",
+        )
     
     @app.post(
         "/labels",
@@ -2780,12 +3160,10 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         _: None = Depends(require_api_key),
     ) -> Dict[str, Any]:
         """Add or update artifact label."""
-        from .experiment import add_discovery_label
-        
         if not 0.0 <= confidence <= 1.0:
             raise HTTPException(status_code=400, detail="Confidence must be between 0.0 and 1.0")
         
-        label_id = add_discovery_label(
+        label_id = experiment_module.add_discovery_label(
             settings.app.database_path,
             artifact_id,
             label,
@@ -2801,6 +3179,47 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             "label": label,
         }
 
+    @app.post(
+        "/labels/bulk",
+        tags=["experiments"],
+        summary="Add labels in bulk",
+        description=f"Add or update up to {MAX_BULK_LABELS} ground truth labels in one transaction.",
+        response_model=Dict[str, Any],
+    )
+    def add_labels_bulk_endpoint(
+        labels: List[LabelRequest] = Body(...),
+        settings: Settings = Depends(get_settings_dep),
+        _: None = Depends(require_api_key),
+    ) -> Dict[str, Any]:
+        """Add or update many artifact labels."""
+        
+        if not labels:
+            raise HTTPException(status_code=400, detail="At least one label is required")
+        if len(labels) > MAX_BULK_LABELS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_BULK_LABELS} labels per request",
+            )
+        
+        rows = []
+        for index, item in enumerate(labels):
+            if not 0.0 <= item.confidence <= 1.0:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Label {index}: confidence must be between 0.0 and 1.0",
+                )
+            rows.append({
+                "artifact_id": item.artifactId,
+                "label": item.label,
+                "confidence": item.confidence,
+                "annotator": item.annotator,
+                "notes": item.notes,
+            })
+        
+        written = experiment_module.add_discovery_labels_bulk(settings.app.database_path, rows)
+        
+        return {"status": "success", "count": written}
+
     # ============================================================================
     # Cache Management Endpoints
     # ============================================================================
@@ -2841,7 +3260,7 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
         # Log the error (Sentry will automatically capture it)
         log.error("Unhandled exception: %s", exc, exc_info=True)
         
-        return JSONResponse(
+        return OrjsonResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
@@ -2851,10 +3270,113 @@ def create_app(settings_path: Optional[str] = None) -> FastAPI:
             }
         )
 
+    # Serve /openapi.json from bytes built once at startup, pre-gzipped for
+    # clients that accept it, instead of rebuilding and re-encoding per hit
+    if app.openapi_url is not None:
+        openapi_url = app.openapi_url
+        default_openapi_route = next(
+            route for route in app.router.routes if isinstance(route, Route) and route.path == openapi_url
+        )
+        app.router.routes.remove(default_openapi_route)
+        default_openapi: Callable[[Request], Awaitable[Response]] = default_openapi_route.endpoint
+
+        def _openapi_bodies() -> Tuple[bytes, bytes]:
+            bodies = state.get("openapi_bodies")
+            if bodies is None:
+                body = orjson.dumps(app.openapi())
+                bodies = (body, gzip.compress(body, compresslevel=6))
+                state["openapi_bodies"] = bodies
+            return bodies
+
+        @app.get(openapi_url, include_in_schema=False)
+        async def openapi_json(request: Request) -> Response:
+            if request.scope.get("root_path", "").rstrip("/"):
+                # The servers list depends on the mount point; let FastAPI build it
+                return await default_openapi(request)
+            body, gzipped = _openapi_bodies()
+            if "gzip" in accepted_encodings(request.headers.get("accept-encoding", "")):
+                return Response(
+                    content=gzipped,
+                    media_type="application/json",
+                    headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+                )
+            return Response(content=body, media_type="application/json")
+
+        @app.on_event("startup")
+        async def build_openapi_schema() -> None:
+            """Generate the OpenAPI schema before the first /openapi.json or /docs hit."""
+            _openapi_bodies()
+
+    @app.on_event("startup")
+    async def configure_threadpool() -> None:
+        """Size the threadpool that runs sync endpoints to the DB concurrency."""
+        pool_config = settings.app.connection_pool
+        thread_limit = pool_config.thread_limit or max(
+            40, 2 * (pool_config.pool_size + pool_config.max_overflow)
+        )
+        to_thread.current_default_thread_limiter().total_tokens = thread_limit
+        log.info("Threadpool limit for sync endpoints set to %d", thread_limit)
+
+    async def _metrics_refresher() -> None:
+        """Keep ``state["metrics_cache"]`` warm so /metrics never scans the DB inline."""
+        while True:
+            try:
+                db_path = settings.app.database_path
+                collected = await to_thread.run_sync(
+                    _collect_metrics, db_path, state["connection_pool"], state["page_size"]
+                )
+                state["metrics_cache"] = (time.monotonic(), collected)
+            except Exception as e:
+                log.error(f"Metrics refresh failed: {e}")
+            await asyncio.sleep(METRICS_CACHE_TTL_SECONDS)
+
+    @app.on_event("startup")
+    async def start_metrics_refresher() -> None:
+        """Start the background /metrics aggregation loop."""
+        state["metrics_task"] = asyncio.create_task(_metrics_refresher())
+
+    async def _rate_limit_sweeper() -> None:
+        """Drop expired rate limit buckets in one pass instead of on request paths."""
+        while True:
+            await asyncio.sleep(RATE_LIMIT_SWEEP_SECONDS)
+            try:
+                get_rate_limiter().sweep()
+            except Exception as e:
+                log.error(f"Rate limit sweep failed: {e}")
+
+    @app.on_event("startup")
+    async def start_rate_limit_sweeper() -> None:
+        """Start the background rate limit bucket sweeper."""
+        # "per-worker" when running on the in-memory fallback (no shared Redis state)
+        state["rate_limiter_scope"] = get_rate_limiter().scope
+        state["rate_limit_task"] = asyncio.create_task(_rate_limit_sweeper())
+
+    async def _bulk_job_sweeper() -> None:
+        """Drop finished bulk jobs once their TTL has elapsed."""
+        while True:
+            await asyncio.sleep(BULK_JOB_SWEEP_SECONDS)
+            try:
+                _sweep_bulk_jobs()
+            except Exception as e:
+                log.error(f"Bulk job sweep failed: {e}")
+
+    @app.on_event("startup")
+    async def start_bulk_job_sweeper() -> None:
+        """Start the background sweeper for expired bulk jobs."""
+        state["bulk_job_task"] = asyncio.create_task(_bulk_job_sweeper())
+
     @app.on_event("shutdown")
-    def shutdown_event() -> None:
+    async def shutdown_event() -> None:
         """Cleanup resources on application shutdown."""
         log.info("Application shutdown initiated")
+
+        for task_key in ("metrics_task", "rate_limit_task", "bulk_job_task"):
+            task = state.pop(task_key, None)
+            if task:
+                task.cancel()
+
+        # Don't block shutdown on a pipeline run; queued runs are dropped
+        state["pipeline_executor"].shutdown(wait=False, cancel_futures=True)
         
         # Close connection pool if enabled
         pool = state.get("connection_pool")
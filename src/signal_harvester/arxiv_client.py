@@ -2,16 +2,260 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+import time
+import weakref
 import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
-from typing import Any
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncGenerator, AsyncIterator, Callable
 
 import httpx
+import orjson
 
+from . import __version__
 from .logger import get_logger
 
 log = get_logger(__name__)
 
+# Optional libxml2-backed parser (pip install signal-harvester[xml])
+try:
+    from lxml import etree
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+    etree = None
+
+# Optional HTTP/2 support (pip install signal-harvester[http2]); httpx
+# imports h2 itself, so only probe for it
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Parse failures raised by whichever parser is in use
+_XML_ERRORS: tuple[type[Exception], ...] = (
+    (ET.ParseError, etree.XMLSyntaxError) if LXML_AVAILABLE else (ET.ParseError,)
+)
+
+# Clark-notation tags for the Atom and arXiv namespaces, so lookups skip
+# resolving "prefix:name" against a namespace map for every entry
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+_ENTRY_TAG = _ATOM + "entry"
+_TITLE = _ATOM + "title"
+_SUMMARY = _ATOM + "summary"
+_PUBLISHED = _ATOM + "published"
+_UPDATED = _ATOM + "updated"
+_ID = _ATOM + "id"
+_AUTHOR = _ATOM + "author"
+_NAME = _ATOM + "name"
+_CATEGORY = _ATOM + "category"
+_PRIMARY_CATEGORY = _ARXIV + "primary_category"
+
+# lxml parse options; the feed never needs entity resolution or xml:id lookups
+_LXML_OPTIONS: dict[str, Any] = {
+    "remove_blank_text": True,
+    "resolve_entities": False,
+    "collect_ids": False,
+    "huge_tree": False,
+}
+
+
+# Bytes read from the HTTP body per parser feed
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# Keys of each paper dict, in PaperBatch column order
+PAPER_FIELDS = ("source_id", "title", "text", "published_at", "updated_at", "authors", "categories", "url")
+
+
+@dataclass
+class PaperBatch:
+    """Parsed papers stored column-wise, one list per field.
+
+    For consumers that scan one field across many papers, such as a date
+    filter over ``published_at``, without a dict per paper. ``as_records``
+    gives the usual list of paper dicts.
+    """
+
+    source_id: list[str] = field(default_factory=list)
+    title: list[str] = field(default_factory=list)
+    text: list[str] = field(default_factory=list)
+    published_at: list[str] = field(default_factory=list)
+    updated_at: list[str] = field(default_factory=list)
+    authors: list[list[str]] = field(default_factory=list)
+    categories: list[list[str]] = field(default_factory=list)
+    url: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.source_id)
+
+    def columns(self) -> list[list[Any]]:
+        """Return the column lists in ``PAPER_FIELDS`` order."""
+        return [getattr(self, name) for name in PAPER_FIELDS]
+
+    def published_after(self, cutoff: str) -> PaperBatch:
+        """Return the papers published after the ISO-8601 UTC ``cutoff``."""
+        keep = [i for i, published in enumerate(self.published_at) if published > cutoff]
+        return PaperBatch(*([column[i] for i in keep] for column in self.columns()))
+
+    def as_records(self) -> list[dict[str, Any]]:
+        """Return one paper dict per row."""
+        return [dict(zip(PAPER_FIELDS, row)) for row in zip(*self.columns())]
+
+
+# Entry children whose text becomes a paper field
+_TEXT_FIELDS = frozenset({_TITLE, _SUMMARY, _PUBLISHED, _UPDATED, _ID})
+
+
+class _EntryTarget:
+    """Parser target that builds paper dicts straight from parse events.
+
+    No element tree is built: text is buffered only for the element being
+    read, and each paper is finalized when its ``</entry>`` closes. Atom
+    allows at most one title, summary, id, published and updated element
+    per entry.
+    """
+
+    def __init__(self) -> None:
+        self.papers: list[dict[str, Any]] = []
+        self._depth = 0
+        self._entry_depth = 0  # depth of the open <entry>, 0 outside one
+        self._in_author = False
+        self._capture = False  # buffer text only for elements that are read
+        self._text: list[str] = []
+        self._fields: dict[str, str] = {}
+        self._authors: list[str] = []
+        self._primary_categories: list[str] = []
+        self._categories: list[str] = []
+
+    def start(self, tag: str, attrib: Any) -> None:
+        self._depth += 1
+        self._capture = False
+        if not self._entry_depth:
+            if tag == _ENTRY_TAG:
+                self._entry_depth = self._depth
+                self._fields = {}
+                self._authors = []
+                self._primary_categories = []
+                self._categories = []
+            return
+        # Category codes come from a small vocabulary repeated across papers;
+        # interning stores each code once
+        if self._depth == self._entry_depth + 1:
+            if tag in _TEXT_FIELDS:
+                self._capture = True
+                self._text = []
+            elif tag == _AUTHOR:
+                self._in_author = True
+            elif tag == _CATEGORY:
+                term = attrib.get("term")
+                if term:
+                    self._categories.append(sys.intern(term))
+            elif tag == _PRIMARY_CATEGORY:
+                term = attrib.get("term")
+                if term:
+                    self._primary_categories.append(sys.intern(term))
+        elif self._in_author and tag == _NAME and self._depth == self._entry_depth + 2:
+            self._capture = True
+            self._text = []
+
+    def data(self, text: str) -> None:
+        if self._capture:
+            self._text.append(text)
+
+    def end(self, tag: str) -> None:
+        depth = self._depth
+        self._depth -= 1
+        self._capture = False
+        if not self._entry_depth:
+            return
+        if depth == self._entry_depth + 1:
+            if tag == _AUTHOR:
+                self._in_author = False
+            elif tag in _TEXT_FIELDS:
+                self._fields[tag] = self._joined_text()
+        elif depth == self._entry_depth + 2 and self._in_author and tag == _NAME:
+            # strip() hands back the same object when arXiv already trimmed it
+            name = self._joined_text().strip()
+            if name:
+                self._authors.append(name)
+        elif depth == self._entry_depth:
+            self._finish_entry()
+            self._entry_depth = 0
+
+    def close(self) -> None:
+        return None
+
+    def _joined_text(self) -> str:
+        """Return the buffered text, skipping the join for a single fragment."""
+        text = self._text
+        if len(text) == 1:
+            return text[0]
+        return "".join(text)
+
+    def take(self) -> list[dict[str, Any]]:
+        """Return the papers finished since the last call."""
+        papers, self.papers = self.papers, []
+        return papers
+
+    def _finish_entry(self) -> None:
+        self.papers.append(dict(zip(PAPER_FIELDS, self._values())))
+
+    def _values(self) -> tuple[Any, ...]:
+        """Return the finished entry's values in ``PAPER_FIELDS`` order."""
+        fields = self._fields
+        entry_id = fields.get(_ID, "")
+        return (
+            entry_id.split("/")[-1] if entry_id else "",  # Get last part of URL
+            fields.get(_TITLE, "").strip(),
+            fields.get(_SUMMARY, "").strip(),
+            fields.get(_PUBLISHED, ""),
+            fields.get(_UPDATED, ""),
+            self._authors,
+            # Primary category first, as arXiv lists it
+            self._primary_categories + self._categories,
+            entry_id,
+        )
+
+
+class _BatchTarget(_EntryTarget):
+    """Parser target that appends each paper's fields to a ``PaperBatch``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch = PaperBatch()
+
+    def _finish_entry(self) -> None:
+        for column, value in zip(self.batch.columns(), self._values()):
+            column.append(value)
+
+
+class _EntryParser:
+    """Incremental Atom parser that hands back finished papers after each feed."""
+
+    def __init__(self, target: _EntryTarget | None = None) -> None:
+        self._target = target if target is not None else _EntryTarget()
+        if LXML_AVAILABLE:
+            self._parser = etree.XMLParser(target=self._target, **_LXML_OPTIONS)
+        else:
+            self._parser = ET.XMLParser(target=self._target)
+
+    def feed(self, data: bytes) -> list[dict[str, Any]]:
+        self._parser.feed(data)
+        return self._target.take()
+
+    def close(self) -> list[dict[str, Any]]:
+        self._parser.close()
+        return self._target.take()
+
+
 # arXiv API base URL
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
@@ -28,13 +272,132 @@ DEFAULT_CATEGORIES = [
 ]
 
 
+# arXiv asks API clients to make one request at a time, 3 seconds apart
+ARXIV_REQUEST_INTERVAL = 3.0
+
+# Transient failures are retried with jittered exponential backoff
+RETRY_ATTEMPTS = 4
+RETRY_INITIAL_BACKOFF = 0.5
+RETRY_MAX_BACKOFF = 8.0
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# arXiv publishes new listings once a day
+ARXIV_CACHE_TTL_SECONDS = 24 * 3600
+DEFAULT_CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser() / "signal_harvester" / "arxiv"
+
+
+def _submitted_date_range(since: datetime) -> str:
+    """Return an arXiv ``submittedDate`` range term from ``since`` (UTC) onwards."""
+    # The API expects both bounds; a day past now absorbs clock skew
+    until = datetime.now(timezone.utc) + timedelta(days=1)
+    return f"submittedDate:[{since:%Y%m%d%H%M} TO {until:%Y%m%d%H%M}]"
+
+
+class ArxivCache:
+    """Disk cache of parsed ``fetch_recent`` results, fronted by an in-process dict.
+
+    Entries are JSON files named by the query signature and expire ``ttl``
+    seconds after they were written. Cache I/O failures are logged and
+    treated as misses. The in-process layer keeps the serialized bytes, so
+    every hit returns fresh objects that callers are free to mutate.
+    """
+
+    def __init__(self, directory: Path | str = DEFAULT_CACHE_DIR, ttl: float = ARXIV_CACHE_TTL_SECONDS):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self._memory: dict[str, tuple[float, bytes]] = {}
+
+    @staticmethod
+    def key(
+        categories: list[str],
+        query_terms: list[str] | None,
+        max_results: int,
+        hours: int,
+    ) -> str:
+        """Hash a query signature, bucketed by UTC day."""
+        signature = {
+            "cats": sorted(categories),
+            "terms": sorted(query_terms or []),
+            "max": max_results,
+            "hours": hours,
+            "day": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+        }
+        return hashlib.sha1(orjson.dumps(signature, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """Return cached papers for ``key`` if written within the TTL."""
+        now = time.time()
+        hit = self._memory.get(key)
+        if hit is not None:
+            stored_at, data = hit
+            if now - stored_at < self.ttl:
+                cached: list[dict[str, Any]] = orjson.loads(data)
+                return cached
+            del self._memory[key]
+
+        path = self._path(key)
+        try:
+            stored_at = path.stat().st_mtime
+            if now - stored_at >= self.ttl:
+                return None
+            data = path.read_bytes()
+            papers: list[dict[str, Any]] = orjson.loads(data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable arXiv cache entry %s: %s", path, e)
+            return None
+
+        self._memory[key] = (stored_at, data)
+        return papers
+
+    def set(self, key: str, papers: list[dict[str, Any]]) -> None:
+        """Store ``papers`` under ``key``, replacing the file atomically."""
+        data = orjson.dumps(papers)
+        self._memory[key] = (time.time(), data)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            log.warning("Could not write arXiv cache entry: %s", e)
+
+
 class ArxivClient:
     """Client for fetching papers from arXiv API."""
     
-    def __init__(self, max_results: int = 50, categories: list[str] | None = None):
+    def __init__(
+        self,
+        max_results: int = 50,
+        categories: list[str] | None = None,
+        cache: ArxivCache | None = None,
+    ):
         self.max_results = max_results
         self.categories = categories or DEFAULT_CATEGORIES
-        self.client = httpx.AsyncClient(timeout=30.0)
+        # Category clauses don't change per call; build them once
+        self._category_query = " OR ".join(f"cat:{cat}" for cat in self.categories)
+        self.cache = cache
+        # One pooled client per ArxivClient: requests share kept-alive
+        # connections (multiplexed over one when HTTP/2 is available)
+        self.client = httpx.AsyncClient(
+            http2=H2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=60.0),
+            headers={"User-Agent": f"signal-harvester/{__version__}"},
+        )
+        self._idle_parsers: list[_EntryParser] = []
+        # Serializes requests and spaces them ARXIV_REQUEST_INTERVAL apart
+        self._request_turn = asyncio.Lock()
+        self._last_request = float("-inf")
     
     async def __aenter__(self) -> "ArxivClient":
         return self
@@ -47,116 +410,230 @@ class ArxivClient:
     ) -> None:
         await self.client.aclose()
     
-    def build_query(self, query_terms: list[str] | None = None) -> str:
+    def build_query(self, query_terms: list[str] | None = None, since: datetime | None = None) -> str:
         """Build arXiv search query from categories and terms."""
-        # Category queries
-        category_queries = [f"cat:{cat}" for cat in self.categories]
-        
-        # Search term queries
-        term_queries = []
+        query = self._category_query
         if query_terms:
-            term_queries = [f"all:{term}" for term in query_terms]
-        
-        # Combine with OR
-        all_queries = category_queries + term_queries
-        return " OR ".join(all_queries)
+            # Combine with OR
+            query += " OR " + " OR ".join(f"all:{term}" for term in query_terms)
+        if since is not None:
+            query = f"({query}) AND {_submitted_date_range(since)}"
+        return query
     
     async def fetch_recent(self, hours: int = 24, query_terms: list[str] | None = None) -> list[dict[str, Any]]:
         """Fetch recent papers from arXiv."""
-        query = self.build_query(query_terms)
-        
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ArxivCache.key(self.categories, query_terms, self.max_results, hours)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                log.info("Using cached arXiv results (%d papers)", len(cached))
+                return cached
+
+        # arXiv filters by submission time itself, so older papers are never
+        # downloaded; the string check in _stream_window only trims the
+        # minute granularity
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        search_query = self.build_query(query_terms, since=since)
+        try:
+            log.info("Fetching arXiv papers with query: %s", search_query)
+            papers = [paper async for paper in self._stream_window(search_query, since)]
+            
+            log.info("Found %d recent arXiv papers", len(papers))
+            if self.cache is not None and cache_key is not None:
+                self.cache.set(cache_key, papers)
+            return papers
+            
+        except Exception as e:
+            log.error("Error fetching from arXiv: %s", e)
+            return []
+    
+    async def iter_recent(
+        self,
+        hours: int = 24,
+        query_terms: list[str] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield recent papers as soon as the streaming parser emits them.
+
+        Downstream work can start before the response has been read to the
+        end. Results are not cached; an error is logged and ends the
+        iteration.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(ArxivCache.key(self.categories, query_terms, self.max_results, hours))
+            if cached is not None:
+                for paper in cached:
+                    yield paper
+                return
+
+        since = datetime.now(timezone.utc) - timedelta(hours=hours)
+        try:
+            async for paper in self._stream_window(self.build_query(query_terms, since=since), since):
+                yield paper
+        except Exception as e:
+            log.error("Error fetching from arXiv: %s", e)
+    
+    async def _stream_window(self, search_query: str, since: datetime) -> AsyncIterator[dict[str, Any]]:
+        """Run ``search_query``, yielding each paper in the window once as it is parsed.
+
+        The request runs in its own task and feeds a queue, so it finishes
+        (and frees the client's request turn) even if the consumer stops
+        early; closing the generator cancels it. Errors propagate.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+
+        async def run() -> None:
+            try:
+                await self._fetch_query(search_query, on_paper=queue.put_nowait)
+            finally:
+                queue.put_nowait(None)
+
+        # arXiv timestamps are UTC ISO-8601 ("...T03:04:05Z"), so they order
+        # the same as strings
+        cutoff = since.strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Papers re-sent by a retried request are yielded the first time only
+        seen: set[str] = set()
+        task = asyncio.create_task(run())
+        try:
+            while (paper := await queue.get()) is not None:
+                if paper["published_at"] > cutoff and paper["source_id"] not in seen:
+                    seen.add(paper["source_id"])
+                    yield paper
+            await task
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    
+    async def _fetch_query(
+        self,
+        search_query: str,
+        on_paper: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch the newest ``max_results`` papers matching ``search_query``."""
         params: dict[str, str | int] = {
-            "search_query": query,
+            "search_query": search_query,
             "start": 0,
             "max_results": self.max_results,
             "sortBy": "submittedDate",
             "sortOrder": "descending"
         }
-        
+        return await self._fetch_papers(params, on_paper)
+    
+    async def _fetch_papers(
+        self,
+        params: dict[str, str | int],
+        on_paper: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run ``_fetch_papers_once``, retrying transient failures.
+
+        Transport errors and 429/5xx responses are retried with jittered
+        exponential backoff (honoring Retry-After); other 4xx responses and
+        parse errors fail immediately.
+        """
+        backoff = RETRY_INITIAL_BACKOFF
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                return await self._fetch_papers_once(params, on_paper)
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                retry_after = None
+                if isinstance(e, httpx.HTTPStatusError):
+                    if e.response.status_code not in RETRY_STATUS_CODES:
+                        raise
+                    retry_after = e.response.headers.get("Retry-After")
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                delay = (
+                    float(retry_after) if retry_after and retry_after.isdigit()
+                    else random.uniform(backoff / 2, backoff)
+                )
+                log.warning(
+                    "arXiv request failed (attempt %d/%d): %s; retrying in %.1fs",
+                    attempt, RETRY_ATTEMPTS, e, delay,
+                )
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, RETRY_MAX_BACKOFF)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _fetch_papers_once(
+        self,
+        params: dict[str, str | int],
+        on_paper: Callable[[dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query the API and parse the Atom body as it streams in.
+
+        Entries are extracted while later chunks are still arriving, and the
+        raw body is never held in memory as a whole. With ``on_paper``, each
+        paper is handed to it as soon as it is parsed instead of being
+        collected into the returned list. Requests from one client take
+        turns, starting at least ``ARXIV_REQUEST_INTERVAL`` seconds after the
+        previous one ended. Parse errors propagate.
+        """
+        papers: list[dict[str, Any]] = []
+        emit = on_paper if on_paper is not None else papers.append
+        async with self._request_turn:
+            wait = self._last_request + ARXIV_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self.client.stream("GET", ARXIV_API_URL, params=params) as response:
+                    response.raise_for_status()
+                    parser = self._acquire_parser()
+                    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                        for paper in parser.feed(chunk):
+                            emit(paper)
+                    for paper in parser.close():
+                        emit(paper)
+            finally:
+                self._last_request = time.monotonic()
+        self._release_parser(parser)
+        return papers
+    
+    def _acquire_parser(self) -> _EntryParser:
+        """Take an idle parser, or build one when all are in use.
+
+        Concurrent parses (say, parse_xml_response during a fetch) each need
+        their own parser, so parsers are pooled per client rather than shared.
+        """
+        return self._idle_parsers.pop() if self._idle_parsers else _EntryParser()
+    
+    def _release_parser(self, parser: _EntryParser) -> None:
+        """Return a cleanly closed parser for reuse.
+
+        lxml parsers reset on close(); expat-backed stdlib parsers are
+        single-use and are simply dropped. A parser abandoned mid-document
+        by an error is never released.
+        """
+        if LXML_AVAILABLE:
+            self._idle_parsers.append(parser)
+    
+    def parse_xml_response(self, xml: bytes | str) -> list[dict[str, Any]]:
+        """Parse arXiv Atom XML response.
+
+        Pass the raw response bytes where possible; the parser reads the
+        encoding from the XML declaration, so no str round-trip is needed.
+        """
+        data = xml.encode("utf-8") if isinstance(xml, str) else xml
+        parser = self._acquire_parser()
         try:
-            log.info("Fetching arXiv papers with query: %s", query)
-            response = await self.client.get(ARXIV_API_URL, params=params)
-            response.raise_for_status()
-            
-            papers = self.parse_xml_response(response.text)
-            
-            # Filter by date
-            cutoff_time = datetime.now(timezone.utc).timestamp() - (hours * 3600)
-            recent_papers = [
-                paper for paper in papers
-                if paper["published_at"] and datetime.fromisoformat(paper["published_at"]).timestamp() > cutoff_time
-            ]
-            
-            log.info("Found %d recent arXiv papers (out of %d total)", len(recent_papers), len(papers))
-            return recent_papers
-            
-        except Exception as e:
-            log.error("Error fetching from arXiv: %s", e)
+            papers = parser.feed(data) + parser.close()
+        except _XML_ERRORS as e:
+            log.error("Error parsing arXiv XML: %s", e)
             return []
+        self._release_parser(parser)
+        return papers
     
-    def parse_xml_response(self, xml_text: str) -> list[dict[str, Any]]:
-        """Parse arXiv Atom XML response."""
+    def parse_xml_batch(self, xml: bytes | str) -> PaperBatch:
+        """Parse arXiv Atom XML straight into a column-oriented ``PaperBatch``."""
+        data = xml.encode("utf-8") if isinstance(xml, str) else xml
+        target = _BatchTarget()
+        parser = _EntryParser(target)
         try:
-            root = ET.fromstring(xml_text)
-            
-            # Define namespaces
-            ns = {
-                "atom": "http://www.w3.org/2005/Atom",
-                "arxiv": "http://arxiv.org/schemas/atom"
-            }
-            
-            papers = []
-            
-            for entry in root.findall("atom:entry", ns):
-                try:
-                    # Extract basic info
-                    title = entry.find("atom:title", ns)
-                    summary = entry.find("atom:summary", ns)
-                    published = entry.find("atom:published", ns)
-                    updated = entry.find("atom:updated", ns)
-                    id_elem = entry.find("atom:id", ns)
-                    
-                    # Extract authors
-                    authors = []
-                    for author in entry.findall("atom:author", ns):
-                        name_elem = author.find("atom:name", ns)
-                        if name_elem is not None and name_elem.text:
-                            authors.append(name_elem.text.strip())
-                    
-                    # Extract categories
-                    categories = []
-                    for category in entry.findall("arxiv:primary_category", ns) + entry.findall("atom:category", ns):
-                        term = category.get("term")
-                        if term:
-                            categories.append(term)
-                    
-                    # Extract arXiv ID from URL
-                    arxiv_id = ""
-                    if id_elem is not None and id_elem.text:
-                        arxiv_id = id_elem.text.split("/")[-1]  # Get last part of URL
-                    
-                    paper = {
-                        "source_id": arxiv_id,
-                        "title": title.text.strip() if title is not None and title.text else "",
-                        "text": summary.text.strip() if summary is not None and summary.text else "",
-                        "published_at": published.text if published is not None else "",
-                        "updated_at": updated.text if updated is not None else "",
-                        "authors": authors,
-                        "categories": categories,
-                        "url": id_elem.text if id_elem is not None else "",
-                    }
-                    
-                    papers.append(paper)
-                    
-                except Exception as e:
-                    log.warning("Error parsing arXiv entry: %s", e)
-                    continue
-            
-            return papers
-            
-        except ET.ParseError as e:
+            parser.feed(data)
+            parser.close()
+        except _XML_ERRORS as e:
             log.error("Error parsing arXiv XML: %s", e)
-            return []
+            return PaperBatch()
+        return target.batch
     
     async def fetch_by_id(self, arxiv_id: str) -> dict[str, Any] | None:
         """Fetch a specific paper by arXiv ID."""
@@ -166,10 +643,7 @@ class ArxivClient:
         }
         
         try:
-            response = await self.client.get(ARXIV_API_URL, params=params)
-            response.raise_for_status()
-            
-            papers = self.parse_xml_response(response.text)
+            papers = await self._fetch_papers(params)
             return papers[0] if papers else None
             
         except Exception as e:
@@ -177,6 +651,77 @@ class ArxivClient:
             return None
 
 
+# Shared client for fetch_arxiv_papers. The loop is held weakly so a finished
+# asyncio.run's loop can be collected.
+_default_client: ArxivClient | None = None
+_default_client_key: tuple[Any, ...] | None = None
+_default_client_loop: weakref.ReferenceType[asyncio.AbstractEventLoop] | None = None
+_default_client_closer: AsyncGenerator[None, None] | None = None
+
+
+async def _close_at_loop_shutdown(client: ArxivClient) -> AsyncGenerator[None, None]:
+    """Suspend until closed, then close ``client``.
+
+    The event loop tracks started async generators and closes any still
+    suspended when ``asyncio.run`` shuts it down, so the client is closed on
+    the loop its connections belong to.
+    """
+    try:
+        yield
+    finally:
+        await client.client.aclose()
+
+
+async def get_default_client(
+    max_results: int = 50,
+    categories: list[str] | None = None,
+    cache: bool = False,
+) -> ArxivClient:
+    """Get or create the shared ``ArxivClient`` so calls reuse its connection pool.
+
+    httpx connections belong to the event loop that opened them, so the
+    client is rebuilt when called from a different loop (e.g. a later
+    ``asyncio.run``) or with different settings. A client replaced on the
+    same loop is closed right away; one left on an earlier loop was closed
+    when that loop shut down.
+    """
+    global _default_client, _default_client_key, _default_client_loop, _default_client_closer
+    loop = asyncio.get_running_loop()
+    key = (max_results, tuple(categories or DEFAULT_CATEGORIES), cache)
+    client_loop = _default_client_loop() if _default_client_loop is not None else None
+    if _default_client is not None and client_loop is loop and _default_client_key == key:
+        return _default_client
+
+    await close_default_client()
+    client = ArxivClient(
+        max_results=max_results,
+        categories=categories,
+        cache=ArxivCache() if cache else None,
+    )
+    closer = _close_at_loop_shutdown(client)
+    await anext(closer)
+    _default_client = client
+    _default_client_key = key
+    _default_client_loop = weakref.ref(loop)
+    _default_client_closer = closer
+    return client
+
+
+async def close_default_client() -> None:
+    """Close and reset the shared client (at shutdown, or between tests)."""
+    global _default_client, _default_client_key, _default_client_loop, _default_client_closer
+    closer = _default_client_closer
+    client_loop = _default_client_loop() if _default_client_loop is not None else None
+    _default_client = None
+    _default_client_key = None
+    _default_client_loop = None
+    _default_client_closer = None
+    # A client from another loop can only be closed there; that loop closes
+    # it on shutdown (a no-op here once it has)
+    if closer is not None and client_loop is asyncio.get_running_loop():
+        await closer.aclose()
+
+
 async def fetch_arxiv_papers(config: dict[str, Any]) -> list[dict[str, Any]]:
     """Fetch arXiv papers based on configuration."""
     arxiv_config = config.get("sources", {}).get("arxiv", {})
@@ -188,8 +733,7 @@ async def fetch_arxiv_papers(config: dict[str, Any]) -> list[dict[str, Any]]:
     max_results = arxiv_config.get("max_results", 50)
     categories = arxiv_config.get("categories", DEFAULT_CATEGORIES)
     query_terms = arxiv_config.get("query_terms", ["novel", "breakthrough", "state-of-the-art"])
+    client = await get_default_client(max_results, categories, cache=arxiv_config.get("cache", False))
     
-    async with ArxivClient(max_results=max_results, categories=categories) as client:
-        # Fetch papers from last 24 hours by default
-        papers = await client.fetch_recent(hours=24, query_terms=query_terms)
-        return papers
+    # Fetch papers from last 24 hours by default
+    return await client.fetch_recent(hours=24, query_terms=query_terms)
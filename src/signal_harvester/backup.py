@@ -114,6 +114,14 @@ class CompressionType(str, Enum):
     ZSTD = "zstd"
 
 
+# zstd compresses SQLite pages several times faster than gzip at a similar
+# or better ratio, so it is the default whenever it is installed
+DEFAULT_COMPRESSION = CompressionType.ZSTD if HAS_ZSTD else CompressionType.GZIP
+
+# Files are (de)compressed in chunks of this size, never read whole
+COPY_CHUNK_SIZE = 1 << 20
+
+
 class CloudProvider(str, Enum):
     """Cloud storage provider."""
     S3 = "s3"
@@ -213,7 +221,7 @@ class BackupManager:
         self,
         db_path: Union[str, Path],
         backup_dir: Union[str, Path] = "backups",
-        compression: CompressionType = CompressionType.GZIP,
+        compression: CompressionType = DEFAULT_COMPRESSION,
         retention_days: int = 30,
         lock_wait_seconds: float = 5.0,
     ):
@@ -223,7 +231,7 @@ class BackupManager:
         Args:
             db_path: Path to SQLite database file
             backup_dir: Directory to store backups
-            compression: Default compression type
+            compression: Default compression type (zstd when installed, else gzip)
             retention_days: Default retention period in days
             lock_wait_seconds: Max seconds to wait for a database lock before failing
         """
@@ -303,7 +311,7 @@ class BackupManager:
             dest = Path(str(source) + ".gz")
             with open(source, "rb") as f_in:
                 with gzip.open(dest, "wb", compresslevel=6) as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
             # Remove uncompressed file
             source.unlink()
             return dest
@@ -314,10 +322,11 @@ class BackupManager:
                 return self._compress_file(source, CompressionType.GZIP)
             
             dest = Path(str(source) + ".zst")
-            cctx = zstd.ZstdCompressor(level=3)
-            with open(source, "rb") as f_in:
-                with open(dest, "wb") as f_out:
-                    f_out.write(cctx.compress(f_in.read()))
+            # threads=-1 compresses on every core
+            cctx = zstd.ZstdCompressor(level=3, threads=-1)
+            with open(source, "rb") as raw_in:
+                with open(dest, "wb") as raw_out, cctx.stream_writer(raw_out) as writer:
+                    shutil.copyfileobj(raw_in, writer, COPY_CHUNK_SIZE)
             # Remove uncompressed file
             source.unlink()
             return dest
@@ -340,7 +349,7 @@ class BackupManager:
         if source.suffix == ".gz":
             with gzip.open(source, "rb") as f_in:
                 with open(dest, "wb") as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                    shutil.copyfileobj(f_in, f_out, COPY_CHUNK_SIZE)
             return dest
         
         elif source.suffix == ".zst":
@@ -348,9 +357,9 @@ class BackupManager:
                 raise RuntimeError("zstandard not installed, cannot decompress .zst file")
             
             dctx = zstd.ZstdDecompressor()
-            with open(source, "rb") as f_in:
-                with open(dest, "wb") as f_out:
-                    f_out.write(dctx.decompress(f_in.read()))
+            with open(source, "rb") as raw_in, dctx.stream_reader(raw_in) as reader:
+                with open(dest, "wb") as raw_out:
+                    shutil.copyfileobj(reader, raw_out, COPY_CHUNK_SIZE)
             return dest
         
         else:
@@ -146,13 +146,21 @@ def _generate_cache_key(*args: Any, prefix: str = "cache", **kwargs: Any) -> str
 def _get_from_cache(
     key: str,
     config_or_ttl: CacheConfig | int | None = None,
+    encoded: bool = False,
+    ttl: Optional[int] = None,
 ) -> Optional[Any]:
-    """Get value from cache (Redis first, then memory fallback)."""
+    """Get value from cache (Redis first, then memory fallback).
+
+    With ``encoded`` the Redis value is an already serialized document and is
+    returned as the stored string instead of being JSON-decoded. ``ttl``
+    bounds the age of memory entries (Redis expires its own keys).
+    """
+    ttl_override: Optional[int]
     if isinstance(config_or_ttl, int):
         ttl_override = config_or_ttl
         config = _cache_config
     else:
-        ttl_override = None
+        ttl_override = ttl
         config = config_or_ttl or _cache_config
 
     redis_client = get_redis_client(config)
@@ -164,7 +172,7 @@ def _get_from_cache(
             if value is not None:
                 _cache_stats["hits"] += 1
                 _cache_stats["redis_hits"] += 1
-                return json.loads(value)
+                return value if encoded else json.loads(value)
         except Exception as e:
             log.error(f"Redis get error: {e}")
             _cache_stats["redis_errors"] += 1
@@ -199,8 +207,12 @@ def _set_in_cache(
     ttl: int,
     config: CacheConfig | None = None,
     raw_value: Any | None = None,
+    encoded: bool = False,
 ) -> None:
-    """Set value in cache (Redis and memory)."""
+    """Set value in cache (Redis and memory).
+
+    With ``encoded`` the value is an already serialized string stored as-is.
+    """
     config = config or _cache_config
     _cache_stats["cache_sets"] += 1
     redis_client = get_redis_client(config)
@@ -208,7 +220,7 @@ def _set_in_cache(
     # Try Redis first
     if redis_client is not None:
         try:
-            redis_client.setex(key, ttl, json.dumps(value))
+            redis_client.setex(key, ttl, value if encoded else json.dumps(value))
         except Exception as e:
             log.error(f"Redis set error: {e}")
             _cache_stats["redis_errors"] += 1
@@ -222,9 +234,10 @@ def _set_in_cache(
         max_memory_cache_size = _int_config_value(
             config, "max_memory_cache_size", _default_cache_config.max_memory_cache_size
         )
+        # Re-inserting keeps the dict in timestamp order, so the first entry is the oldest
+        _memory_cache.pop(key, None)
         if len(_memory_cache) >= max_memory_cache_size:
-            oldest_key = min(_memory_cache.items(), key=lambda x: x[1][1])[0]
-            del _memory_cache[oldest_key]
+            del _memory_cache[next(iter(_memory_cache))]
             _cache_stats["evictions"] += 1
         
         memory_value = raw_value if raw_value is not None else value
@@ -296,6 +309,51 @@ def cached(
     return decorator
 
 
+def cached_response(
+    prefix: str = "cache",
+    ttl: Optional[int] = None,
+    ttl_key: str = "discovery_ttl",
+) -> Callable[[Callable[..., Optional[bytes]]], Callable[..., Optional[bytes]]]:
+    """Decorator to cache a function's serialized JSON response body.
+    
+    Like ``cached`` but for functions returning encoded JSON bytes: hits hand
+    back the stored body directly, with no model rebuild or re-serialization.
+    ``None`` results (e.g. not found) are not cached.
+    
+    Example:
+        @cached_response(prefix='discovery', ttl_key='discovery_ttl')
+        def get_discoveries_json(min_score: float, limit: int) -> bytes:
+            return orjson.dumps(expensive_query(min_score, limit))
+    """
+    def decorator(func: Callable[..., Optional[bytes]]) -> Callable[..., Optional[bytes]]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Optional[bytes]:
+            config = _cache_config or CacheConfig(Settings())
+            cache_key = _generate_cache_key(*args, prefix=prefix, **kwargs)
+            default_ttl = getattr(_default_cache_config, ttl_key, 3600)
+            config_ttl = _int_config_value(config, ttl_key, default_ttl)
+            actual_ttl = ttl if ttl is not None else config_ttl
+            
+            cached_body = _get_from_cache(cache_key, config, encoded=True, ttl=actual_ttl)
+            if cached_body is not None:
+                log.debug(f"Cache hit for {prefix}: {cache_key}")
+                # Memory keeps the bytes; Redis hands back the decoded string
+                return cached_body if isinstance(cached_body, bytes) else cached_body.encode()
+            
+            log.debug(f"Cache miss for {prefix}: {cache_key}")
+            body = func(*args, **kwargs)
+            if body is None:
+                return None
+            
+            _set_in_cache(cache_key, body.decode(), actual_ttl, config, raw_value=body, encoded=True)
+            
+            return body
+        
+        return wrapper
+    
+    return decorator
+
+
 def invalidate_cache(pattern: str = "*") -> int:
     """Invalidate cache entries matching pattern.
     
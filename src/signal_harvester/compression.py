@@ -0,0 +1,223 @@
+"""Response compression middleware with zstd/Brotli negotiation.
+
+Extends Starlette's GZipMiddleware: when the client advertises ``zstd`` or
+``br`` in Accept-Encoding and the matching optional package is installed
+(``pip install signal-harvester[compression]``), responses are encoded with
+it; otherwise gzip (or identity) is used exactly as before.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+# Optional encoders
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Parse an Accept-Encoding header into the set of codings with a non-zero q."""
+    accepted: set[str] = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip().lower()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    return accepted
+
+
+# Media types sent as-is: event streams must reach the client as they are
+# written, and the rest are compressed already
+EXCLUDED_CONTENT_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/x-gzip",
+        "application/zip",
+        "audio/*",
+        "font/woff",
+        "font/woff2",
+        "image/avif",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "text/event-stream",
+        "video/*",
+    }
+)
+
+
+class EncodingResponder(ABC):
+    """Wraps ``send`` to encode the response body with ``apply_compression``.
+
+    Modeled on Starlette's gzip responder but built only on its public
+    datastructures, so it doesn't depend on the installed release's
+    middleware internals. Subclasses set ``content_encoding``.
+    """
+
+    content_encoding: str
+
+    def __init__(self, app: ASGIApp, minimum_size: int) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.send: Send | None = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        send = self.send
+        assert send is not None
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk decides the headers
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == 206
+                or media_type in EXCLUDED_CONTENT_TYPES
+                or media_type.partition("/")[0] + "/*" in EXCLUDED_CONTENT_TYPES
+            )
+            if self.passthrough:
+                await send(message)
+        elif self.passthrough or message_type != "http.response.body":
+            if not self.passthrough and not self.started and message_type == "http.response.pathsend":
+                # File responses sent by the server itself aren't encoded
+                self.started = True
+                await send(self.initial_message)
+            await send(message)
+        elif not self.started:
+            self.started = True
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if len(body) < self.minimum_size and not more_body:
+                await send(self.initial_message)
+                await send(message)
+                return
+
+            encoded = await self.apply_compression(body, more_body=more_body)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.content_encoding
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(encoded))
+            message["body"] = encoded
+            await send(self.initial_message)
+            await send(message)
+        else:
+            more_body = message.get("more_body", False)
+            message["body"] = await self.apply_compression(message.get("body", b""), more_body=more_body)
+            await send(message)
+
+    @abstractmethod
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        """Encode ``body``, finishing the stream when ``more_body`` is False."""
+
+
+class BrotliResponder(EncodingResponder):
+    """Streams the response through a Brotli compressor."""
+
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality, mode=brotli.MODE_TEXT)
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        data: bytes = self.compressor.process(body)
+        tail: bytes = self.compressor.flush() if more_body else self.compressor.finish()
+        return data + tail
+
+
+class ZstdResponder(EncodingResponder):
+    """Streams the response through a zstd compressor."""
+
+    content_encoding = "zstd"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, level: int = 3) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        data: bytes = self.compressor.compress(body)
+        flush_mode = zstandard.COMPRESSOBJ_FLUSH_BLOCK if more_body else zstandard.COMPRESSOBJ_FLUSH_FINISH
+        tail: bytes = self.compressor.flush(flush_mode)
+        return data + tail
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZipMiddleware that prefers zstd, then Brotli, when both sides support them.
+
+    Args:
+        app: ASGI application
+        minimum_size: Responses smaller than this are sent uncompressed
+        compresslevel: gzip level
+        brotli_quality: Brotli quality (0-11); 4 is close to gzip speed with a better ratio
+        zstd_level: zstd level; 3 is faster than gzip at a similar ratio
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        brotli_quality: int = 4,
+        zstd_level: int = 3,
+    ) -> None:
+        super().__init__(app, minimum_size=minimum_size, compresslevel=compresslevel)
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (ZSTD_AVAILABLE or BROTLI_AVAILABLE):
+            # Content codings are case-insensitive, so "BR" and "Zstd" count too
+            header = Headers(scope=scope).get("Accept-Encoding", "").lower()
+            if "zstd" in header or "br" in header:
+                encodings = accepted_encodings(header)
+                responder: EncodingResponder | None = None
+                if ZSTD_AVAILABLE and "zstd" in encodings:
+                    responder = ZstdResponder(self.app, self.minimum_size, level=self.zstd_level)
+                elif BROTLI_AVAILABLE and "br" in encodings:
+                    responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+                if responder is not None:
+                    await responder(scope, receive, send)
+                    return
+
+        await super().__call__(scope, receive, send)
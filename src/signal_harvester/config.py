@@ -36,6 +36,7 @@ class ArxivConfig(BaseModel):
         "cs.LG", "cs.AI", "cs.RO", "cs.CV", "physics.optics", "quant-ph", "cs.CL", "cs.NE"
     ])
     query_terms: List[str] = Field(default_factory=lambda: ["novel", "breakthrough", "state-of-the-art"])
+    cache: bool = False  # Opt in to reuse parsed results for 24h under ~/.cache/signal_harvester/arxiv
 
 
 class GitHubConfig(BaseModel):
@@ -249,6 +250,9 @@ class ConnectionPoolConfig(BaseModel):
     max_overflow: int = 10
     pool_timeout: float = 30.0
     pool_recycle: int = 3600  # Recycle connections after 1 hour
+    # Worker threads for sync API endpoints (anyio default limiter).
+    # None sizes it from the pool: max(40, 2 * (pool_size + max_overflow)).
+    thread_limit: Optional[int] = None
 
 
 class DatabaseConfig(BaseModel):
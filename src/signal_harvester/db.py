@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import base64
 import json
 import sqlite3
 import time
-from typing import Any, cast
+from contextlib import contextmanager
+from typing import Any, Iterator, cast
 
 try:  # Optional PostgreSQL error hints for nicer fallbacks
     from psycopg2 import errors as psycopg2_errors  # type: ignore
@@ -23,7 +25,6 @@ from .utils import utc_now_iso
 
 log = get_logger(__name__)
 
-
 def _row_to_entity(row: Any) -> dict[str, Any]:
     """Normalize entity row with parsed metadata and JSON fields."""
     entity = dict(row)
@@ -126,6 +127,109 @@ def _safe_add_column(conn: Any, db_path: str, table: str, column_definition: str
             raise
 
 
+# SQLite keeps tweets.created_at_epoch (Unix seconds) in step with the ISO
+# created_at text so time-window filters compare integers, not strings.
+# Inserts compute it in the statement; a trigger follows later created_at edits.
+_CREATED_AT_EPOCH_SQL = "CAST(strftime('%s', {}) AS INTEGER)"
+
+
+def _ensure_created_at_epoch(conn: Any, db_path: str) -> None:
+    """Add tweets.created_at_epoch with its sync trigger and indexes (SQLite only)."""
+    _safe_add_column(conn, db_path, "tweets", "created_at_epoch INTEGER")
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tweets_created_at_epoch_update
+        AFTER UPDATE OF created_at ON tweets
+        WHEN NEW.created_at IS NOT OLD.created_at
+        BEGIN
+            UPDATE tweets SET created_at_epoch = {_CREATED_AT_EPOCH_SQL.format("NEW.created_at")}
+            WHERE rowid = NEW.rowid;
+        END;
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tweets_created_at_epoch ON tweets(created_at_epoch);")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tweets_salience_created ON tweets(salience, created_at_epoch);"
+    )
+
+
+def _created_at_epoch_insert(db_path: str) -> tuple[str, str]:
+    """Return the column and value SQL that fill created_at_epoch in a tweets INSERT.
+
+    The value binds one extra trailing parameter, the created_at text. Both are
+    empty on Postgres, which has no such column.
+    """
+    if _is_postgres_url(db_path):
+        return "", ""
+    return ", created_at_epoch", f", {_CREATED_AT_EPOCH_SQL.format('?')}"
+
+
+def _ensure_signals_version(conn: Any, db_path: str) -> None:
+    """Create the signals_version counter and the tweets triggers that bump it.
+
+    Every insert, update or delete on tweets increments the counter in the
+    same transaction, whichever process or module made the write.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS signals_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version BIGINT NOT NULL
+        );
+        """
+    )
+    conn.execute("INSERT INTO signals_version (id, version) VALUES (1, 0) ON CONFLICT DO NOTHING;")
+    if _is_postgres_url(db_path):
+        conn.execute(
+            """
+            CREATE OR REPLACE FUNCTION bump_signals_version() RETURNS trigger AS $$
+            BEGIN
+                UPDATE signals_version SET version = version + 1 WHERE id = 1;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            """
+        )
+        conn.execute("DROP TRIGGER IF EXISTS trg_tweets_signals_version ON tweets;")
+        conn.execute(
+            "CREATE TRIGGER trg_tweets_signals_version "
+            "AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON tweets "
+            "FOR EACH STATEMENT EXECUTE FUNCTION bump_signals_version();"
+        )
+        return
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_tweets_signals_version_{event.lower()}
+            AFTER {event} ON tweets
+            BEGIN
+                UPDATE signals_version SET version = version + 1 WHERE id = 1;
+            END;
+            """
+        )
+
+
+def _created_within_clause(db_path: str, hours: int) -> tuple[str, Any]:
+    """Return the WHERE fragment and parameter for tweets created in the last ``hours``."""
+    if _is_postgres_url(db_path):
+        # created_at is a native timestamptz column there
+        from datetime import datetime, timedelta, timezone
+
+        cutoff = (
+            (datetime.now(tz=timezone.utc) - timedelta(hours=hours))
+            .replace(microsecond=0)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        return "created_at >= ?", cutoff
+    return "created_at_epoch >= ?", int(time.time()) - hours * 3600
+
+
+def _created_order_column(db_path: str) -> str:
+    """Return the tweets column that orders rows by creation time."""
+    return "created_at" if _is_postgres_url(db_path) else "created_at_epoch"
+
+
 def _serial_primary_key_clause(db_path: str) -> str:
     """Return dialect-appropriate auto increment primary key clause."""
     if _is_postgres_url(db_path):
@@ -186,6 +290,19 @@ def connect(db_path: str):
     return get_database_connection(config)
 
 
+@contextmanager
+def _borrowed_connection(db_path: str, conn: Any = None) -> Iterator[Any]:
+    """Yield ``conn`` when the caller lends one (e.g. from a pool), else a fresh connection."""
+    if conn is not None:
+        yield conn
+        return
+    own = connect(db_path)
+    try:
+        yield own
+    finally:
+        own.close()
+
+
 def init_db(db_path: str) -> None:
     conn = connect(db_path)
     with conn:
@@ -220,6 +337,9 @@ def init_db(db_path: str) -> None:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_tweets_created_at ON tweets(created_at);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_tweets_salience ON tweets(salience);")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_tweets_notified ON tweets(notified_at);")
+        if not _is_postgres_url(db_path):
+            _ensure_created_at_epoch(conn, db_path)
+        _ensure_signals_version(conn, db_path)
 
         conn.execute(
             """
@@ -306,32 +426,37 @@ def upsert_tweet(db_path: str, row: dict[str, Any], query_name: str | None = Non
     try:
         now = utc_now_iso()
         inserted = False
+        epoch_column, epoch_value = _created_at_epoch_insert(db_path)
+        params: tuple[Any, ...] = (
+            row.get("tweet_id"),
+            (query_name or None),
+            row.get("text"),
+            row.get("author_id"),
+            row.get("author_username"),
+            row.get("created_at"),
+            row.get("lang"),
+            int(row.get("like_count") or 0),
+            int(row.get("retweet_count") or 0),
+            int(row.get("reply_count") or 0),
+            int(row.get("quote_count") or 0),
+            row.get("raw_json"),
+            now,
+            now,
+        )
+        if epoch_column:
+            params += (row.get("created_at"),)
         # Try insert with ON CONFLICT to detect "new"
         with conn:
             cur = conn.execute(
-                """
+                f"""
                 INSERT INTO tweets (
                     tweet_id, source, query_names, text, author_id, author_username, created_at, lang,
-                    like_count, retweet_count, reply_count, quote_count, raw_json, inserted_at, updated_at
-                ) VALUES (?, 'x', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    like_count, retweet_count, reply_count, quote_count, raw_json, inserted_at,
+                    updated_at{epoch_column}
+                ) VALUES (?, 'x', ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?{epoch_value})
                 ON CONFLICT(tweet_id) DO NOTHING;
                 """,
-                (
-                    row.get("tweet_id"),
-                    (query_name or None),
-                    row.get("text"),
-                    row.get("author_id"),
-                    row.get("author_username"),
-                    row.get("created_at"),
-                    row.get("lang"),
-                    int(row.get("like_count") or 0),
-                    int(row.get("retweet_count") or 0),
-                    int(row.get("reply_count") or 0),
-                    int(row.get("quote_count") or 0),
-                    row.get("raw_json"),
-                    now,
-                    now,
-                ),
+                params,
             )
             inserted = cur.rowcount == 1
 
@@ -469,16 +594,8 @@ def list_for_notification(
         params: list[Any] = [float(threshold)]
         where = "salience >= ? AND notified_at IS NULL"
         if hours and hours > 0:
-            # Since created_at stored ISO, string comparison works for UTC ISO timestamps
-            from datetime import datetime, timedelta, timezone
-
-            cutoff = (
-                (datetime.now(tz=timezone.utc) - timedelta(hours=hours))
-                .replace(microsecond=0)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-            where += " AND created_at >= ?"
+            clause, cutoff = _created_within_clause(db_path, hours)
+            where += f" AND {clause}"
             params.append(cutoff)
         sql = f"""
             SELECT * FROM tweets
@@ -503,31 +620,35 @@ def mark_notified(db_path: str, tweet_id: str) -> None:
         conn.close()
 
 
+# Permalink for a tweet row, composed in SQL so callers needn't loop over rows
+_TWEET_URL_SQL = (
+    "CASE WHEN author_username IS NOT NULL AND author_username != '' "
+    "THEN 'https://x.com/' || author_username || '/status/' || tweet_id "
+    "ELSE 'https://x.com/i/web/status/' || tweet_id END"
+)
+
+
 def list_top(
     db_path: str,
     limit: int = 50,
     min_salience: float = 0.0,
     hours: int | None = None,
+    with_url: bool = False,
 ) -> list[dict[str, Any]]:
+    """List the highest-salience tweets; ``with_url`` adds an x.com permalink column."""
     conn = connect(db_path)
     try:
         params: list[Any] = [float(min_salience)]
         where = "salience >= ?"
         if hours and hours > 0:
-            from datetime import datetime, timedelta, timezone
-
-            cutoff = (
-                (datetime.now(tz=timezone.utc) - timedelta(hours=hours))
-                .replace(microsecond=0)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-            where += " AND created_at >= ?"
+            clause, cutoff = _created_within_clause(db_path, hours)
+            where += f" AND {clause}"
             params.append(cutoff)
+        columns = f"*, {_TWEET_URL_SQL} AS url" if with_url else "*"
         sql = f"""
-            SELECT * FROM tweets
+            SELECT {columns} FROM tweets
             WHERE {where}
-            ORDER BY salience DESC, created_at DESC
+            ORDER BY salience DESC, {_created_order_column(db_path)} DESC
             LIMIT ?;
         """
         params.append(int(limit or 50))
@@ -537,14 +658,15 @@ def list_top(
         conn.close()
 
 
-def get_tweet(db_path: str, tweet_id: str) -> dict[str, Any] | None:
-    conn = connect(db_path)
-    try:
-        cur = conn.execute("SELECT * FROM tweets WHERE tweet_id = ?;", (tweet_id,))
+def get_tweet(
+    db_path: str, tweet_id: str, conn: Any = None, with_url: bool = False
+) -> dict[str, Any] | None:
+    """Fetch one tweet row; ``with_url`` adds an x.com permalink column."""
+    columns = f"*, {_TWEET_URL_SQL} AS url" if with_url else "*"
+    with _borrowed_connection(db_path, conn) as conn:
+        cur = conn.execute(f"SELECT {columns} FROM tweets WHERE tweet_id = ?;", (tweet_id,))
         row = cur.fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
 def get_db_metadata() -> None:
@@ -1228,6 +1350,79 @@ def run_migrations(db_path: str) -> None:
             log.info("Migration 10 applied successfully")
         finally:
             conn.close()
+
+    # Migration 11: Index tweets.updated_at for signal change fingerprints
+    if current_version < 11:
+        log.info("Applying migration 11: Adding tweets updated_at index")
+        conn = connect(db_path)
+        try:
+            with conn:
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_tweets_updated_at ON tweets(updated_at);")
+            set_schema_version(db_path, 11)
+            log.info("Migration 11 applied successfully")
+        finally:
+            conn.close()
+
+    # Migration 12: Composite index backing keyset pagination of signals
+    if current_version < 12:
+        log.info("Applying migration 12: Adding tweets (inserted_at, tweet_id) index")
+        conn = connect(db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tweets_inserted_at_id ON tweets(inserted_at, tweet_id);"
+                )
+            set_schema_version(db_path, 12)
+            log.info("Migration 12 applied successfully")
+        finally:
+            conn.close()
+
+    # Migration 13: Composite index matching list_top's filter and sort
+    if current_version < 13:
+        log.info("Applying migration 13: Adding tweets (salience, created_at) index")
+        conn = connect(db_path)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_tweets_salience_created "
+                    "ON tweets(salience, created_at);"
+                )
+            set_schema_version(db_path, 13)
+            log.info("Migration 13 applied successfully")
+        finally:
+            conn.close()
+
+    # Migration 14: Integer created_at_epoch for time-window filters
+    if current_version < 14:
+        log.info("Applying migration 14: Adding tweets.created_at_epoch")
+        conn = connect(db_path)
+        try:
+            # Postgres stores created_at as timestamptz and compares it natively
+            if not _is_postgres_url(db_path):
+                with conn:
+                    # Rebuilt on created_at_epoch, which the hours filter now uses
+                    conn.execute("DROP INDEX IF EXISTS idx_tweets_salience_created;")
+                    _ensure_created_at_epoch(conn, db_path)
+                    conn.execute(
+                        f"UPDATE tweets SET created_at_epoch = {_CREATED_AT_EPOCH_SQL.format('created_at')} "
+                        "WHERE created_at_epoch IS NULL AND created_at IS NOT NULL;"
+                    )
+            set_schema_version(db_path, 14)
+            log.info("Migration 14 applied successfully")
+        finally:
+            conn.close()
+    
+    # Migration 15: Persisted change counter for signal ETags
+    if current_version < 15:
+        log.info("Applying migration 15: Adding signals_version counter")
+        conn = connect(db_path)
+        try:
+            with conn:
+                _ensure_signals_version(conn, db_path)
+            set_schema_version(db_path, 15)
+            log.info("Migration 15 applied successfully")
+        finally:
+            conn.close()
     
     log.info("Database migrations complete. Schema version: %d", get_schema_version(db_path))
 
@@ -1609,8 +1804,6 @@ def list_top_discoveries_paginated(
         
     Cursor format: base64-encoded JSON with last_score and last_id
     """
-    import base64
-    
     conn = connect(db_path)
     try:
         params: list[Any] = [float(min_score)]
@@ -1841,8 +2034,6 @@ def get_trending_topics_paginated(
         
     Cursor format: base64-encoded JSON with last_count and last_id
     """
-    import base64
-    
     conn = connect(db_path)
     try:
         from datetime import datetime, timedelta, timezone
@@ -2485,6 +2676,69 @@ def get_topic_timeline(db_path: str, topic_name: str, days: int = 14) -> list[di
 # Signal/Snapshot Database Functions (map tweets -> signals)
 # ============================================================================
 
+def _signal_filter_clause(
+    search: str | None,
+    status: str | None,
+    source: str | None,
+) -> tuple[str, list[str | int]]:
+    """Build the WHERE clause and parameters for the signal list filters."""
+    where_conditions: list[str] = []
+    params: list[str | int] = []
+    
+    if search:
+        where_conditions.append("(text LIKE ? OR author_username LIKE ?)")
+        search_pattern = f"%{search}%"
+        params.extend([search_pattern, search_pattern])
+    
+    if status:
+        # Map status to category/sentiment/notified state
+        # For MVP: active = has salience, paused = no salience, error = failed analysis
+        if status == "active":
+            where_conditions.append("salience IS NOT NULL")
+        elif status == "paused":
+            where_conditions.append("salience IS NULL AND category IS NOT NULL")
+        elif status == "error":
+            where_conditions.append("category IS NULL AND inserted_at IS NOT NULL")
+        elif status == "inactive":
+            where_conditions.append("notified_at IS NOT NULL")
+    
+    if source:
+        where_conditions.append("source = ?")
+        params.append(source)
+    
+    where_clause = f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+    return where_clause, params
+
+
+def list_signal_ids(
+    db_path: str,
+    search: str | None = None,
+    status: str | None = None,
+    source: str | None = None,
+    limit: int = 10000,
+) -> list[str]:
+    """Return the ids of signals matching the list filters, newest first.
+    
+    Same filters and default order as ``list_signals``, but only the id column
+    is read, so bulk operations don't map full rows they immediately discard.
+    """
+    conn = connect(db_path)
+    try:
+        where_clause, params = _signal_filter_clause(search, status, source)
+        rows = conn.execute(
+            f"""
+            SELECT tweet_id FROM tweets
+            {where_clause}
+            ORDER BY inserted_at DESC, tweet_id DESC
+            LIMIT ?;
+            """,
+            [*params, limit],
+        ).fetchall()
+        return [row[0] for row in rows]
+    finally:
+        conn.close()
+
+
 def list_signals(
     db_path: str,
     page: int = 1,
@@ -2494,44 +2748,29 @@ def list_signals(
     source: str | None = None,
     sort: str = "createdAt",
     order: str = "desc",
-) -> tuple[list[dict[str, Any]], int]:
+    cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], int, str | None]:
     """List signals (mapped from tweets) with pagination and filters.
     
-    Returns: (signals_list, total_count)
+    Timestamp sorts (createdAt, updatedAt, lastSeenAt) page by keyset: pass the
+    returned cursor back to seek past the previous page instead of scanning
+    OFFSET rows. Other sorts fall back to page/page_size offsets.
+    
+    Returns: (signals_list, total_count, next_cursor)
+    
+    Cursor format: base64-encoded JSON with last sort value ("ts", null for a
+    row without one) and tweet_id ("id")
+    
+    Raises:
+        ValueError: If ``cursor`` can't be decoded
     """
     conn = connect(db_path)
     try:
-        # Build WHERE clause
-        where_conditions: list[str] = []
-        params: list[str | int] = []
-        
-        if search:
-            where_conditions.append("(text LIKE ? OR author_username LIKE ?)")
-            search_pattern = f"%{search}%"
-            params.extend([search_pattern, search_pattern])
-        
-        if status:
-            # Map status to category/sentiment/notified state
-            # For MVP: active = has salience, paused = no salience, error = failed analysis
-            if status == "active":
-                where_conditions.append("salience IS NOT NULL")
-            elif status == "paused":
-                where_conditions.append("salience IS NULL AND category IS NOT NULL")
-            elif status == "error":
-                where_conditions.append("category IS NULL AND inserted_at IS NOT NULL")
-            elif status == "inactive":
-                where_conditions.append("notified_at IS NOT NULL")
-        
-        if source:
-            where_conditions.append("source = ?")
-            params.append(source)
-        
-        where_clause = f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+        where_clause, params = _signal_filter_clause(search, status, source)
         
         # Get total count
         count_sql = f"SELECT COUNT(*) FROM tweets {where_clause};"
-        cursor = conn.execute(count_sql, params)
-        total = cursor.fetchone()[0]
+        total = conn.execute(count_sql, params).fetchone()[0]
         
         # Build ORDER BY clause
         sort_column_map = {
@@ -2543,31 +2782,98 @@ def list_signals(
         }
         sort_column = sort_column_map.get(sort, "inserted_at")
         order_dir = "DESC" if order == "desc" else "ASC"
+        keyset = sort_column in ("inserted_at", "updated_at", "created_at")
+        
+        if not keyset:
+            # Offset pagination for non-timestamp sorts
+            offset = (page - 1) * page_size
+            query_sql = f"""
+                SELECT * FROM tweets
+                {where_clause}
+                ORDER BY {sort_column} {order_dir}
+                LIMIT ? OFFSET ?;
+            """
+            params.extend([page_size, offset])
+        else:
+            offset = 0
+            if cursor:
+                cursor_ts, cursor_id = _decode_signals_cursor(cursor)
+                seek, seek_params = _signals_seek_clause(sort_column, order_dir, cursor_ts, cursor_id)
+                where_clause = f"{where_clause} AND {seek}" if where_clause else f"WHERE {seek}"
+                params.extend(seek_params)
+            else:
+                offset = (page - 1) * page_size
+            
+            # Fetch one extra row to know whether another page exists
+            query_sql = f"""
+                SELECT * FROM tweets
+                {where_clause}
+                ORDER BY {sort_column} {order_dir}, tweet_id {order_dir}
+                LIMIT ? OFFSET ?;
+            """
+            params.extend([page_size + 1, offset])
+        rows = conn.execute(query_sql, params).fetchall()
         
-        # Calculate offset
-        offset = (page - 1) * page_size
-        
-        # Get paginated results
-        query_sql = f"""
-            SELECT * FROM tweets
-            {where_clause}
-            ORDER BY {sort_column} {order_dir}
-            LIMIT ? OFFSET ?;
-        """
-        params.extend([page_size, offset])
-        cursor = conn.execute(query_sql, params)
+        next_cursor: str | None = None
+        if keyset and len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            cursor_data = {"ts": last_row[sort_column], "id": last_row["tweet_id"]}
+            next_cursor = base64.b64encode(json.dumps(cursor_data).encode("utf-8")).decode("utf-8")
         
+        # Shared fallback timestamp so rows missing one don't each format "now"
+        now = utc_now_iso()
         signals = []
-        for row in cursor.fetchall():
-            signals.append(_tweet_to_signal(dict(row)))
+        for row in rows:
+            signals.append(_tweet_to_signal(dict(row), now=now))
         
-        return signals, total
+        return signals, total, next_cursor
     finally:
         conn.close()
 
 
-def _tweet_to_signal(tweet: dict[str, Any]) -> dict[str, Any]:
-    """Convert a tweet database row to a Signal object."""
+def _decode_signals_cursor(cursor: str) -> tuple[str | None, str]:
+    """Decode a ``list_signals`` cursor into its sort value and tweet_id."""
+    try:
+        cursor_data = json.loads(base64.b64decode(cursor, validate=True).decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(cursor_data, dict) or "ts" not in cursor_data or "id" not in cursor_data:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    cursor_ts, cursor_id = cursor_data["ts"], cursor_data["id"]
+    if not (cursor_ts is None or isinstance(cursor_ts, str)) or not isinstance(cursor_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return cursor_ts, cursor_id
+
+
+def _signals_seek_clause(
+    sort_column: str,
+    order_dir: str,
+    cursor_ts: str | None,
+    cursor_id: str,
+) -> tuple[str, list[Any]]:
+    """Build the keyset condition for rows after (``cursor_ts``, ``cursor_id``).
+
+    The timestamp columns are nullable. SQLite sorts NULL first ascending and
+    last descending, and a row-value comparison with NULL is never true, so
+    NULL rows get explicit branches. The column stays bare so its index is
+    still used.
+    """
+    if order_dir == "DESC":
+        if cursor_ts is None:
+            return f"({sort_column} IS NULL AND tweet_id < ?)", [cursor_id]
+        return f"(({sort_column}, tweet_id) < (?, ?) OR {sort_column} IS NULL)", [cursor_ts, cursor_id]
+    if cursor_ts is None:
+        return f"(({sort_column} IS NULL AND tweet_id > ?) OR {sort_column} IS NOT NULL)", [cursor_id]
+    return f"({sort_column}, tweet_id) > (?, ?)", [cursor_ts, cursor_id]
+
+
+def _tweet_to_signal(tweet: dict[str, Any], now: str | None = None) -> dict[str, Any]:
+    """Convert a tweet database row to a Signal object.
+    
+    ``now`` is the fallback timestamp for rows without one; list callers pass a
+    single value per response instead of formatting the current time per row.
+    """
     # Determine status based on tweet state
     status = "active"
     if tweet.get("notified_at"):
@@ -2593,19 +2899,63 @@ def _tweet_to_signal(tweet: dict[str, Any]) -> dict[str, Any]:
         "status": status,
         "tags": tags if tags else None,
         "lastSeenAt": tweet.get("created_at"),
-        "createdAt": tweet.get("inserted_at") or tweet.get("created_at") or utc_now_iso(),
-        "updatedAt": tweet.get("updated_at") or tweet.get("inserted_at") or utc_now_iso(),
+        "createdAt": tweet.get("inserted_at") or tweet.get("created_at") or now or utc_now_iso(),
+        "updatedAt": tweet.get("updated_at") or tweet.get("inserted_at") or now or utc_now_iso(),
     }
 
 
-def get_signal(db_path: str, signal_id: str) -> dict[str, Any] | None:
-    """Get a specific signal by ID (tweet_id)."""
-    tweet = get_tweet(db_path, signal_id)
+def get_signal(db_path: str, signal_id: str, conn: Any = None) -> dict[str, Any] | None:
+    """Get a specific signal by ID (tweet_id).
+    
+    ``conn`` lends an open connection (e.g. from the API pool) instead of opening one.
+    """
+    tweet = get_tweet(db_path, signal_id, conn=conn)
     if not tweet:
         return None
     return _tweet_to_signal(dict(tweet))
 
 
+def _signal_update_clauses(updates: dict[str, Any]) -> tuple[list[str], list[str | None]]:
+    """Build the SET clauses and parameters for a signal update."""
+    set_clauses: list[str] = []
+    params: list[str | None] = []
+    
+    if "status" in updates:
+        # Map status back to database fields
+        status = updates["status"]
+        if status == "active":
+            # Set salience if not set
+            set_clauses.append("salience = COALESCE(salience, 50.0)")
+        elif status == "paused":
+            # Clear salience
+            set_clauses.append("salience = NULL")
+        elif status == "inactive":
+            # Set notified_at
+            set_clauses.append("notified_at = ?")
+            params.append(utc_now_iso())
+        elif status == "error":
+            # Clear category
+            set_clauses.append("category = NULL")
+    
+    if "tags" in updates:
+        set_clauses.append("tags = ?")
+        params.append(json.dumps(updates["tags"]) if updates["tags"] else None)
+    
+    if "name" in updates:
+        set_clauses.append("author_username = ?")
+        params.append(updates["name"])
+    
+    if "source" in updates:
+        set_clauses.append("source = ?")
+        params.append(updates["source"])
+    
+    # Always update updated_at
+    set_clauses.append("updated_at = ?")
+    params.append(utc_now_iso())
+    
+    return set_clauses, params
+
+
 def update_signal(db_path: str, signal_id: str, updates: dict[str, Any]) -> dict[str, Any] | None:
     """Update a signal (tweet).
     
@@ -2614,41 +2964,7 @@ def update_signal(db_path: str, signal_id: str, updates: dict[str, Any]) -> dict
     conn = connect(db_path)
     try:
         # Build UPDATE statement
-        set_clauses: list[str] = []
-        params: list[str | None] = []
-        
-        if "status" in updates:
-            # Map status back to database fields
-            status = updates["status"]
-            if status == "active":
-                # Set salience if not set
-                set_clauses.append("salience = COALESCE(salience, 50.0)")
-            elif status == "paused":
-                # Clear salience
-                set_clauses.append("salience = NULL")
-            elif status == "inactive":
-                # Set notified_at
-                set_clauses.append("notified_at = ?")
-                params.append(utc_now_iso())
-            elif status == "error":
-                # Clear category
-                set_clauses.append("category = NULL")
-        
-        if "tags" in updates:
-            set_clauses.append("tags = ?")
-            params.append(json.dumps(updates["tags"]) if updates["tags"] else None)
-        
-        if "name" in updates:
-            set_clauses.append("author_username = ?")
-            params.append(updates["name"])
-        
-        if "source" in updates:
-            set_clauses.append("source = ?")
-            params.append(updates["source"])
-        
-        # Always update updated_at
-        set_clauses.append("updated_at = ?")
-        params.append(utc_now_iso())
+        set_clauses, params = _signal_update_clauses(updates)
         
         if not set_clauses:
             # No updates provided
@@ -2671,6 +2987,31 @@ def update_signal(db_path: str, signal_id: str, updates: dict[str, Any]) -> dict
         conn.close()
 
 
+def bulk_update_signals(db_path: str, signal_ids: list[str], updates: dict[str, Any]) -> int:
+    """Apply the same update to many signals in one statement and transaction.
+    
+    Callers chunk ``signal_ids`` to stay under SQLite's bound-parameter limit.
+    
+    Returns: number of rows updated
+    """
+    if not signal_ids:
+        return 0
+    conn = connect(db_path)
+    try:
+        set_clauses, params = _signal_update_clauses(updates)
+        placeholders = ", ".join("?" for _ in signal_ids)
+        update_sql = f"""
+            UPDATE tweets
+            SET {', '.join(set_clauses)}
+            WHERE tweet_id IN ({placeholders});
+        """
+        with conn:
+            cursor = conn.execute(update_sql, [*params, *signal_ids])
+        return int(cursor.rowcount)
+    finally:
+        conn.close()
+
+
 def delete_signal(db_path: str, signal_id: str) -> bool:
     """Delete a signal (tweet) by ID.
     
@@ -2680,7 +3021,41 @@ def delete_signal(db_path: str, signal_id: str) -> bool:
     try:
         with conn:
             cursor = conn.execute("DELETE FROM tweets WHERE tweet_id = ?;", (signal_id,))
-            return cursor.rowcount > 0
+        return cursor.rowcount > 0
+    finally:
+        conn.close()
+
+
+def bulk_delete_signals(db_path: str, signal_ids: list[str]) -> int:
+    """Delete many signals in one statement and transaction.
+    
+    Callers chunk ``signal_ids`` to stay under SQLite's bound-parameter limit.
+    
+    Returns: number of rows deleted
+    """
+    if not signal_ids:
+        return 0
+    conn = connect(db_path)
+    try:
+        placeholders = ", ".join("?" for _ in signal_ids)
+        with conn:
+            cursor = conn.execute(f"DELETE FROM tweets WHERE tweet_id IN ({placeholders});", signal_ids)
+        return int(cursor.rowcount)
+    finally:
+        conn.close()
+
+
+def get_signals_fingerprint(db_path: str) -> str:
+    """Return a cheap change marker for the signals (tweets) table.
+    
+    Reads the persisted signals_version counter, which triggers bump on every
+    insert, update or delete of a tweet (including notifications) from any
+    process. Used for ETag validation on polled signal endpoints.
+    """
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT version FROM signals_version WHERE id = 1;").fetchone()
+        return str(row[0]) if row else "0"
     finally:
         conn.close()
 
@@ -2744,30 +3119,34 @@ def create_signal(db_path: str, name: str, source: str, status: str, tags: list[
         
         tags_json = json.dumps(tags) if tags else None
         
+        epoch_column, epoch_value = _created_at_epoch_insert(db_path)
+        params: tuple[Any, ...] = (
+            tweet_id,
+            source,
+            f"Signal: {name}",  # Placeholder text
+            name,
+            "signal_user",
+            now,
+            now,
+            now,
+            category,
+            salience,
+            notified_at,
+            tags_json,
+            "en",
+        )
+        if epoch_column:
+            params += (now,)
         with conn:
             conn.execute(
-                """
+                f"""
                 INSERT INTO tweets (
                     tweet_id, source, text, author_username, author_id,
                     created_at, inserted_at, updated_at,
-                    category, salience, notified_at, tags, lang
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+                    category, salience, notified_at, tags, lang{epoch_column}
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?{epoch_value});
                 """,
-                (
-                    tweet_id,
-                    source,
-                    f"Signal: {name}",  # Placeholder text
-                    name,
-                    "signal_user",
-                    now,
-                    now,
-                    now,
-                    category,
-                    salience,
-                    notified_at,
-                    tags_json,
-                    "en",
-                ),
+                params,
             )
         
         return _tweet_to_signal({
@@ -2875,17 +3254,17 @@ def list_snapshots(
         conn.close()
 
 
-def get_snapshot(db_path: str, snapshot_id: str) -> dict[str, Any] | None:
+def get_snapshot(db_path: str, snapshot_id: str, conn: Any = None) -> dict[str, Any] | None:
     """Get a specific snapshot by ID.
     
     Args:
         db_path: Path to SQLite database
         snapshot_id: Snapshot ID
+        conn: Optional open connection to use (e.g. from the API pool)
     
     Returns: Snapshot dict or None if not found
     """
-    conn = connect(db_path)
-    try:
+    with _borrowed_connection(db_path, conn) as conn:
         cur = conn.execute(
             """
             SELECT 
@@ -2914,8 +3293,6 @@ def get_snapshot(db_path: str, snapshot_id: str) -> dict[str, Any] | None:
             "sizeKb": row["size_kb"],
             "createdAt": row["created_at"],
         }
-    finally:
-        conn.close()
 
 
 def create_snapshot(
@@ -2938,7 +3315,7 @@ def create_snapshot(
     
     conn = connect(db_path)
     try:
-        snapshot_id = str(uuid.uuid4())
+        snapshot_id = uuid.uuid4().hex
         now = utc_now_iso()
         status = "ready" if file_path else "processing"
         
@@ -3170,6 +3547,66 @@ def get_artifact_relationships(
         conn.close()
 
 
+def get_relationships_for_artifacts(
+    db_path: str,
+    artifact_ids: list[int],
+    min_confidence: float = 0.0,
+) -> list[dict[str, Any]]:
+    """Get relationships touching any of ``artifact_ids`` (either direction).
+    
+    Same row shape as ``get_artifact_relationships(direction="both")``, but one
+    query per batch of ids instead of one per artifact.
+    
+    Args:
+        db_path: Path to SQLite database
+        artifact_ids: Artifact IDs to expand
+        min_confidence: Minimum confidence threshold
+    
+    Returns:
+        List of relationship dictionaries, highest confidence first per batch
+    """
+    if not artifact_ids:
+        return []
+    # Each id is bound twice; stay under SQLite's 999 bound-parameter floor
+    batch_size = 400
+    conn = connect(db_path)
+    try:
+        relationships = []
+        for start in range(0, len(artifact_ids), batch_size):
+            batch = artifact_ids[start:start + batch_size]
+            placeholders = ", ".join("?" for _ in batch)
+            cur = conn.execute(
+                f"""
+                SELECT ar.*,
+                       a_source.title as source_title,
+                       a_source.source as source_source,
+                       a_source.type as source_type,
+                       a_target.title as target_title,
+                       a_target.source as target_source,
+                       a_target.type as target_type
+                FROM artifact_relationships ar
+                JOIN artifacts a_source ON ar.source_artifact_id = a_source.id
+                JOIN artifacts a_target ON ar.target_artifact_id = a_target.id
+                WHERE (ar.source_artifact_id IN ({placeholders})
+                       OR ar.target_artifact_id IN ({placeholders}))
+                  AND ar.confidence >= ?
+                ORDER BY ar.confidence DESC
+                """,
+                (*batch, *batch, min_confidence),
+            )
+            for row in cur.fetchall():
+                rel = dict(row)
+                metadata_json = rel.pop("metadata_json", None)
+                try:
+                    rel["metadata"] = json.loads(metadata_json) if metadata_json else {}
+                except Exception:
+                    rel["metadata"] = {}
+                relationships.append(rel)
+        return relationships
+    finally:
+        conn.close()
+
+
 def get_relationship_stats(db_path: str) -> dict[str, Any]:
     """Get statistics about artifact relationships.
     
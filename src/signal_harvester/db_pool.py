@@ -26,6 +26,7 @@ class ConnectionPool:
         max_overflow: Maximum connections beyond pool_size
         pool_timeout: Seconds to wait for available connection
         pool_recycle: Seconds before recycling a connection (-1 to disable)
+        read_only: Hand out autocommit, ``query_only`` connections for read paths
     """
     
     def __init__(
@@ -35,12 +36,14 @@ class ConnectionPool:
         max_overflow: int = 10,
         pool_timeout: float = 30.0,
         pool_recycle: int = 3600,
+        read_only: bool = False,
     ):
         self.db_path = db_path
         self.pool_size = pool_size
         self.max_overflow = max_overflow
         self.pool_timeout = pool_timeout
         self.pool_recycle = pool_recycle
+        self.read_only = read_only
         
         self._pool: Queue[tuple[sqlite3.Connection, float]] = Queue(maxsize=pool_size)
         self._overflow_count = 0
@@ -70,7 +73,8 @@ class ConnectionPool:
         conn = sqlite3.connect(
             self.db_path,
             timeout=10.0,
-            isolation_level="DEFERRED",  # Enable transaction support for rollback
+            # Readers skip the implicit BEGIN/COMMIT; writers keep rollback support
+            isolation_level=None if self.read_only else "DEFERRED",
             check_same_thread=False,  # Allow connection sharing across threads
         )
         conn.row_factory = sqlite3.Row
@@ -80,8 +84,13 @@ class ConnectionPool:
         conn.execute("PRAGMA synchronous=NORMAL;")
         conn.execute("PRAGMA foreign_keys=ON;")
         conn.execute("PRAGMA busy_timeout=5000;")
+        # Sorts and temp indexes for aggregate queries stay off disk
+        conn.execute("PRAGMA temp_store=MEMORY;")
         # Enable query optimization
         conn.execute("PRAGMA optimize;")
+        if self.read_only:
+            # Set last: journal_mode and optimize above may write
+            conn.execute("PRAGMA query_only=1;")
         
         with self._stats_lock:
             self._stats["created"] += 1
@@ -239,6 +248,7 @@ def init_pool(
     max_overflow: int = 10,
     pool_timeout: float = 30.0,
     pool_recycle: int = 3600,
+    read_only: bool = False,
 ) -> ConnectionPool:
     """Initialize global connection pool.
     
@@ -248,6 +258,7 @@ def init_pool(
         max_overflow: Additional connections allowed beyond pool_size (default: 10)
         pool_timeout: Seconds to wait for connection (default: 30)
         pool_recycle: Seconds before recycling connection (default: 3600, -1 to disable)
+        read_only: Create autocommit, ``query_only`` connections (default: False)
     
     Returns:
         Initialized ConnectionPool instance
@@ -259,6 +270,7 @@ def init_pool(
         max_overflow=max_overflow,
         pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
+        read_only=read_only,
     )
     return _global_pool
 
@@ -367,39 +367,34 @@ def compare_experiments(
     """
     conn = connect(db_path)
     try:
-        # Get latest run for each experiment
-        cur_a = conn.execute(
-            """
-            SELECT precision, recall, f1_score, accuracy, artifact_count
-            FROM experiment_runs
-            WHERE experiment_id = ? AND status = 'completed'
-            ORDER BY completed_at DESC
-            LIMIT 1
-            """,
-            (experiment_id_a,)
-        )
-        row_a = cur_a.fetchone()
-        
-        cur_b = conn.execute(
+        # Latest completed run of both experiments in one statement
+        cur = conn.execute(
             """
-            SELECT precision, recall, f1_score, accuracy, artifact_count
-            FROM experiment_runs
-            WHERE experiment_id = ? AND status = 'completed'
-            ORDER BY completed_at DESC
-            LIMIT 1
+            SELECT experiment_id, precision, recall, f1_score, accuracy, artifact_count
+            FROM (
+                SELECT experiment_id, precision, recall, f1_score, accuracy, artifact_count,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY experiment_id ORDER BY completed_at DESC
+                       ) AS run_rank
+                FROM experiment_runs
+                WHERE experiment_id IN (?, ?) AND status = 'completed'
+            ) AS latest_runs
+            WHERE run_rank = 1
             """,
-            (experiment_id_b,)
+            (experiment_id_a, experiment_id_b)
         )
-        row_b = cur_b.fetchone()
+        latest = {}
+        for row in cur.fetchall():
+            data = _row_to_mapping(row)
+            latest[int(data["experiment_id"])] = data
         
-        if not row_a or not row_b:
+        data_a = latest.get(experiment_id_a)
+        data_b = latest.get(experiment_id_b)
+        if not data_a or not data_b:
             return {
                 "error": "One or both experiments have no completed runs"
             }
         
-        data_a = _row_to_mapping(row_a)
-        data_b = _row_to_mapping(row_b)
-        
         # Calculate deltas
         precision_delta = (data_b["precision"] or 0.0) - (data_a["precision"] or 0.0)
         recall_delta = (data_b["recall"] or 0.0) - (data_a["recall"] or 0.0)
@@ -499,6 +494,62 @@ def add_discovery_label(
         conn.close()
 
 
+def add_discovery_labels_bulk(db_path: str, labels: list[dict[str, Any]]) -> int:
+    """
+    Add or update many ground truth labels in one statement and transaction.
+    
+    Callers chunk ``labels`` to stay under SQLite's bound-parameter limit.
+    
+    Args:
+        db_path: Path to SQLite database
+        labels: Dicts with ``artifact_id`` and ``label`` plus optional
+            ``confidence``, ``annotator`` and ``notes``
+        
+    Returns:
+        Number of labels written
+    """
+    # Last label per artifact wins, as with repeated add_discovery_label calls
+    by_artifact = {int(item["artifact_id"]): item for item in labels}
+    if not by_artifact:
+        return 0
+    
+    now = utc_now_iso()
+    params: list[Any] = []
+    for artifact_id, item in by_artifact.items():
+        params.extend((
+            artifact_id,
+            item["label"],
+            item.get("confidence", 1.0),
+            item.get("annotator"),
+            item.get("notes"),
+            now,
+            now,
+        ))
+    placeholders = ", ".join("(?, ?, ?, ?, ?, ?, ?)" for _ in by_artifact)
+    
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                f"""
+                INSERT INTO discovery_labels
+                (artifact_id, label, confidence, annotator, notes, created_at, updated_at)
+                VALUES {placeholders}
+                ON CONFLICT(artifact_id) DO UPDATE SET
+                    label = excluded.label,
+                    confidence = excluded.confidence,
+                    annotator = excluded.annotator,
+                    notes = excluded.notes,
+                    updated_at = excluded.updated_at
+                """,
+                tuple(params),
+            )
+        log.info("Upserted %d labels", len(by_artifact))
+        return len(by_artifact)
+    finally:
+        conn.close()
+
+
 def get_labeled_artifacts(db_path: str, label: str | None = None) -> list[dict[str, Any]]:
     """
     Get all labeled artifacts, optionally filtered by label.
@@ -14,14 +14,15 @@ import asyncio
 import os
 import shutil
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 
 from pydantic import BaseModel, Field
 
 from .config import get_config
 from .db_connection import get_database_connection
+from .db_pool import ConnectionPool, get_pool
 from .logger import get_logger
 
 log = get_logger(__name__)
@@ -58,6 +59,24 @@ class HealthCheckResponse(BaseModel):
 # Application start time for uptime tracking
 _start_time = time.time()
 
+# (epoch second, aware UTC datetime); probes share one object per second
+_utc_now_cache: tuple[int, datetime] = (-1, datetime.fromtimestamp(0, tz=timezone.utc))
+
+
+def _utc_now(clock: Callable[[], float] = time.time) -> datetime:
+    """Current UTC time at second resolution, built at most once a second."""
+    global _utc_now_cache
+    second = int(clock())
+    if second != _utc_now_cache[0]:
+        _utc_now_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc))
+    return _utc_now_cache[1]
+
+# Seconds a healthy database probe is reused; probes often arrive every few seconds
+DATABASE_HEALTH_TTL_SECONDS = 5.0
+
+# Last healthy probe per database URL (monotonic timestamp, result)
+_database_health_cache: dict[str, tuple[float, ComponentHealth]] = {}
+
 
 def _row_value(row: Any, key: str | None = None) -> Any:
     """Extract a scalar value from sqlite3.Row, tuple, or dict results."""
@@ -79,36 +98,63 @@ def _row_value(row: Any, key: str | None = None) -> Any:
         return row
 
 
+def _sqlite_pool_for(settings: Any) -> ConnectionPool | None:
+    """Return the API's SQLite connection pool when it serves the configured database."""
+    if not settings.app.database.is_sqlite:
+        return None
+    try:
+        pool = get_pool()
+    except RuntimeError:
+        return None
+    return pool if pool.db_path == settings.app.database_path else None
+
+
+def _probe_database(db_conn: Any) -> tuple[HealthStatus, str]:
+    """Run the connectivity and latency queries on an open connection."""
+    result = db_conn.execute("SELECT 1 AS result;").fetchone()
+
+    if result is None or _row_value(result, "result") != 1:
+        return HealthStatus.UNHEALTHY, "Database query returned unexpected result"
+
+    query_start = time.time()
+    count_row = db_conn.execute("SELECT COUNT(*) AS total FROM artifacts;").fetchone()
+    query_duration = time.time() - query_start
+    if query_duration > 1.0:
+        return HealthStatus.DEGRADED, f"Database queries slow ({query_duration:.2f}s)"
+    if count_row is None:
+        return HealthStatus.DEGRADED, "Database count query returned no result"
+    return HealthStatus.HEALTHY, "Database is healthy"
+
+
 async def check_database_health() -> ComponentHealth:
     """Check database connectivity and performance.
 
+    Reuses the API's SQLite connection pool when one is initialized, so
+    frequent probes don't open a fresh connection each time. A healthy
+    result is reused for ``DATABASE_HEALTH_TTL_SECONDS``; failures are
+    re-probed on the next call.
+
     Returns:
         ComponentHealth for database
     """
     start_time = time.time()
-    status = HealthStatus.HEALTHY
-    message = "Database is healthy"
 
     db_conn = None
+    cache_key: str | None = None
     try:
         settings = get_config()
-        db_conn = get_database_connection(settings.app.database)
-
-        result = db_conn.execute("SELECT 1 AS result;").fetchone()
-
-        if result is None or _row_value(result, "result") != 1:
-            status = HealthStatus.UNHEALTHY
-            message = "Database query returned unexpected result"
+        cache_key = settings.app.database.url
+        cached = _database_health_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DATABASE_HEALTH_TTL_SECONDS:
+            return cached[1]
+
+        pool = _sqlite_pool_for(settings)
+        if pool is not None:
+            with pool.connection() as pooled_conn:
+                status, message = _probe_database(pooled_conn)
         else:
-            query_start = time.time()
-            count_row = db_conn.execute("SELECT COUNT(*) AS total FROM artifacts;").fetchone()
-            query_duration = time.time() - query_start
-            if query_duration > 1.0:
-                status = HealthStatus.DEGRADED
-                message = f"Database queries slow ({query_duration:.2f}s)"
-            elif count_row is None:
-                message = "Database count query returned no result"
-                status = HealthStatus.DEGRADED
+            db_conn = get_database_connection(settings.app.database)
+            status, message = _probe_database(db_conn)
 
     except Exception as e:
         status = HealthStatus.UNHEALTHY
@@ -120,13 +166,19 @@ async def check_database_health() -> ComponentHealth:
 
     duration_ms = (time.time() - start_time) * 1000
 
-    return ComponentHealth(
+    component = ComponentHealth(
         name="database",
         status=status,
         message=message,
-        last_check=datetime.utcnow(),
+        last_check=_utc_now(),
         check_duration_ms=duration_ms,
     )
+    if cache_key is not None:
+        if status == HealthStatus.HEALTHY:
+            _database_health_cache[cache_key] = (time.monotonic(), component)
+        else:
+            _database_health_cache.pop(cache_key, None)
+    return component
 
 
 async def check_redis_health() -> ComponentHealth:
@@ -183,7 +235,7 @@ async def check_redis_health() -> ComponentHealth:
         name="redis",
         status=status,
         message=message,
-        last_check=datetime.utcnow(),
+        last_check=_utc_now(),
         check_duration_ms=duration_ms,
     )
 
@@ -224,7 +276,7 @@ async def check_disk_space() -> ComponentHealth:
         name="disk_space",
         status=status,
         message=message,
-        last_check=datetime.utcnow(),
+        last_check=_utc_now(),
         check_duration_ms=duration_ms,
     )
 
@@ -270,7 +322,7 @@ async def check_memory_usage() -> ComponentHealth:
         name="memory",
         status=status,
         message=message,
-        last_check=datetime.utcnow(),
+        last_check=_utc_now(),
         check_duration_ms=duration_ms,
     )
 
@@ -291,7 +343,7 @@ async def check_liveness() -> HealthCheckResponse:
         name="process",
         status=HealthStatus.HEALTHY,
         message="Application process is running",
-        last_check=datetime.utcnow(),
+        last_check=_utc_now(),
         check_duration_ms=0.0,
     )
 
@@ -299,7 +351,7 @@ async def check_liveness() -> HealthCheckResponse:
         status=HealthStatus.HEALTHY,
         uptime_seconds=uptime,
         components=[component],
-        timestamp=datetime.utcnow(),
+        timestamp=_utc_now(),
     )
 
 
@@ -334,7 +386,7 @@ async def check_readiness() -> HealthCheckResponse:
                     name="unknown",
                     status=HealthStatus.UNHEALTHY,
                     message=f"Health check error: {str(check)}",
-                    last_check=datetime.utcnow(),
+                    last_check=_utc_now(),
                     check_duration_ms=0.0,
                 )
             )
@@ -352,7 +404,7 @@ async def check_readiness() -> HealthCheckResponse:
         status=overall_status,
         uptime_seconds=uptime,
         components=components,
-        timestamp=datetime.utcnow(),
+        timestamp=_utc_now(),
     )
 
 
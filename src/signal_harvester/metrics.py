@@ -409,13 +409,30 @@ def track_db_query(operation: str, table: str):
     return decorator
 
 
+# Seconds a rendered exposition is reused; scrapes arrive every ~15s, so
+# concurrent scrapers share one render instead of each walking the registry
+METRICS_RENDER_TTL_SECONDS = 1.0
+
+# (monotonic render time, exposition bytes)
+_rendered_metrics: tuple[float, bytes] = (float("-inf"), b"")
+
+
 def get_metrics() -> bytes:
     """Get current metrics in Prometheus exposition format.
 
+    The rendered text is reused for ``METRICS_RENDER_TTL_SECONDS``.
+
     Returns:
         Metrics data in Prometheus text format
     """
-    return generate_latest()
+    global _rendered_metrics
+    rendered_at, data = _rendered_metrics
+    now = time.monotonic()
+    if now - rendered_at < METRICS_RENDER_TTL_SECONDS:
+        return data
+    data = generate_latest()
+    _rendered_metrics = (now, data)
+    return data
 
 
 # ============================================================================
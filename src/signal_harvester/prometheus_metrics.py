@@ -7,7 +7,8 @@ performance, resource usage, and business metrics.
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING, Callable
+from functools import lru_cache
+from typing import Any
 
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -17,13 +18,8 @@ from prometheus_client import (
     Histogram,
     generate_latest,
 )
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
 from starlette.responses import Response
-
-if TYPE_CHECKING:
-    from collections.abc import Awaitable
-
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # ============================================================================
 # HTTP Metrics
@@ -352,43 +348,78 @@ backup_total_size_bytes = Gauge(
 # Middleware
 # ============================================================================
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
+# Resolved label children, keyed by label values. ``Metric.labels()`` builds and
+# hashes a label tuple and takes a lock on every call; the middleware hits the
+# same few combinations on every request, so it looks children up here instead.
+_in_progress_children: dict[tuple[str, str], Any] = {}
+_request_children: dict[tuple[str, str, int], tuple[Any, Any]] = {}
+
+
+def _in_progress_child(method: str, endpoint: str) -> Any:
+    key = (method, endpoint)
+    child = _in_progress_children.get(key)
+    if child is None:
+        child = http_requests_in_progress.labels(method=method, endpoint=endpoint)
+        _in_progress_children[key] = child
+    return child
+
+
+def _request_children_for(method: str, endpoint: str, status: int) -> tuple[Any, Any]:
+    key = (method, endpoint, status)
+    children = _request_children.get(key)
+    if children is None:
+        children = (
+            http_requests_total.labels(method=method, endpoint=endpoint, status=status),
+            http_request_duration_seconds.labels(method=method, endpoint=endpoint, status=status),
+        )
+        _request_children[key] = children
+    return children
+
+
+class PrometheusMiddleware:
     """Middleware to collect HTTP request metrics for Prometheus."""
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and collect metrics."""
         # Skip metrics endpoint to avoid recursion
-        if request.url.path == "/metrics/prometheus":
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] == "/metrics/prometheus":
+            await self.app(scope, receive, send)
+            return
 
-        method = request.method
-        endpoint = request.url.path
+        method = scope["method"]
+        endpoint = scope["path"]
 
         # Normalize endpoint for metrics (remove IDs)
         endpoint_normalized = self._normalize_endpoint(endpoint)
 
         # Track in-progress requests
-        http_requests_in_progress.labels(method=method, endpoint=endpoint_normalized).inc()
+        in_progress = _in_progress_child(method, endpoint_normalized)
+        in_progress.inc()
 
         start_time = time.time()
         status = 500  # Default to error if exception occurs
 
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            status = response.status_code
-            return response
+            await self.app(scope, receive, send_with_status)
         finally:
             # Record metrics
             duration = time.time() - start_time
-            http_requests_in_progress.labels(method=method, endpoint=endpoint_normalized).dec()
-            http_requests_total.labels(method=method, endpoint=endpoint_normalized, status=status).inc()
-            http_request_duration_seconds.labels(
-                method=method, endpoint=endpoint_normalized, status=status
-            ).observe(duration)
+            in_progress.dec()
+            requests_total, request_duration = _request_children_for(method, endpoint_normalized, status)
+            requests_total.inc()
+            request_duration.observe(duration)
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_endpoint(endpoint: str) -> str:
         """Normalize endpoint by removing IDs and query parameters."""
         # Remove query parameters
@@ -11,9 +11,11 @@ This module provides a production-ready rate limiter that supports:
 from __future__ import annotations
 
 import hashlib
+import os
 import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Any
+from typing import Hashable
 
 from pydantic import BaseModel, Field
 
@@ -84,6 +86,22 @@ class RateLimitResult(BaseModel):
     reset_at: int = Field(description="Unix timestamp when limit resets")
 
 
+class _TokenBucket:
+    """Token bucket state for one client.
+
+    Slotted: about a third of the memory of the equivalent dict, and
+    attribute reads skip the string-keyed hash lookups.
+    """
+
+    __slots__ = ("tokens", "last_check", "max_tokens", "refill_rate")
+
+    def __init__(self, tokens: float, last_check: float, max_tokens: int, refill_rate: float) -> None:
+        self.tokens = tokens
+        self.last_check = last_check
+        self.max_tokens = max_tokens
+        self.refill_rate = refill_rate
+
+
 class InMemoryRateLimiter:
     """Simple in-memory rate limiter fallback.
 
@@ -91,67 +109,80 @@ class InMemoryRateLimiter:
     Used when Redis is unavailable.
     """
 
-    def __init__(self, cleanup_interval: int = 3600):
-        self.buckets: dict[str, dict[str, Any]] = {}
+    def __init__(self, cleanup_interval: int = 3600, max_buckets: int = 50_000):
+        # Kept in least-recently-checked order, so stale buckets sit at the front
+        self.buckets: OrderedDict[Hashable, _TokenBucket] = OrderedDict()
         self.cleanup_interval = cleanup_interval
+        self.max_buckets = max_buckets
         self.last_cleanup = time.time()
 
-    def _cleanup_old_buckets(self) -> None:
-        """Remove expired buckets to prevent memory leaks."""
-        now = time.time()
+    def sweep(self, now: float | None = None) -> int:
+        """Remove buckets idle for longer than ``cleanup_interval``.
+
+        Returns:
+            Number of buckets removed
+        """
+        if now is None:
+            now = time.time()
+        expired = 0
+        while self.buckets:
+            bucket = next(iter(self.buckets.values()))
+            if now - bucket.last_check <= self.cleanup_interval:
+                break
+            self.buckets.popitem(last=False)
+            expired += 1
+        self.last_cleanup = now
+        if expired:
+            log.debug(f"Cleaned up {expired} expired rate limit buckets")
+        return expired
+
+    def _cleanup_old_buckets(self, now: float) -> None:
+        """Sweep expired buckets unless a sweep ran within ``cleanup_interval``."""
         if now - self.last_cleanup > self.cleanup_interval:
-            expired_keys = [
-                key for key, bucket in self.buckets.items() if now - bucket["last_check"] > self.cleanup_interval
-            ]
-            for key in expired_keys:
-                del self.buckets[key]
-            self.last_cleanup = now
-            if expired_keys:
-                log.debug(f"Cleaned up {len(expired_keys)} expired rate limit buckets")
+            self.sweep(now)
 
     def check_rate_limit(
         self,
-        key: str,
+        key: Hashable,
         max_requests: int,
         window_seconds: int,
     ) -> tuple[bool, int, int]:
         """Check if request is within rate limit.
 
         Args:
-            key: Unique identifier for the client
+            key: Unique identifier for the client (string or tuple)
             max_requests: Maximum requests allowed in window
             window_seconds: Time window in seconds
 
         Returns:
             Tuple of (allowed, retry_after_seconds, remaining_tokens)
         """
-        self._cleanup_old_buckets()
-
         now = time.time()
-
-        if key not in self.buckets:
-            self.buckets[key] = {
-                "tokens": max_requests - 1,
-                "last_check": now,
-                "max_tokens": max_requests,
-                "refill_rate": max_requests / window_seconds,
-            }
+        self._cleanup_old_buckets(now)
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = _TokenBucket(max_requests - 1, now, max_requests, max_requests / window_seconds)
+            # Bound memory against floods of unique client keys
+            while len(self.buckets) > self.max_buckets:
+                self.buckets.popitem(last=False)
             return True, 0, max_requests - 1
 
-        bucket = self.buckets[key]
-        time_passed = now - bucket["last_check"]
+        self.buckets.move_to_end(key)
+        time_passed = now - bucket.last_check
 
         # Refill tokens based on time passed
-        bucket["tokens"] = min(bucket["max_tokens"], bucket["tokens"] + time_passed * bucket["refill_rate"])
+        tokens = min(bucket.max_tokens, bucket.tokens + time_passed * bucket.refill_rate)
 
-        bucket["last_check"] = now
+        bucket.last_check = now
 
-        if bucket["tokens"] >= 1:
-            bucket["tokens"] -= 1
-            return True, 0, int(bucket["tokens"])
+        if tokens >= 1:
+            bucket.tokens = tokens - 1
+            return True, 0, int(bucket.tokens)
         else:
+            bucket.tokens = tokens
             # Calculate retry after (when bucket will have 1 token)
-            retry_after = int((1 - bucket["tokens"]) / bucket["refill_rate"])
+            retry_after = int((1 - tokens) / bucket.refill_rate)
             return False, retry_after, 0
 
 
@@ -310,6 +341,29 @@ class DistributedRateLimiter:
         self.memory_limiter = InMemoryRateLimiter(cleanup_interval=self.config.cleanup_interval)
         self.use_redis = False
         log.info("Using in-memory rate limiter (not suitable for horizontal scaling)")
+        # uvicorn/gunicorn read WEB_CONCURRENCY for their worker count; each
+        # worker process keeps its own buckets
+        workers = os.getenv("WEB_CONCURRENCY", "")
+        if workers.isdigit() and int(workers) > 1:
+            log.warning(
+                f"In-memory rate limits are enforced per worker: with {workers} workers "
+                f"clients get up to {workers}x the configured limit. Enable Redis for shared limits."
+            )
+
+    @property
+    def scope(self) -> str:
+        """``"distributed"`` when limits are shared via Redis, else ``"per-worker"``."""
+        return "distributed" if self.use_redis else "per-worker"
+
+    def sweep(self) -> int:
+        """Drop expired in-memory buckets; Redis expires its own keys.
+
+        Returns:
+            Number of buckets removed
+        """
+        if self.memory_limiter is None:
+            return 0
+        return self.memory_limiter.sweep()
 
     def _get_rate_limit_params(self, tier: RateLimitTier) -> tuple[int, int]:
         """Get rate limit parameters for tier."""
@@ -349,16 +403,16 @@ class DistributedRateLimiter:
             )
 
         max_requests, window_seconds = self._get_rate_limit_params(tier)
-        key = f"{tier.value}:{identifier}"
 
         try:
             if self.use_redis and self.redis_limiter:
                 allowed, retry_after, remaining = self.redis_limiter.check_rate_limit(
-                    key, max_requests, window_seconds
+                    f"{tier.value}:{identifier}", max_requests, window_seconds
                 )
             elif self.memory_limiter:
+                # Tuple key: no per-request string formatting for the in-process buckets
                 allowed, retry_after, remaining = self.memory_limiter.check_rate_limit(
-                    key, max_requests, window_seconds
+                    (tier, identifier), max_requests, window_seconds
                 )
             else:
                 # Fallback to always allow (shouldn't happen)
@@ -9,7 +9,7 @@ import numpy as np
 
 from .db import (
     create_artifact_relationship,
-    get_artifact_relationships,
+    get_relationships_for_artifacts,
     list_artifacts_for_scoring,
 )
 from .embeddings import get_artifact_embedding
@@ -381,24 +381,25 @@ def get_citation_graph(
     Returns:
         Citation graph with nodes and edges
     """
-    nodes = {}
+    nodes: dict[int, dict[str, Any]] = {}
     edges = []
-    visited = set()
-    
-    def traverse(current_id: int, current_depth: int) -> None:
-        if current_depth > depth or current_id in visited:
-            return
-        
-        visited.add(current_id)
+    seen_edges: set[Any] = set()
+    
+    # Breadth-first: one batched query per level instead of one per artifact.
+    # Levels 0..depth are expanded, so edges reach up to depth + 1 hops out.
+    visited = {artifact_id}
+    frontier = [artifact_id]
+    for _ in range(depth + 1):
+        if not frontier:
+            break
         
-        # Get relationships
-        relationships = get_artifact_relationships(
+        relationships = get_relationships_for_artifacts(
             db_path=db_path,
-            artifact_id=current_id,
-            direction="both",
+            artifact_ids=frontier,
             min_confidence=min_confidence,
         )
         
+        next_frontier = []
         for rel in relationships:
             source_id = rel["source_artifact_id"]
             target_id = rel["target_artifact_id"]
@@ -420,23 +421,25 @@ def get_citation_graph(
                     "type": rel.get("target_type", ""),
                 }
             
-            # Add edge
-            edges.append({
-                "source": source_id,
-                "target": target_id,
-                "relationship_type": rel["relationship_type"],
-                "confidence": rel["confidence"],
-                "detection_method": rel.get("detection_method", ""),
-            })
+            # An edge between two expanded artifacts comes back from both ends
+            edge_key = rel.get("id", (source_id, target_id, rel["relationship_type"]))
+            if edge_key not in seen_edges:
+                seen_edges.add(edge_key)
+                edges.append({
+                    "source": source_id,
+                    "target": target_id,
+                    "relationship_type": rel["relationship_type"],
+                    "confidence": rel["confidence"],
+                    "detection_method": rel.get("detection_method", ""),
+                })
             
-            # Recurse to next depth
-            if current_id == source_id:
-                traverse(target_id, current_depth + 1)
-            else:
-                traverse(source_id, current_depth + 1)
-    
-    # Start traversal
-    traverse(artifact_id, 0)
+            # Queue unseen neighbours for the next level
+            for neighbour_id in (source_id, target_id):
+                if neighbour_id not in visited:
+                    visited.add(neighbour_id)
+                    next_frontier.append(neighbour_id)
+        
+        frontier = next_frontier
     
     return {
         "root_artifact_id": artifact_id,
@@ -13,20 +13,21 @@ import hashlib
 import hmac
 import secrets
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
-from fastapi import Header, HTTPException, Request, Response
+from fastapi import Header, HTTPException, Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logger import get_logger
 
 log = get_logger(__name__)
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """Middleware to add security headers to all responses.
 
     Adds headers for:
@@ -45,21 +46,46 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         hsts_include_subdomains: bool = True,
         enable_csp: bool = True,
     ):
-        super().__init__(app)
+        self.app = app
         self.hsts_max_age = hsts_max_age
         self.hsts_include_subdomains = hsts_include_subdomains
         self.enable_csp = enable_csp
+        # Raw (name, value) pairs are built once; each response just splices them in
+        self._headers = self._build_headers(is_https=False)
+        self._https_headers = self._build_headers(is_https=True)
+        self._header_names = frozenset(name for name, _ in self._headers)
+        self._https_header_names = frozenset(name for name, _ in self._https_headers)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Add security headers to response."""
-        response = await call_next(request)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope.get("scheme") == "https":
+            security_headers, header_names = self._https_headers, self._https_header_names
+        else:
+            security_headers, header_names = self._headers, self._header_names
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # These headers always win over ones set by the route
+                raw = [item for item in message.get("headers", ()) if item[0].lower() not in header_names]
+                raw.extend(security_headers)
+                message["headers"] = raw
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _build_headers(self, is_https: bool) -> list[tuple[bytes, bytes]]:
+        headers: list[tuple[str, str]] = []
 
         # HSTS header (only for HTTPS)
-        if request.url.scheme == "https":
+        if is_https:
             hsts_value = f"max-age={self.hsts_max_age}"
             if self.hsts_include_subdomains:
                 hsts_value += "; includeSubDomains"
-            response.headers["Strict-Transport-Security"] = hsts_value
+            headers.append(("Strict-Transport-Security", hsts_value))
 
         # Content Security Policy
         if self.enable_csp:
@@ -75,24 +101,24 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 "base-uri 'self'",
                 "form-action 'self'",
             ]
-            response.headers["Content-Security-Policy"] = "; ".join(csp_directives)
+            headers.append(("Content-Security-Policy", "; ".join(csp_directives)))
 
         # Clickjacking protection
-        response.headers["X-Frame-Options"] = "DENY"
+        headers.append(("X-Frame-Options", "DENY"))
 
         # MIME sniffing protection
-        response.headers["X-Content-Type-Options"] = "nosniff"
+        headers.append(("X-Content-Type-Options", "nosniff"))
 
         # XSS protection (deprecated but still useful for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+        headers.append(("X-XSS-Protection", "1; mode=block"))
 
         # Referrer policy
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        headers.append(("Referrer-Policy", "strict-origin-when-cross-origin"))
 
         # Permissions policy (restrict browser features)
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        headers.append(("Permissions-Policy", "geolocation=(), microphone=(), camera=()"))
 
-        return response
+        return [(name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers]
 
 
 class RateLimitExceeded(HTTPException):
@@ -110,54 +136,72 @@ class InMemoryRateLimiter:
     For production, consider using Redis-backed rate limiting.
     """
 
-    def __init__(self):
-        self.buckets: dict[str, dict[str, Any]] = {}
-        self.cleanup_interval = 3600  # Clean up old buckets every hour
-        self.last_cleanup = time.time()
-
-    def _cleanup_old_buckets(self) -> None:
-        """Remove expired buckets to prevent memory leaks."""
-        now = time.time()
-        if now - self.last_cleanup > self.cleanup_interval:
-            expired_keys = [
-                key for key, bucket in self.buckets.items() if now - bucket["last_check"] > self.cleanup_interval
-            ]
-            for key in expired_keys:
-                del self.buckets[key]
-            self.last_cleanup = now
-            if expired_keys:
-                log.debug(f"Cleaned up {len(expired_keys)} expired rate limit buckets")
+    def __init__(
+        self,
+        cleanup_interval: int = 3600,
+        max_buckets: int = 50_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        # Kept in least-recently-checked order, so stale buckets sit at the front
+        self.buckets: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        # Sweep period, and how long a bucket may sit idle before a sweep drops it
+        self.cleanup_interval = cleanup_interval
+        self.max_buckets = max_buckets
+        self.clock = clock
+        self.last_cleanup = clock()
+
+    def _cleanup_old_buckets(self, now: float) -> None:
+        """Remove expired buckets to prevent memory leaks.
+
+        Pops idle buckets off the front until the first live one, so each
+        expired bucket is visited once instead of rescanning every key.
+        """
+        if now - self.last_cleanup <= self.cleanup_interval:
+            return
+        expired = 0
+        while self.buckets:
+            bucket = next(iter(self.buckets.values()))
+            if now - bucket["last_check"] <= self.cleanup_interval:
+                break
+            self.buckets.popitem(last=False)
+            expired += 1
+        self.last_cleanup = now
+        if expired:
+            log.debug(f"Cleaned up {expired} expired rate limit buckets")
 
     def check_rate_limit(
         self,
-        key: str,
+        key: Hashable,
         max_requests: int,
         window_seconds: int,
     ) -> tuple[bool, int]:
         """Check if request is within rate limit.
 
         Args:
-            key: Unique identifier for the client (IP, API key, etc.)
+            key: Unique identifier for the client (IP, API key, etc.; string or tuple)
             max_requests: Maximum requests allowed in window
             window_seconds: Time window in seconds
 
         Returns:
             Tuple of (allowed, retry_after_seconds)
         """
-        self._cleanup_old_buckets()
+        now = self.clock()
+        self._cleanup_old_buckets(now)
 
-        now = time.time()
-
-        if key not in self.buckets:
+        bucket = self.buckets.get(key)
+        if bucket is None:
             self.buckets[key] = {
                 "tokens": max_requests - 1,
                 "last_check": now,
                 "max_tokens": max_requests,
                 "refill_rate": max_requests / window_seconds,
             }
+            # Bound memory against floods of unique client keys
+            while len(self.buckets) > self.max_buckets:
+                self.buckets.popitem(last=False)
             return True, 0
 
-        bucket = self.buckets[key]
+        self.buckets.move_to_end(key)
         time_passed = now - bucket["last_check"]
 
         # Refill tokens based on time passed
@@ -178,7 +222,7 @@ class InMemoryRateLimiter:
 _rate_limiter = InMemoryRateLimiter()
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Middleware for rate limiting requests.
 
     Applies different rate limits based on:
@@ -195,20 +239,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         api_key_max_requests: int = 1000,
         api_key_window_seconds: int = 60,
     ):
-        super().__init__(app)
+        self.app = app
         self.default_max_requests = default_max_requests
         self.default_window_seconds = default_window_seconds
         self.api_key_max_requests = api_key_max_requests
         self.api_key_window_seconds = api_key_window_seconds
 
-    def _get_client_identifier(self, request: Request) -> str:
-        """Get unique identifier for the client."""
+    def _get_client_identifier(self, request: Request) -> tuple[str, str]:
+        """Get unique identifier for the client as a (kind, value) tuple."""
         # Check for API key
         api_key = request.headers.get("x-api-key") or request.headers.get("authorization", "").replace("Bearer ", "")
 
         if api_key:
             # Hash API key for privacy
-            return f"apikey:{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+            return "apikey", hashlib.sha256(api_key.encode()).hexdigest()[:16]
 
         # Fall back to IP address
         forwarded_for = request.headers.get("x-forwarded-for")
@@ -217,27 +261,29 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         else:
             client_ip = request.client.host if request.client else "unknown"
 
-        return f"ip:{client_ip}"
+        return "ip", client_ip
 
-    def _get_rate_limit_params(self, request: Request, client_id: str) -> tuple[int, int]:
+    def _get_rate_limit_params(self, request: Request, client_id: tuple[str, str]) -> tuple[int, int]:
         """Get rate limit parameters for the request.
 
         Returns:
             Tuple of (max_requests, window_seconds)
         """
         # API key gets higher limits
-        if client_id.startswith("apikey:"):
+        if client_id[0] == "apikey":
             return self.api_key_max_requests, self.api_key_window_seconds
 
         # Default limits for IP-based requests
         return self.default_max_requests, self.default_window_seconds
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Apply rate limiting to request."""
         # Skip rate limiting for health check
-        if request.url.path in ["/health", "/metrics"]:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in ["/health", "/metrics"]:
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
         client_id = self._get_client_identifier(request)
         max_requests, window_seconds = self._get_rate_limit_params(request, client_id)
 
@@ -245,19 +291,24 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         allowed, retry_after = _rate_limiter.check_rate_limit(client_id, max_requests, window_seconds)
 
         if not allowed:
-            log.warning(f"Rate limit exceeded for {client_id}: {request.method} {request.url.path}")
-            return JSONResponse(
+            log.warning(f"Rate limit exceeded for {client_id[0]}:{client_id[1]}: {request.method} {request.url.path}")
+            response = JSONResponse(
                 status_code=429,
                 content={"detail": "Rate limit exceeded", "retry_after": retry_after},
                 headers={"Retry-After": str(retry_after), "X-RateLimit-Reset": str(int(time.time() + retry_after))},
             )
-
-        # Add rate limit headers to response
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(max_requests)
-        response.headers["X-RateLimit-Window"] = str(window_seconds)
-
-        return response
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Add rate limit headers to response
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(max_requests)
+                headers["X-RateLimit-Window"] = str(window_seconds)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 class APIKeyRotation:
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone
+from typing import Callable
 
+# (epoch second, its ISO string); the string only changes once a second
+_utc_now_iso_cache: tuple[int, str] = (-1, "")
 
-def utc_now_iso() -> str:
-    return datetime.now(tz=timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+def utc_now_iso(clock: Callable[[], float] = time.time) -> str:
+    """Current UTC time as second-resolution ISO 8601 with a ``Z`` suffix."""
+    global _utc_now_iso_cache
+    second = int(clock())
+    if second != _utc_now_iso_cache[0]:
+        stamp = datetime.fromtimestamp(second, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _utc_now_iso_cache = (second, stamp)
+    return _utc_now_iso_cache[1]
 
 
 def truncate(text: str, max_len: int = 240) -> str:
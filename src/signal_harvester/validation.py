@@ -3,18 +3,31 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException
 
+# Patterns used on per-request paths, compiled once at import
+_API_KEY_RE = re.compile(r'^[a-zA-Z0-9-_]+$')
+_QUERY_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
 
 def validate_tweet_id(tweet_id: str) -> str:
     """Validate tweet ID format."""
     if not tweet_id or not isinstance(tweet_id, str):
         raise HTTPException(status_code=400, detail="tweet_id must be a non-empty string")
     
+    return _validate_tweet_id_format(tweet_id)
+
+
+@lru_cache(maxsize=4096)
+def _validate_tweet_id_format(tweet_id: str) -> str:
+    """Format checks for a tweet ID, memoized since the same IDs are requested repeatedly."""
     # Twitter IDs are numeric strings, typically 18-19 digits
-    if not re.match(r'^\d+$', tweet_id):
+    # ASCII digits only: str checks avoid the regex engine on this hot path
+    if not (tweet_id.isascii() and tweet_id.isdigit()):
         raise HTTPException(status_code=400, detail="tweet_id must be numeric")
     
     if len(tweet_id) < 10 or len(tweet_id) > 20:
@@ -83,7 +96,7 @@ def validate_api_key(api_key: str | None) -> str | None:
         raise HTTPException(status_code=400, detail="API key must not exceed 128 characters")
     
     # Check for reasonable API key characters (alphanumeric + some special chars)
-    if not re.match(r'^[a-zA-Z0-9-_]+$', api_key):
+    if not _API_KEY_RE.match(api_key):
         raise HTTPException(status_code=400, detail="API key contains invalid characters")
     
     return api_key
@@ -101,7 +114,7 @@ def validate_query_name(name: str) -> str:
         raise HTTPException(status_code=400, detail="Query name must not exceed 50 characters")
     
     # Only allow alphanumeric, underscore, and hyphen
-    if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+    if not _QUERY_NAME_RE.match(name):
         raise HTTPException(
             status_code=400,
             detail="Query name can only contain letters, numbers, hyphens, and underscores"
@@ -138,7 +151,7 @@ def sanitize_string(input_str: str, max_length: int = 1000) -> str:
         raise HTTPException(status_code=400, detail="Input must be a string")
     
     # Remove null bytes and control characters
-    sanitized = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', input_str)
+    sanitized = _CONTROL_CHARS_RE.sub('', input_str)
     
     # Limit length
     if len(sanitized) > max_length:
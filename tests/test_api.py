@@ -87,6 +87,7 @@ queries: []
         data = r.json()
         assert len(data) == 1
         assert data[0]["tweet_id"] == "1234567890123456789"
+        assert data[0]["url"] == "https://x.com/user1/status/1234567890123456789"
 
         r2 = client.get("/tweet/1234567890123456789")
         assert r2.status_code == 200
@@ -103,3 +104,349 @@ def test_health_endpoint():
     assert r.status_code == 200
     # The health endpoint returns "healthy" not "ok"
     assert r.json()["status"] == "healthy"
+
+
+def test_orjson_response_encodes_decimal_and_datetime():
+    """OrjsonResponse handles the non-native types returned by DB helpers."""
+    from datetime import datetime, timezone
+    from decimal import Decimal
+
+    import orjson
+
+    from signal_harvester.api import OrjsonResponse
+
+    response = OrjsonResponse({
+        "score": Decimal("1.5"),
+        "at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        1: "non-str key",
+    })
+
+    assert orjson.loads(response.body) == {
+        "score": 1.5,
+        "at": "2024-01-01T00:00:00+00:00",
+        "1": "non-str key",
+    }
+
+
+def test_metrics_served_from_cache(monkeypatch):
+    """Repeated /metrics hits reuse one aggregation pass."""
+    from signal_harvester import api as api_module
+
+    client = TestClient(create_app())
+
+    calls = []
+    real_collect = api_module._collect_metrics
+
+    def counting_collect(db_path, pool=None, page_size=None):
+        calls.append(db_path)
+        return real_collect(db_path, pool, page_size)
+
+    monkeypatch.setattr(api_module, "_collect_metrics", counting_collect)
+
+    first = client.get("/metrics").json()
+    second = client.get("/metrics").json()
+
+    assert len(calls) == 1
+    assert first["tweets"] == second["tweets"]
+    assert "timestamp" in second
+
+
+def test_collect_metrics_counts(initialized_db: str):
+    """The single-pass aggregate reports the same counts as per-filter queries."""
+    from signal_harvester.api import _collect_metrics, _read_page_size
+
+    for i, created_at in enumerate(["2024-01-01T00:00:00Z", "2999-01-01T00:00:00Z"]):
+        upsert_tweet(
+            initialized_db,
+            {"tweet_id": f"10{i}", "text": "t", "author_id": "u", "created_at": created_at},
+            query_name="test",
+        )
+    update_analysis(
+        initialized_db,
+        tweet_id="100",
+        category="bug",
+        sentiment="negative",
+        urgency=2,
+        tags_json="[]",
+        reasoning="",
+    )
+    update_salience(initialized_db, "100", 80.0)
+
+    data = _collect_metrics(initialized_db)
+
+    assert "error" not in data
+    assert data["tweets"] == {
+        "total": 2,
+        "scored": 1,
+        "analyzed": 1,
+        "notified": 0,
+        "recent_24h": 1,
+        "by_category": {"bug": 1},
+    }
+    assert data["performance"] == {"avg_salience": 80.0, "max_salience": 80.0, "avg_urgency": 2.0}
+
+    # A cached page size gives the same database size as reading it afresh
+    page_size = _read_page_size(initialized_db)
+    assert page_size
+    assert _collect_metrics(initialized_db, page_size=page_size)["database"] == data["database"]
+
+    # Size comes from the database file plus its WAL, without a PRAGMA
+    wal_path = Path(f"{initialized_db}-wal")
+    expected = Path(initialized_db).stat().st_size + (wal_path.stat().st_size if wal_path.exists() else 0)
+    assert data["database"]["size_bytes"] == expected
+    assert data["database"]["page_count"] == Path(initialized_db).stat().st_size // page_size
+
+
+def test_stream_json_list_matches_single_encode():
+    """Batched streaming produces the same document as one orjson pass."""
+    import asyncio
+
+    import orjson
+
+    from signal_harvester.api import STREAM_BATCH_SIZE, _stream_json_list
+
+    async def collect(items):
+        return b"".join([chunk async for chunk in _stream_json_list("labels", items, count=len(items))])
+
+    for size in (0, 1, STREAM_BATCH_SIZE, 2 * STREAM_BATCH_SIZE + 3):
+        items = [{"id": i, "label": "true_positive", "notes": None} for i in range(size)]
+        body = asyncio.run(collect(items))
+        assert orjson.loads(body) == {"labels": items, "count": size}
+
+    client = TestClient(create_app())
+    r = client.get("/labels")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/json")
+    assert r.json() == {"labels": [], "count": 0}
+
+
+def test_bulk_labels_endpoint_validates_upfront():
+    """Bulk labelling rejects the whole batch before writing anything."""
+    from signal_harvester.api import MAX_BULK_LABELS
+
+    client = TestClient(create_app())
+    assert client.post("/labels/bulk", json=[]).status_code == 400
+
+    too_many = [{"artifactId": i, "label": "relevant"} for i in range(MAX_BULK_LABELS + 1)]
+    assert client.post("/labels/bulk", json=too_many).status_code == 400
+
+    r = client.post(
+        "/labels/bulk",
+        json=[{"artifactId": 1, "label": "relevant"}, {"artifactId": 2, "label": "relevant", "confidence": 1.5}],
+    )
+    assert r.status_code == 400
+    assert r.json()["detail"].startswith("Label 1:")
+
+
+def test_response_models_built_at_import():
+    """No response model defers schema building to its first request."""
+    from pydantic import BaseModel
+
+    from signal_harvester import api as api_module
+
+    incomplete = [
+        name
+        for name, obj in vars(api_module).items()
+        if isinstance(obj, type)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == api_module.__name__
+        and not obj.__pydantic_complete__
+    ]
+    assert incomplete == []
+
+
+def test_list_adapters_match_model_serialization():
+    """Bare-list bodies keep the per-model shape, including dropped None fields."""
+    from signal_harvester import api as api_module
+
+    topics = [
+        api_module._construct_topic({"id": 1, "name": "quantum"}),
+        api_module._construct_topic({"id": 2, "name": "fusion", "artifact_count": 3}),
+    ]
+    body = api_module._TOPICS_ADAPTER.dump_json(topics)
+    assert body == b"[" + b",".join(t.model_dump_json().encode() for t in topics) + b"]"
+    assert b"null" not in body
+
+
+def test_dashboard_analytics_runs_sections_concurrently(monkeypatch):
+    """Dashboard sections are dispatched together, not one after another."""
+    import threading
+
+    from signal_harvester import analytics
+
+    names = [
+        "get_source_distribution",
+        "get_temporal_trends",
+        "get_cross_source_correlations",
+        "get_score_distributions",
+        "get_system_health",
+    ]
+    barrier = threading.Barrier(len(names), timeout=5)
+
+    def section(name):
+        def run(*args, **kwargs):
+            barrier.wait()  # only passes if every section is in flight at once
+            return {"section": name}
+        return run
+
+    for name in names:
+        monkeypatch.setattr(analytics, name, section(name))
+
+    client = TestClient(create_app())
+    r = client.get("/analytics/dashboard?days=7")
+    assert r.status_code == 200
+    assert r.json()["temporal_trends"] == {"section": "get_temporal_trends"}
+    assert len(r.json()) == len(names)
+
+
+def test_collect_metrics_scans_tweets_twice(tmp_path):
+    """Tweet stats come from one aggregate scan plus the category breakdown."""
+    import sqlite3
+
+    from signal_harvester.api import _collect_metrics_into
+    from signal_harvester.db import init_db
+
+    db_path = str(tmp_path / "metrics.db")
+    init_db(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO tweets (tweet_id, category, salience, urgency, created_at) VALUES (?, ?, ?, ?, ?)",
+        [
+            ("1", "bug", 80.0, 2, "2000-01-01T00:00:00Z"),
+            ("2", "bug", 60.0, 4, "2000-01-01T00:00:00Z"),
+            ("3", None, None, None, "2000-01-01T00:00:00Z"),
+        ],
+    )
+    conn.commit()
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    metrics_data = {}
+    _collect_metrics_into(conn, metrics_data)
+    conn.close()
+
+    assert len(statements) == 2  # tweet aggregates, category breakdown
+    assert metrics_data["tweets"]["total"] == 3
+    assert metrics_data["tweets"]["scored"] == 2
+    assert metrics_data["tweets"]["by_category"] == {"bug": 2}
+    assert metrics_data["performance"] == {"avg_salience": 70.0, "max_salience": 80.0, "avg_urgency": 3.0}
+
+
+def test_top_serves_cached_body(tmp_path, monkeypatch):
+    """Repeated /top polls within the TTL reuse the encoded body."""
+    import signal_harvester.db as db_module
+    from signal_harvester.cache import invalidate_cache
+
+    invalidate_cache("top*")
+    calls = []
+
+    def fake_list_top(db_path, **kwargs):
+        calls.append(kwargs)
+        return [{"tweet_id": "1", "salience": 90.0}]
+
+    monkeypatch.setattr(db_module, "list_top", fake_list_top)
+    app = create_app()
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/top")
+    settings = Settings()
+    settings.app.database_path = str(tmp_path / "top.db")
+
+    first = route.endpoint(limit=10, min_salience=0.0, hours=None, settings=settings)
+    second = route.endpoint(limit=10, min_salience=0.0, hours=None, settings=settings)
+    assert first.body == second.body == b'[{"tweet_id":"1","salience":90.0}]'
+    assert len(calls) == 1
+
+    route.endpoint(limit=5, min_salience=0.0, hours=None, settings=settings)
+    assert len(calls) == 2
+
+    invalidate_cache("top*")
+    route.endpoint(limit=10, min_salience=0.0, hours=None, settings=settings)
+    assert len(calls) == 3
+
+
+def test_refresh_runs_pipeline_in_background(monkeypatch):
+    """POST /refresh returns a job id at once; the run is polled to completion."""
+    import threading
+    import time
+
+    from signal_harvester import api as api_module
+
+    release = threading.Event()
+
+    def fake_run_pipeline(settings, **kwargs):
+        release.wait(5)
+        if kwargs["notify_limit"] == 0:
+            raise RuntimeError("fetch failed")
+        return {"fetched": 3, "analyzed": 2, "scored": 2, "notified": 0}
+
+    monkeypatch.setattr(api_module, "run_pipeline", fake_run_pipeline)
+    client = TestClient(create_app())
+
+    def wait_for(job_id):
+        for _ in range(100):
+            body = client.get(f"/refresh/{job_id}").json()
+            if body["status"] != "running":
+                return body
+            time.sleep(0.02)
+        raise AssertionError("pipeline run did not finish")
+
+    r = client.post("/refresh")
+    assert r.status_code == 202
+    job_id = r.json()["jobId"]
+    assert client.get(f"/refresh/{job_id}").json()["status"] == "running"
+    assert client.post("/refresh").status_code == 409
+
+    release.set()
+    body = wait_for(job_id)
+    assert body["status"] == "completed"
+    assert body["stats"] == {"fetched": 3, "analyzed": 2, "scored": 2, "notified": 0}
+
+    failed = wait_for(client.post("/refresh?notify_limit=0").json()["jobId"])
+    assert failed["status"] == "failed"
+    assert failed["error"] == "fetch failed"
+    assert client.get("/refresh/unknown").status_code == 404
+
+
+def test_routes_and_exception_handler_registered_once():
+    """Each method/path pair has exactly one handler; the catch-all handler is registered once."""
+    from collections import Counter
+
+    app = create_app()
+    registrations = Counter(
+        (method, route.path) for route in app.routes for method in getattr(route, "methods", None) or ()
+    )
+    assert [key for key, count in registrations.items() if count > 1] == []
+    assert ("POST", "/discoveries/refresh") in registrations
+    assert list(app.exception_handlers).count(Exception) == 1
+
+
+def test_tweet_row_encoded_with_orjson(monkeypatch):
+    """/tweet/{id} hands the DB row to orjson without response-model validation."""
+    from signal_harvester import api as api_module
+
+    row = {"tweet_id": "1234567890123", "salience": 91.5, "url": "https://x.com/i/web/status/1234567890123"}
+    monkeypatch.setattr(api_module, "get_tweet", lambda db_path, tweet_id, with_url=False: dict(row))
+    route = next(r for r in create_app().routes if getattr(r, "path", None) == "/tweet/{tweet_id}")
+
+    response = route.endpoint(tweet_id="1234567890123", settings=Settings())
+    assert isinstance(response, api_module.OrjsonResponse)
+    assert response.body == b'{"tweet_id":"1234567890123","salience":91.5,"url":"https://x.com/i/web/status/1234567890123"}'
+
+
+def test_openapi_schema_built_at_startup_and_served_pregzipped():
+    """The schema is generated during startup and served from pre-encoded bytes."""
+    app = create_app()
+    assert app.openapi_schema is None
+
+    with TestClient(app) as client:
+        assert app.openapi_schema is not None
+
+        gzipped = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.status_code == 200
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert gzipped.json() == app.openapi_schema
+
+        plain = client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.json() == app.openapi_schema
+
+        assert client.get("/docs").status_code == 200
@@ -93,3 +93,53 @@ def test_metrics_endpoint_compression(client: TestClient) -> None:
     
     assert response.status_code == 200
     # Metrics endpoint should work with compression middleware
+
+
+def test_accepted_encodings_parsing() -> None:
+    """Accept-Encoding parsing drops q=0 codings and normalizes case."""
+    from signal_harvester.compression import accepted_encodings
+
+    assert accepted_encodings("gzip, BR;q=0.5, zstd;q=0") == {"gzip", "br"}
+    assert accepted_encodings("") == set()
+
+
+def test_unsupported_encoding_falls_back_to_gzip() -> None:
+    """Preferred codings that aren't installed fall back to gzip."""
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from signal_harvester import compression
+    from signal_harvester.compression import CompressionMiddleware
+
+    async def big(request):  # type: ignore[no-untyped-def]
+        return PlainTextResponse("x" * 5000)
+
+    app = Starlette(routes=[Route("/big", big)])
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+    response = TestClient(app).get("/big", headers={"Accept-Encoding": "zstd, br, gzip"})
+
+    expected = "zstd" if compression.ZSTD_AVAILABLE else "br" if compression.BROTLI_AVAILABLE else "gzip"
+    assert response.headers.get("content-encoding") == expected
+    if expected == "gzip":
+        assert response.text == "x" * 5000
+
+
+def test_preferred_codings_matched_case_insensitively() -> None:
+    """Upper-case zstd/br tokens still select the preferred coding."""
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse
+    from starlette.routing import Route
+
+    from signal_harvester import compression
+    from signal_harvester.compression import CompressionMiddleware
+
+    async def big(request):  # type: ignore[no-untyped-def]
+        return PlainTextResponse("x" * 5000)
+
+    app = Starlette(routes=[Route("/big", big)])
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+    response = TestClient(app).get("/big", headers={"Accept-Encoding": "ZSTD, BR, gzip"})
+
+    expected = "zstd" if compression.ZSTD_AVAILABLE else "br" if compression.BROTLI_AVAILABLE else "gzip"
+    assert response.headers.get("content-encoding") == expected
@@ -57,3 +57,86 @@ def test_topic_timeline_endpoint_returns_array(discovery_client: TestClient, mon
     response = discovery_client.get("/topics/example/timeline")
     assert response.status_code == 200
     assert isinstance(response.json(), list)
+
+
+def test_topic_timeline_maps_db_rows(discovery_client: TestClient, monkeypatch) -> None:
+    rows = [
+        {"date": "2024-01-01", "artifact_count": 3, "avg_discovery_score": 71.5},
+        {"date": "2024-01-02", "artifact_count": 0, "avg_discovery_score": None},
+    ]
+    monkeypatch.setattr("signal_harvester.db.get_topic_timeline", lambda *args, **kwargs: rows)
+    response = discovery_client.get("/topics/example/timeline")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"date": "2024-01-01", "artifactCount": 3, "avgDiscoveryScore": 71.5},
+        {"date": "2024-01-02", "artifactCount": 0, "avgDiscoveryScore": None},
+    ]
+
+
+def test_paginated_discoveries_maps_db_rows(discovery_client: TestClient, monkeypatch) -> None:
+    row = {
+        "id": 7,
+        "artifact_id": 7,
+        "artifact_type": "preprint",
+        "source": "arxiv",
+        "source_id": "2401.00001",
+        "title": "Paper",
+        "published_at": "2024-01-01T00:00:00Z",
+        "discovery_score": 91.5,
+        "tags": ["quantum"],
+        "topics": [],
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+    }
+    monkeypatch.setattr(
+        "signal_harvester.db.list_top_discoveries_paginated",
+        lambda *args, **kwargs: ([row], "next", True),
+    )
+    response = discovery_client.get("/discoveries/paginated")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["nextCursor"] == "next"
+    assert data["hasMore"] is True
+    assert data["items"][0]["artifactId"] == 7
+    assert data["items"][0]["discoveryScore"] == 91.5
+    assert "reasoning" not in data["items"][0]
+
+
+def test_refresh_discoveries_rejects_overlapping_runs(discovery_client: TestClient, monkeypatch) -> None:
+    """A second refresh while one is running gets 409; stages run off the event loop."""
+    import asyncio
+    import threading
+
+    from fastapi import HTTPException
+
+    from signal_harvester.config import Settings
+
+    fetch_started = threading.Event()
+    release_fetch = threading.Event()
+
+    def blocking_fetch(settings):
+        fetch_started.set()
+        release_fetch.wait(5)
+        return {"fetched": 1}
+
+    async def fake_scoring(*args, **kwargs):
+        return 2
+
+    monkeypatch.setattr("signal_harvester.pipeline.fetch_once", blocking_fetch)
+    monkeypatch.setattr("signal_harvester.pipeline.analyze_unanalyzed", lambda settings, limit: 3)
+    monkeypatch.setattr("signal_harvester.discovery_scoring.run_discovery_scoring", fake_scoring)
+    route = next(r for r in discovery_client.app.routes if getattr(r, "name", "") == "refresh_discoveries")
+    settings = Settings()
+
+    async def scenario():
+        first = asyncio.ensure_future(route.endpoint(refresh_type="discovery", settings=settings, _=None))
+        while not fetch_started.is_set():
+            await asyncio.sleep(0.01)  # loop stays responsive while fetch blocks
+        with pytest.raises(HTTPException) as exc_info:
+            await route.endpoint(refresh_type="discovery", settings=settings, _=None)
+        assert exc_info.value.status_code == 409
+        release_fetch.set()
+        return await first
+
+    result = asyncio.run(scenario())
+    assert result["stats"] == {"fetch": {"fetched": 1}, "analyze": {"count": 3}, "score": {"count": 2}}
@@ -16,3 +16,23 @@ def test_prometheus_metrics_endpoint_returns_text_plain(monkeypatch):
     assert "text/plain" in ctype
     assert "charset=utf-8" in ctype or "charset" in ctype
     assert r.text.strip() != ""
+
+
+def test_prometheus_exposition_rendered_once_per_ttl(monkeypatch):
+    from signal_harvester import metrics
+
+    renders = []
+
+    def fake_generate_latest():
+        renders.append(1)
+        return b"# render %d\n" % len(renders)
+
+    monkeypatch.setattr(metrics, "generate_latest", fake_generate_latest)
+    monkeypatch.setattr(metrics, "_rendered_metrics", (float("-inf"), b""))
+
+    assert metrics.get_metrics() == b"# render 1\n"
+    assert metrics.get_metrics() == b"# render 1\n"
+    assert len(renders) == 1
+
+    monkeypatch.setattr(metrics, "METRICS_RENDER_TTL_SECONDS", 0.0)
+    assert metrics.get_metrics() == b"# render 2\n"
@@ -32,3 +32,45 @@ def test_cors_preflight_allows_origin():
     # CORS should allow all origins by default or echo origin
     allow_origin = r.headers.get("access-control-allow-origin")
     assert allow_origin in ("*", "http://example.com")
+
+
+def test_middleware_rate_limiter_evicts_stale_and_excess_buckets():
+    from signal_harvester.security_middleware import InMemoryRateLimiter
+
+    now = 1_000_000.0
+    limiter = InMemoryRateLimiter(cleanup_interval=60, max_buckets=3, clock=lambda: now)
+    limiter.check_rate_limit(("ip", "a"), 10, 60)
+    limiter.check_rate_limit(("ip", "b"), 10, 60)
+
+    now += 30
+    limiter.check_rate_limit(("ip", "a"), 10, 60)  # refreshed, moves behind "b"
+    now += 45
+    limiter.check_rate_limit(("ip", "c"), 10, 60)  # triggers a sweep: only "b" is stale
+    assert list(limiter.buckets) == [("ip", "a"), ("ip", "c")]
+
+    limiter.check_rate_limit(("ip", "d"), 10, 60)
+    limiter.check_rate_limit(("ip", "e"), 10, 60)
+    assert list(limiter.buckets) == [("ip", "c"), ("ip", "d"), ("ip", "e")]
+
+
+def test_rate_limit_tier_read_from_scope_headers(monkeypatch):
+    monkeypatch.setenv("HARVEST_API_KEY", "abcdef0123456789")
+    client = TestClient(create_app())
+
+    anonymous = client.get("/health/live")
+    keyed = client.get("/health/live", headers={"X-API-Key": "abcdef0123456789"})
+    wrong_key = client.get("/health/live", headers={"X-API-Key": "not-the-key-0000"})
+
+    assert anonymous.headers["x-ratelimit-limit"] == wrong_key.headers["x-ratelimit-limit"]
+    assert int(keyed.headers["x-ratelimit-limit"]) > int(anonymous.headers["x-ratelimit-limit"])
+
+
+def test_api_key_dependency_uses_startup_key(monkeypatch):
+    monkeypatch.setenv("HARVEST_API_KEY", "abcdef0123456789")
+    client = TestClient(create_app())
+    # The key is captured at startup; later environment changes don't apply
+    monkeypatch.setenv("HARVEST_API_KEY", "changed0123456789")
+
+    assert client.post("/labels/bulk", json=[]).status_code == 401
+    assert client.post("/labels/bulk", json=[], headers={"X-API-Key": "changed0123456789"}).status_code == 401
+    assert client.post("/labels/bulk", json=[], headers={"X-API-Key": "abcdef0123456789"}).status_code == 400
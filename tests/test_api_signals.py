@@ -157,7 +157,58 @@ class TestSignalsEndpoints:
         assert len(data["items"]) == 2
         assert data["page"] == 1
         assert data["pageSize"] == 2
-    
+
+    def test_list_signals_cursor_pagination(self, client, sample_tweets):
+        """Test keyset pagination via nextCursor."""
+        first = client.get("/signals?pageSize=2").json()
+        assert len(first["items"]) == 2
+        assert first["nextCursor"]
+
+        second = client.get(f"/signals?pageSize=2&cursor={first['nextCursor']}").json()
+        assert len(second["items"]) == 1
+        assert second["nextCursor"] is None
+
+        seen = [s["id"] for s in first["items"] + second["items"]]
+        assert sorted(seen) == ["1001", "1002", "1003"]
+
+    @pytest.mark.parametrize("order", ["desc", "asc"])
+    def test_list_signals_cursor_pages_through_null_sort_values(self, client, db_path, sample_tweets, order):
+        """Rows without a sort value are neither dropped nor a dead end."""
+        import sqlite3
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE tweets SET updated_at = NULL WHERE tweet_id IN ('1001', '1003')")
+        conn.commit()
+        conn.close()
+
+        seen = []
+        url = f"/signals?pageSize=1&sort=updatedAt&order={order}"
+        page = client.get(url).json()
+        seen.extend(s["id"] for s in page["items"])
+        while page["nextCursor"]:
+            page = client.get(f"{url}&cursor={page['nextCursor']}").json()
+            seen.extend(s["id"] for s in page["items"])
+
+        assert sorted(seen) == ["1001", "1002", "1003"]
+
+    def test_list_signals_rejects_invalid_cursor(self, client, sample_tweets):
+        """An undecodable cursor is a client error, not a silent restart."""
+        response = client.get("/signals?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_list_signals_items_match_signal_model(self, client, sample_tweets):
+        """Test rows encoded straight from the DB serialize exactly like Signal."""
+        from signal_harvester.api import Signal
+
+        response = client.get("/signals")
+        items = response.json()["items"]
+
+        assert response.content.startswith(b'{"items":[{"id":')
+        for item in items:
+            expected = Signal.model_validate(item).model_dump(mode="json")
+            assert list(item) == list(expected)
+            assert item == expected
+
     def test_list_signals_search(self, client, sample_tweets):
         """Test signals search filter."""
         response = client.get("/signals?search=bug")
@@ -190,6 +241,20 @@ class TestSignalsEndpoints:
         assert signal["name"] == "user1"
         assert signal["status"] in ["active", "inactive", "paused", "error"]
     
+    def test_get_signal_uses_pooled_connection(self, client, sample_tweets, monkeypatch):
+        """Single-signal reads borrow a pooled connection instead of opening one."""
+        from signal_harvester import db as db_module
+
+        def no_direct_connect(*args, **kwargs):
+            raise AssertionError("opened a fresh connection")
+
+        monkeypatch.setattr(db_module, "connect", no_direct_connect)
+        reused_before = client.get("/pool/stats").json()["reused"]
+        response = client.get("/signals/1001")
+        assert response.status_code == 200
+        assert response.json()["id"] == "1001"
+        assert client.get("/pool/stats").json()["reused"] > reused_before
+    
     def test_get_signal_not_found(self, client):
         """Test GET /signals/{id} with non-existent ID."""
         response = client.get("/signals/999999")
@@ -260,6 +325,29 @@ class TestSignalsEndpoints:
         assert "inactive" in stats
         
         assert stats["total"] == 3
+    
+    def test_list_signals_etag_not_modified(self, client, sample_tweets):
+        """Test GET /signals returns 304 for a matching If-None-Match."""
+        response = client.get("/signals")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        
+        response = client.get("/signals", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        
+        # Any write invalidates the tag, even within the same second
+        client.patch("/signals/1001", json={"tags": ["changed"]})
+        response = client.get("/signals", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    
+    def test_signals_stats_etag_not_modified(self, client, sample_tweets):
+        """Test GET /signals/stats honours If-None-Match."""
+        etag = client.get("/signals/stats").headers["etag"]
+        response = client.get("/signals/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 304
 
 
 class TestSnapshotsEndpoints:
@@ -312,7 +400,70 @@ class TestBulkOperations:
         assert "jobId" in data
         assert "total" in data
         assert data["total"] == 2
-    
+
+    def test_bulk_delete_by_filters(self, client, db_path, sample_tweets):
+        """Test filter-scoped bulk jobs resolve ids with list_signal_ids."""
+        from signal_harvester.db import list_signal_ids, list_signals
+
+        signals, _, _ = list_signals(db_path, page_size=100, status="active")
+        assert list_signal_ids(db_path, status="active") == [s["id"] for s in signals]
+        assert list_signal_ids(db_path, search="tweet", limit=1) == [signals[0]["id"]]
+
+        response = client.post("/signals/bulk/delete", json={"filters": {"search": "tweet"}})
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+    def test_bulk_db_helpers(self, db_path, sample_tweets):
+        """Test chunk-level bulk update/delete helpers."""
+        from signal_harvester.db import bulk_delete_signals, bulk_update_signals, get_signal
+
+        assert bulk_update_signals(db_path, ["1001", "1002", "missing"], {"status": "paused"}) == 2
+        assert get_signal(db_path, "1001")["status"] == "paused"
+
+        assert bulk_delete_signals(db_path, ["1001", "1003"]) == 2
+        assert get_signal(db_path, "1001") is None
+        assert get_signal(db_path, "1002") is not None
+        assert bulk_delete_signals(db_path, []) == 0
+
+    def test_process_bulk_job_issues_one_statement_per_chunk(self, monkeypatch):
+        """Bulk jobs write BULK_JOB_CHUNK_SIZE ids per statement and stop at a cancel checkpoint."""
+        import asyncio
+        from collections import OrderedDict
+
+        from signal_harvester import api
+
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+        calls = []
+        cancel_on_first_chunk = False
+
+        def fake_update(db_path, chunk, updates):
+            calls.append(len(chunk))
+            if cancel_on_first_chunk:
+                api._get_bulk_job("job1")["status"] = "cancelled"  # lands mid-chunk
+            return len(chunk)
+
+        monkeypatch.setattr("signal_harvester.db.bulk_update_signals", fake_update)
+        target_ids = [str(i) for i in range(api.BULK_JOB_CHUNK_SIZE * 2 + 7)]
+
+        async def run():
+            job = api._new_bulk_job(
+                "job1", operation="set_status", target_ids=target_ids, target_status="paused",
+                db_path="unused.db", total=len(target_ids),
+            )
+            api._register_bulk_job("job1", job)
+            await api._process_bulk_job("job1")
+            return job
+
+        job = asyncio.run(run())
+        assert calls == [api.BULK_JOB_CHUNK_SIZE, api.BULK_JOB_CHUNK_SIZE, 7]
+        assert (job["status"], job["done"]) == ("completed", len(target_ids))
+
+        calls.clear()
+        cancel_on_first_chunk = True
+        job = asyncio.run(run())
+        assert calls == [api.BULK_JOB_CHUNK_SIZE]
+        assert (job["status"], job["done"]) == ("cancelled", api.BULK_JOB_CHUNK_SIZE)
+
     def test_get_bulk_job(self, client, sample_tweets):
         """Test GET /bulk-jobs/{id}."""
         # Create a job first
@@ -353,6 +504,148 @@ class TestBulkOperations:
         response = client.post(f"/bulk-jobs/{job_id}/cancel")
         assert response.status_code == 204
     
+    def test_bulk_job_registry_is_capped(self, monkeypatch):
+        """Least recently used finished jobs are evicted once the cap is reached."""
+        from collections import OrderedDict
+        
+        from signal_harvester import api
+        
+        monkeypatch.setattr(api, "BULK_JOB_SHARDS", 1)
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict()])
+        monkeypatch.setattr(api, "MAX_BULK_JOBS", 2)
+        api._register_bulk_job("running", {"jobId": "running", "status": "running"})
+        api._register_bulk_job("a", {"jobId": "a", "status": "completed"})
+        api._register_bulk_job("b", {"jobId": "b", "status": "completed"})
+        assert list(api.bulk_jobs_shards[0]) == ["running", "b"]
+        
+        # Reading a job marks it recently used
+        api._get_bulk_job("running")
+        api._register_bulk_job("c", {"jobId": "c", "status": "failed"})
+        assert list(api.bulk_jobs_shards[0]) == ["running", "c"]
+    
+    def test_bulk_job_registry_is_sharded(self, monkeypatch):
+        """Jobs spread across shards, each capped at its slice of MAX_BULK_JOBS."""
+        from collections import OrderedDict
+        
+        from signal_harvester import api
+        
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+        monkeypatch.setattr(api, "MAX_BULK_JOBS", api.BULK_JOB_SHARDS * 4)
+        job_ids = [f"job{i}" for i in range(api.BULK_JOB_SHARDS * 8)]
+        for job_id in job_ids:
+            api._register_bulk_job(job_id, {"jobId": job_id, "status": "completed"})
+        
+        assert sum(1 for shard in api.bulk_jobs_shards if shard) > 1
+        assert all(len(shard) <= 4 for shard in api.bulk_jobs_shards)
+        assert api._get_bulk_job(job_ids[-1])["jobId"] == job_ids[-1]
+    
+    def test_finished_bulk_jobs_expire_after_ttl(self, monkeypatch):
+        """Finished jobs are stamped with an expiry and swept once it passes."""
+        import asyncio
+        import time
+        from collections import OrderedDict
+
+        from signal_harvester import api
+
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+
+        async def make_jobs():
+            done = api._new_bulk_job("done", total=1)
+            done["status"] = "completed"
+            api._notify_bulk_job(done)
+            return done, api._new_bulk_job("running", total=1)
+
+        done, running = asyncio.run(make_jobs())
+        api._register_bulk_job("done", done)
+        api._register_bulk_job("running", running)
+
+        assert api._sweep_bulk_jobs() == 0
+        later = time.monotonic() + api.BULK_JOB_TTL_SECONDS + 1
+        assert api._sweep_bulk_jobs(now=later) == 1
+        assert api._get_bulk_job("done") is None
+        assert api._get_bulk_job("running") is running
+
+    def test_stream_bulk_job_wakes_on_notify(self, fastapi_app, monkeypatch):
+        """SSE frames are pushed on each notification, not on a polling interval."""
+        import asyncio
+        from collections import OrderedDict
+
+        from signal_harvester import api
+
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+        monkeypatch.setattr(api, "SSE_KEEPALIVE_SECONDS", 30.0)
+        route = next(r for r in fastapi_app.routes if getattr(r, "path", "") == "/bulk-jobs/{job_id}/stream")
+
+        async def scenario():
+            job = api._new_bulk_job("job1", total=2)
+            api._register_bulk_job("job1", job)
+            response = await route.endpoint("job1")
+            frames = response.body_iterator
+
+            assert json.loads((await frames.__anext__())[6:])["done"] == 0
+
+            next_frame = asyncio.ensure_future(frames.__anext__())
+            await asyncio.sleep(0)
+            assert not next_frame.done()  # idle until notified
+            job["done"] = 1
+            api._notify_bulk_job(job)
+            frame = await asyncio.wait_for(next_frame, 1)
+            assert json.loads(frame[6:])["done"] == 1
+            assert frame is job["latest_frame"]  # encoded once, shared by subscribers
+
+            job["done"], job["status"] = 2, "completed"
+            api._notify_bulk_job(job)
+            final = json.loads((await asyncio.wait_for(frames.__anext__(), 1))[6:])
+            assert final["status"] == "completed"
+            with pytest.raises(StopAsyncIteration):
+                await frames.__anext__()
+
+        asyncio.run(scenario())
+
+    def test_get_bulk_job_reads_published_snapshot(self, client, monkeypatch):
+        """Status reads see the last published progress, never a half-applied update."""
+        import asyncio
+        from collections import OrderedDict
+
+        from signal_harvester import api
+
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+
+        async def make_job():
+            return api._new_bulk_job("job1", total=4)
+
+        job = asyncio.run(make_job())
+        api._register_bulk_job("job1", job)
+        job["done"] = 2  # in flight, not yet published
+
+        assert client.get("/bulk-jobs/job1").json()["done"] == 0
+        api._publish_bulk_job_progress(job)
+        assert client.get("/bulk-jobs/job1").json()["done"] == 2
+
+    def test_stream_bulk_job_yields_prebuilt_bytes(self, fastapi_app, monkeypatch):
+        """Every SSE chunk is a shared, pre-encoded bytes object, keepalives included."""
+        import asyncio
+        from collections import OrderedDict
+
+        from signal_harvester import api
+
+        monkeypatch.setattr(api, "bulk_jobs_shards", [OrderedDict() for _ in range(api.BULK_JOB_SHARDS)])
+        monkeypatch.setattr(api, "SSE_KEEPALIVE_SECONDS", 0.01)
+        route = next(r for r in fastapi_app.routes if getattr(r, "path", "") == "/bulk-jobs/{job_id}/stream")
+
+        async def scenario():
+            job = api._new_bulk_job("job1", total=1)
+            api._register_bulk_job("job1", job)
+            frames = (await route.endpoint("job1")).body_iterator
+            first = await frames.__anext__()
+            keepalive = await asyncio.wait_for(frames.__anext__(), 1)
+            await frames.aclose()
+            return job, first, keepalive
+
+        job, first, keepalive = asyncio.run(scenario())
+        assert first is job["latest_frame"]
+        assert keepalive is api.SSE_KEEPALIVE_FRAME
+
     @pytest.mark.skip(reason="SSE streaming not testable with TestClient - would require real async client")
     def test_stream_bulk_job(self, client, sample_tweets):
         """Test GET /bulk-jobs/{id}/stream (SSE)."""
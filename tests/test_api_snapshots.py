@@ -180,7 +180,7 @@ class TestSnapshotsAPI:
         data = response.json()
         assert data["signalId"] == signal_id
         assert data["status"] == "processing"
-        assert "id" in data
+        assert len(data["id"]) == 32 and "-" not in data["id"]
         assert "createdAt" in data
 
         # Verify it appears in the list
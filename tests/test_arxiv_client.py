@@ -0,0 +1,479 @@
+"""Tests for the arXiv Atom client."""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from signal_harvester import arxiv_client
+from signal_harvester.arxiv_client import ArxivCache, ArxivClient
+
+ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2501.00001v1</id>
+    <updated>2025-01-02T00:00:00Z</updated>
+    <published>2025-01-01T12:00:00Z</published>
+    <title>  Photonic Tensor Cores  </title>
+    <summary>  Optical matrix multiplication at scale.  </summary>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+    <arxiv:primary_category term="physics.optics"/>
+    <category term="physics.optics"/>
+    <category term="cs.LG"/>
+  </entry>
+  <entry>
+    <id>http://arxiv.org/abs/2501.00002v2</id>
+    <updated>2025-01-03T00:00:00Z</updated>
+    <published>2025-01-03T00:00:00Z</published>
+    <title>Quantum Error Correction</title>
+    <summary>Surface codes.</summary>
+    <author><name>Peter Shor</name></author>
+    <category term="quant-ph"/>
+  </entry>
+</feed>
+"""
+
+
+@pytest.fixture(autouse=True)
+def no_request_interval(monkeypatch) -> None:
+    """Don't wait out arXiv's request spacing between mocked requests."""
+    monkeypatch.setattr(arxiv_client, "ARXIV_REQUEST_INTERVAL", 0.0)
+
+
+def _client() -> ArxivClient:
+    return ArxivClient(max_results=10, categories=["cs.LG"])
+
+
+def _close(client: ArxivClient) -> None:
+    asyncio.run(client.__aexit__(None, None, None))
+
+
+def test_parse_xml_response_extracts_entries() -> None:
+    client = _client()
+    try:
+        papers = client.parse_xml_response(ATOM_FEED)
+    finally:
+        _close(client)
+
+    assert [paper["source_id"] for paper in papers] == ["2501.00001v1", "2501.00002v2"]
+    first = papers[0]
+    assert first["title"] == "Photonic Tensor Cores"
+    assert first["text"] == "Optical matrix multiplication at scale."
+    assert first["published_at"] == "2025-01-01T12:00:00Z"
+    assert first["updated_at"] == "2025-01-02T00:00:00Z"
+    assert first["authors"] == ["Ada Lovelace", "Alan Turing"]
+    assert first["categories"] == ["physics.optics", "physics.optics", "cs.LG"]
+    assert first["url"] == "http://arxiv.org/abs/2501.00001v1"
+
+
+def test_parse_xml_response_accepts_bytes() -> None:
+    client = _client()
+    try:
+        from_bytes = client.parse_xml_response(ATOM_FEED.encode("utf-8"))
+        assert from_bytes == client.parse_xml_response(ATOM_FEED)
+    finally:
+        _close(client)
+    assert len(from_bytes) == 2
+
+
+def test_parse_xml_response_returns_empty_on_malformed_xml() -> None:
+    client = _client()
+    try:
+        assert client.parse_xml_response("<feed><entry>") == []
+    finally:
+        _close(client)
+
+
+def test_papers_emitted_as_each_entry_closes() -> None:
+    """The parser target finishes each paper at </entry>, before the feed ends."""
+    data = ATOM_FEED.encode("utf-8")
+    split = data.index(b"</entry>") + len(b"</entry>")
+    parser = arxiv_client._EntryParser()
+
+    first = parser.feed(data[:split])
+    rest = parser.feed(data[split:]) + parser.close()
+
+    assert [paper["source_id"] for paper in first] == ["2501.00001v1"]
+    assert [paper["source_id"] for paper in rest] == ["2501.00002v2"]
+    # The feed-level <title> is not mistaken for an entry field
+    assert first[0]["title"] == "Photonic Tensor Cores"
+
+
+def _mock_client(body: bytes, requests: list[httpx.Request]) -> ArxivClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=body)
+
+    client = _client()
+    asyncio.run(client.client.aclose())
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_fetch_parses_streamed_body_in_chunks(monkeypatch) -> None:
+    """Entries are parsed from the streamed body across small chunk boundaries."""
+    monkeypatch.setattr(arxiv_client, "STREAM_CHUNK_SIZE", 64)
+    requests: list[httpx.Request] = []
+    client = _mock_client(ATOM_FEED.encode("utf-8"), requests)
+
+    async def scenario():
+        async with client:
+            return await client.fetch_by_id("2501.00001"), await client.fetch_recent(hours=24 * 365 * 100)
+
+    paper, recent = asyncio.run(scenario())
+
+    assert paper is not None and paper["source_id"] == "2501.00001v1"
+    assert [p["source_id"] for p in recent] == ["2501.00001v1", "2501.00002v2"]
+    assert requests[0].url.params["id_list"] == "2501.00001"
+    # httpx negotiates gzip and decompresses before the bytes reach the parser
+    assert "gzip" in requests[0].headers["Accept-Encoding"]
+
+
+def test_fetch_returns_empty_on_truncated_body() -> None:
+    requests: list[httpx.Request] = []
+    client = _mock_client(ATOM_FEED.encode("utf-8")[:400], requests)
+
+    async def scenario():
+        async with client:
+            return await client.fetch_recent(hours=24 * 365 * 100)
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_primary_category_listed_first_regardless_of_position() -> None:
+    feed = """<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <id>http://arxiv.org/abs/2501.00003v1</id>
+    <category term="cs.LG"/>
+    <arxiv:primary_category term="cs.RO"/>
+  </entry>
+</feed>"""
+    client = _client()
+    try:
+        (paper,) = client.parse_xml_response(feed)
+    finally:
+        _close(client)
+
+    assert paper["categories"] == ["cs.RO", "cs.LG"]
+    assert paper["title"] == "" and paper["published_at"] == ""
+
+
+def test_fetch_recent_served_from_cache(tmp_path) -> None:
+    """A repeated query within the TTL is answered without another request."""
+    requests: list[httpx.Request] = []
+    client = _mock_client(ATOM_FEED.encode("utf-8"), requests)
+    client.cache = ArxivCache(tmp_path)
+    hours = 24 * 365 * 100
+
+    async def scenario():
+        async with client:
+            return await client.fetch_recent(hours=hours), await client.fetch_recent(hours=hours)
+
+    first, second = asyncio.run(scenario())
+
+    assert len(requests) == 1
+    assert second == first and len(first) == 2
+    # A fresh process reads the same entry back from disk
+    key = ArxivCache.key(client.categories, None, client.max_results, hours)
+    assert ArxivCache(tmp_path).get(key) == first
+
+
+def test_cache_hits_are_independent_copies(tmp_path) -> None:
+    cache = ArxivCache(tmp_path)
+    cache.set("k", [{"source_id": "2501.00001v1", "authors": ["Ada Lovelace"]}])
+
+    hit = cache.get("k")
+    hit[0]["authors"].append("Mallory")
+    hit.clear()
+
+    assert cache.get("k") == [{"source_id": "2501.00001v1", "authors": ["Ada Lovelace"]}]
+
+
+def test_cache_is_opt_in() -> None:
+    from signal_harvester.config import ArxivConfig
+
+    assert ArxivConfig().cache is False
+
+    async def default_client() -> ArxivClient:
+        try:
+            return await arxiv_client.get_default_client()
+        finally:
+            await arxiv_client.close_default_client()
+
+    assert asyncio.run(default_client()).cache is None
+
+
+def test_cache_entries_expire_after_ttl(tmp_path) -> None:
+    cache = ArxivCache(tmp_path, ttl=60)
+    cache.set("k", [{"source_id": "2501.00001v1"}])
+    stale = tmp_path / "k.json"
+    os.utime(stale, (stale.stat().st_atime, stale.stat().st_mtime - 120))
+
+    assert ArxivCache(tmp_path, ttl=60).get("k") is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_fetch_recent_sends_one_query_capped_at_max_results() -> None:
+    """Categories and terms go out as one OR query asking for max_results."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=ATOM_FEED.encode("utf-8"))
+
+    client = ArxivClient(max_results=10, categories=["cs.LG", "cs.AI"])
+    asyncio.run(client.client.aclose())
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def scenario():
+        async with client:
+            return await client.fetch_recent(hours=24 * 365 * 100, query_terms=["novel"])
+
+    papers = asyncio.run(scenario())
+
+    (request,) = requests
+    assert request.url.params["search_query"].startswith("(cat:cs.LG OR cat:cs.AI OR all:novel) AND submittedDate:[")
+    assert request.url.params["max_results"] == "10"
+    assert [p["source_id"] for p in papers] == ["2501.00001v1", "2501.00002v2"]
+
+
+def test_requests_take_turns_spaced_by_interval(monkeypatch) -> None:
+    """One client never overlaps requests and waits the interval between them."""
+    monkeypatch.setattr(arxiv_client, "ARXIV_REQUEST_INTERVAL", 0.2)
+    in_flight = 0
+    peak = 0
+    starts: list[float] = []
+    ends: list[float] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        starts.append(asyncio.get_running_loop().time())
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        ends.append(asyncio.get_running_loop().time())
+        return httpx.Response(200, content=ATOM_FEED.encode("utf-8"))
+
+    client = _client()
+    asyncio.run(client.client.aclose())
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def scenario():
+        async with client:
+            await asyncio.gather(*(client.fetch_by_id(f"2501.0000{i}") for i in range(3)))
+
+    asyncio.run(scenario())
+
+    assert peak == 1
+    assert all(start - end >= 0.19 for start, end in zip(starts[1:], ends))
+
+
+def test_client_pools_connections() -> None:
+    client = _client()
+    try:
+        assert client.client.timeout.connect == 5.0
+        assert client.client.headers["User-Agent"].startswith("signal-harvester/")
+    finally:
+        _close(client)
+
+
+def test_fetch_recent_keeps_only_papers_inside_window() -> None:
+    from datetime import datetime, timezone
+
+    requests: list[httpx.Request] = []
+    client = _mock_client(ATOM_FEED.encode("utf-8"), requests)
+    # Cutoff lands on 2025-01-02, between the two entries' published dates
+    hours = int((datetime.now(timezone.utc) - datetime(2025, 1, 2, tzinfo=timezone.utc)).total_seconds() // 3600)
+
+    async def scenario():
+        async with client:
+            return await client.fetch_recent(hours=hours)
+
+    assert [p["source_id"] for p in asyncio.run(scenario())] == ["2501.00002v2"]
+
+
+def test_date_window_pushed_into_query() -> None:
+    from datetime import datetime, timezone
+
+    client = _client()
+    try:
+        since = datetime(2025, 1, 2, 3, 4, tzinfo=timezone.utc)
+        query = client.build_query(["novel"], since=since)
+    finally:
+        _close(client)
+
+    assert query.startswith("(cat:cs.LG OR all:novel) AND submittedDate:[202501020304 TO ")
+
+
+def test_parsers_reused_across_documents_when_resettable() -> None:
+    """lxml parsers go back to the client's pool; stdlib ones are single-use."""
+    client = _client()
+    try:
+        client.parse_xml_response(ATOM_FEED)
+        idle = list(client._idle_parsers)
+        assert len(idle) == (1 if arxiv_client.LXML_AVAILABLE else 0)
+
+        assert len(client.parse_xml_response(ATOM_FEED)) == 2
+        assert client._idle_parsers == idle
+
+        # A parser left mid-document by an error is not handed out again
+        client.parse_xml_response("<feed><entry>")
+        assert client._idle_parsers == []
+    finally:
+        _close(client)
+
+
+def test_category_codes_are_interned() -> None:
+    client = _client()
+    try:
+        first, second = client.parse_xml_response(ATOM_FEED.replace("quant-ph", "cs.LG"))
+    finally:
+        _close(client)
+
+    assert first["categories"][-1] is second["categories"][0]
+
+
+def test_parse_xml_batch_matches_records() -> None:
+    client = _client()
+    try:
+        batch = client.parse_xml_batch(ATOM_FEED)
+        records = client.parse_xml_response(ATOM_FEED)
+        assert len(client.parse_xml_batch("<feed><entry>")) == 0
+    finally:
+        _close(client)
+
+    assert len(batch) == 2
+    assert batch.published_at == ["2025-01-01T12:00:00Z", "2025-01-03T00:00:00Z"]
+    assert batch.as_records() == records
+    assert batch.published_after("2025-01-02T00:00:00Z").as_records() == records[1:]
+
+
+def _sequenced_client(responses: list, requests: list[httpx.Request]) -> ArxivClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    client = _client()
+    asyncio.run(client.client.aclose())
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_fetch_retries_transient_failures(monkeypatch) -> None:
+    delays: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(arxiv_client.asyncio, "sleep", fake_sleep)
+    requests: list[httpx.Request] = []
+    client = _sequenced_client(
+        [
+            httpx.ConnectError("connection refused"),
+            httpx.Response(503),
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.Response(200, content=ATOM_FEED.encode()),
+        ],
+        requests,
+    )
+    try:
+        papers = asyncio.run(client._fetch_papers({"search_query": "all:test"}))
+    finally:
+        _close(client)
+
+    assert len(papers) == 2
+    assert len(requests) == 4
+    assert 0.25 <= delays[0] <= 0.5
+    assert 0.5 <= delays[1] <= 1.0
+    assert delays[2] == 3.0
+
+
+def test_fetch_does_not_retry_client_errors() -> None:
+    requests: list[httpx.Request] = []
+    client = _sequenced_client([httpx.Response(400), httpx.Response(500)], requests)
+    try:
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            asyncio.run(client._fetch_papers({"search_query": "all:test"}))
+        assert exc_info.value.response.status_code == 400
+    finally:
+        _close(client)
+
+    assert len(requests) == 1
+
+
+def test_entry_target_buffers_only_read_fields() -> None:
+    target = arxiv_client._EntryTarget()
+    target.start(arxiv_client._ENTRY_TAG, {})
+    target.data("\n  ")
+    target.start(arxiv_client._AUTHOR, {})
+    target.data("\n    ")
+    assert target._text == []
+
+    target.start(arxiv_client._NAME, {})
+    target.data("Ada Lovelace")
+    target.end(arxiv_client._NAME)
+    target.data("\n  ")
+    target.end(arxiv_client._AUTHOR)
+    assert target._text == ["Ada Lovelace"]
+    assert target._authors == ["Ada Lovelace"]
+
+
+def test_default_client_is_shared_per_loop_and_settings() -> None:
+    async def clients() -> tuple[ArxivClient, ArxivClient, ArxivClient]:
+        first = await arxiv_client.get_default_client(10, ["cs.LG"], cache=False)
+        same = await arxiv_client.get_default_client(10, ["cs.LG"], cache=False)
+        other = await arxiv_client.get_default_client(20, ["cs.LG"], cache=False)
+        # Replaced on the same loop: closed right away
+        assert first.client.is_closed and not other.client.is_closed
+        return first, same, other
+
+    first, same, other = asyncio.run(clients())
+    assert first is same
+    assert other is not first
+    # Left behind by asyncio.run: closed when its loop shut down
+    assert other.client.is_closed
+
+    async def in_new_loop() -> ArxivClient:
+        client = await arxiv_client.get_default_client(20, ["cs.LG"], cache=False)
+        await arxiv_client.close_default_client()
+        return client
+
+    fresh = asyncio.run(in_new_loop())
+    assert fresh is not other and fresh.client.is_closed
+    assert arxiv_client._default_client is None
+
+def test_iter_recent_yields_papers_before_response_completes(monkeypatch) -> None:
+    monkeypatch.setattr(arxiv_client, "STREAM_CHUNK_SIZE", 1)
+    body = ATOM_FEED.encode("utf-8")
+    split = body.index(b"<entry", body.index(b"</entry>"))
+    first_received = asyncio.Event()
+
+    async def stream():
+        yield body[:split]
+        # The rest of the body is only sent once the consumer holds the first paper
+        await first_received.wait()
+        yield body[split:]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream())
+
+    client = ArxivClient(max_results=10, categories=["cs.LG"])
+    asyncio.run(client.client.aclose())
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def scenario() -> list[str]:
+        seen = []
+        async with client:
+            async for paper in client.iter_recent(hours=24 * 365 * 100):
+                seen.append(paper["source_id"])
+                first_received.set()
+        return seen
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 5)) == ["2501.00001v1", "2501.00002v2"]
@@ -26,6 +26,7 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 
 from signal_harvester.backup import (
+    HAS_ZSTD,
     BackupManager,
     BackupMetadata,
     BackupType,
@@ -739,6 +740,28 @@ class TestCompression:
         count = cursor.fetchone()[0]
         assert count == 10
         conn.close()
+    
+    def test_default_compression_prefers_zstd(self, backup_manager: BackupManager):
+        """zstd is the default when installed, gzip otherwise."""
+        expected = CompressionType.ZSTD if HAS_ZSTD else CompressionType.GZIP
+        assert backup_manager.compression == expected
+    
+    @pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed")
+    def test_zstd_round_trip_streams_in_chunks(
+        self, backup_manager: BackupManager, tmp_path: Path, monkeypatch
+    ):
+        """zstd (de)compression streams across chunk boundaries."""
+        monkeypatch.setattr("signal_harvester.backup.COPY_CHUNK_SIZE", 4096)
+        source = tmp_path / "payload.db"
+        payload = os.urandom(10_000) + b"signal" * 50_000
+        source.write_bytes(payload)
+        
+        compressed = backup_manager._compress_file(source, CompressionType.ZSTD)
+        assert compressed.suffix == ".zst"
+        assert not source.exists()
+        
+        restored = backup_manager._decompress_file(compressed, tmp_path / "restored.db")
+        assert restored.read_bytes() == payload
 
 
 # ============================================================================
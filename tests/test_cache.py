@@ -1,9 +1,11 @@
 """Tests for Redis-backed response caching module."""
 
 import time
+from types import SimpleNamespace
 from typing import List
 from unittest.mock import MagicMock, patch
 
+import pytest
 from pydantic import BaseModel
 
 from signal_harvester.cache import (
@@ -12,6 +14,7 @@ from signal_harvester.cache import (
     _get_from_cache,
     _set_in_cache,
     cached,
+    cached_response,
     clear_cache_stats,
     get_cache_stats,
     invalidate_cache,
@@ -110,7 +113,7 @@ class TestMemoryCache:
         
         assert result == value
 
-    def test_memory_cache_expiration(self) -> None:
+    def test_memory_cache_expiration(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test memory cache TTL expiration."""
         from signal_harvester.cache import _memory_cache
         
@@ -125,8 +128,9 @@ class TestMemoryCache:
         # Should be available immediately
         assert _get_from_cache(key, ttl) == value
         
-        # Wait for expiration
-        time.sleep(1.5)
+        # Move the cache clock past expiration
+        later = time.time() + 1.5
+        monkeypatch.setattr("signal_harvester.cache.time", SimpleNamespace(time=lambda: later))
         
         # Should be None after expiration
         assert _get_from_cache(key, ttl) is None
@@ -149,6 +153,23 @@ class TestMemoryCache:
             # Cache should have evicted oldest entries
             assert len(_memory_cache) <= 5
 
+    def test_memory_cache_evicts_oldest_write(self) -> None:
+        """Test a rewritten key is treated as newest when evicting."""
+        from signal_harvester.cache import _memory_cache
+
+        _memory_cache.clear()
+
+        with patch("signal_harvester.cache._cache_config") as mock_config:
+            mock_config.max_memory_cache_size = 3
+
+            for name in ("a", "b", "c"):
+                _set_in_cache(f"test:{name}", {"id": name}, 3600)
+            _set_in_cache("test:a", {"id": "a2"}, 3600)  # rewrite, no eviction
+            assert list(_memory_cache) == ["test:b", "test:c", "test:a"]
+
+            _set_in_cache("test:d", {"id": "d"}, 3600)
+            assert list(_memory_cache) == ["test:c", "test:a", "test:d"]
+
 
 class TestCachedDecorator:
     """Tests for @cached decorator."""
@@ -205,6 +226,47 @@ class TestCachedDecorator:
         assert items2 == items1
 
 
+    def test_cached_response_returns_stored_body(self) -> None:
+        """Test response-body caching skips recompute and never caches None."""
+        call_count = 0
+        
+        @cached_response(prefix="body", ttl_key="discovery_ttl")
+        def get_body(model_id: int) -> bytes | None:
+            nonlocal call_count
+            call_count += 1
+            if model_id < 0:
+                return None
+            return TestModel(id=model_id, name="x", value=1.5).model_dump_json().encode()
+        
+        body1 = get_body(1)
+        body2 = get_body(1)
+        assert body1 == body2 == b'{"id":1,"name":"x","value":1.5}'
+        assert call_count == 1
+        
+        assert get_body(-1) is None
+        assert get_body(-1) is None
+        assert call_count == 3
+
+    def test_cached_response_honors_decorator_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test memory entries expire after the decorator's own ttl."""
+        call_count = 0
+        
+        @cached_response(prefix="short", ttl=1)
+        def get_body() -> bytes:
+            nonlocal call_count
+            call_count += 1
+            return b"[]"
+        
+        get_body()
+        get_body()
+        assert call_count == 1
+        
+        later = time.time() + 1.5
+        monkeypatch.setattr("signal_harvester.cache.time", SimpleNamespace(time=lambda: later))
+        get_body()
+        assert call_count == 2
+
+
 class TestCacheInvalidation:
     """Tests for cache invalidation."""
 
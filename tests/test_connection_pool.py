@@ -308,6 +308,34 @@ def test_connection_properties(pool: ConnectionPool) -> None:
         cursor = conn.execute("PRAGMA synchronous")
         synchronous = cursor.fetchone()[0]
         assert synchronous == 1  # NORMAL
+        
+        # Temp b-trees (GROUP BY, ORDER BY) stay in memory
+        cursor = conn.execute("PRAGMA temp_store")
+        assert cursor.fetchone()[0] == 2  # MEMORY
+
+
+def test_read_only_pool_connections(temp_db: Path) -> None:
+    """Read-only pools hand out autocommit connections that refuse writes."""
+    pool = ConnectionPool(db_path=str(temp_db), pool_size=1, max_overflow=0)
+    read_pool = ConnectionPool(db_path=str(temp_db), pool_size=1, max_overflow=0, read_only=True)
+    try:
+        with read_pool.connection() as conn:
+            assert conn.isolation_level is None
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0].upper() == "WAL"
+
+            conn.execute("SELECT value FROM test").fetchall()
+            assert not conn.in_transaction
+
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO test (value) VALUES ('blocked')")
+
+        with pool.connection() as conn:
+            assert conn.isolation_level == "DEFERRED"
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 0
+    finally:
+        pool.close_all()
+        read_pool.close_all()
 
 
 def test_pool_close_all(pool: ConnectionPool) -> None:
@@ -687,6 +687,33 @@ class TestDiscoveryJSONSerialization:
         assert parsed["artifactCount"] == 25
         assert parsed["avgDiscoveryScore"] == 82.5
 
+    def test_discovery_json_omits_null_fields(self):
+        """Unset optional fields are omitted, while pagination keeps nextCursor."""
+        import json
+
+        from signal_harvester.api import Discovery, PaginatedDiscoveries
+
+        discovery = Discovery(
+            id=1,
+            artifactId=101,
+            artifactType="preprint",
+            source="arxiv",
+            sourceId="2301.12345",
+            title="Test",
+            publishedAt="2025-01-15T10:00:00Z",
+            createdAt="2025-01-15T10:00:00Z",
+            updatedAt="2025-01-15T10:00:00Z",
+        )
+
+        parsed = json.loads(discovery.model_dump_json())
+        assert "reasoning" not in parsed
+        assert "novelty" not in parsed
+        assert parsed["title"] == "Test"
+
+        page = json.loads(PaginatedDiscoveries(items=[discovery], hasMore=False).model_dump_json())
+        assert page["nextCursor"] is None
+        assert "reasoning" not in page["items"][0]
+
 
 # Documentation for contract test maintenance
 """
@@ -2,7 +2,17 @@ from __future__ import annotations
 
 import tempfile
 
-from signal_harvester.db import init_db, list_top, update_analysis, update_salience, upsert_tweet
+from signal_harvester.db import (
+    create_signal,
+    get_signals_fingerprint,
+    get_tweet,
+    init_db,
+    list_top,
+    run_migrations,
+    update_analysis,
+    update_salience,
+    upsert_tweet,
+)
 
 
 def test_db_operations():
@@ -51,3 +61,131 @@ def test_db_operations():
     finally:
         import os
         os.unlink(db_path)
+
+
+def test_tweet_urls_composed_in_sql(tmp_path):
+    db_path = str(tmp_path / "urls.db")
+    init_db(db_path)
+    for tweet_id, username in (("111", "alice"), ("222", None)):
+        upsert_tweet(
+            db_path,
+            {"tweet_id": tweet_id, "text": "t", "author_username": username, "created_at": "2024-01-01T12:00:00Z"},
+            query_name="q",
+        )
+        update_salience(db_path, tweet_id, 50.0)
+
+    urls = {row["tweet_id"]: row["url"] for row in list_top(db_path, with_url=True)}
+    assert urls == {
+        "111": "https://x.com/alice/status/111",
+        "222": "https://x.com/i/web/status/222",
+    }
+    assert get_tweet(db_path, "222", with_url=True)["url"] == "https://x.com/i/web/status/222"
+    assert "url" not in get_tweet(db_path, "111")
+
+
+def test_list_top_plan_avoids_temp_sort(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "plan.db")
+    init_db(db_path)
+    run_migrations(db_path)
+
+    conn = sqlite3.connect(db_path)
+    plan = conn.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT * FROM tweets
+        WHERE salience >= ? AND created_at_epoch >= ?
+        ORDER BY salience DESC, created_at_epoch DESC
+        LIMIT ?;
+        """,
+        (0.0, 1704067200, 50),
+    ).fetchall()
+    conn.close()
+
+    details = " ".join(row[3] for row in plan)
+    assert "idx_tweets_salience_created" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_created_at_epoch_tracks_created_at(tmp_path):
+    import sqlite3
+    from datetime import datetime, timedelta, timezone
+
+    db_path = str(tmp_path / "epoch.db")
+    init_db(db_path)
+    run_migrations(db_path)
+
+    recent = (datetime.now(timezone.utc) - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    for tweet_id, created_at in (("1001", "2024-01-01T00:00:00.000Z"), ("1002", recent)):
+        upsert_tweet(db_path, {"tweet_id": tweet_id, "text": "t", "created_at": created_at})
+        update_salience(db_path, tweet_id, 50.0)
+
+    conn = sqlite3.connect(db_path)
+    epochs = dict(conn.execute("SELECT tweet_id, created_at_epoch FROM tweets;").fetchall())
+    conn.close()
+    assert epochs["1001"] == 1704067200
+    assert epochs["1002"] is not None
+
+    assert [row["tweet_id"] for row in list_top(db_path, hours=24)] == ["1002"]
+
+    # Re-upserting with a new created_at keeps the epoch column in step
+    upsert_tweet(db_path, {"tweet_id": "1001", "created_at": recent})
+    assert {row["tweet_id"] for row in list_top(db_path, hours=24)} == {"1001", "1002"}
+
+
+def test_migration_backfills_created_at_epoch(tmp_path):
+    import sqlite3
+
+    db_path = str(tmp_path / "backfill.db")
+    init_db(db_path)
+    upsert_tweet(db_path, {"tweet_id": "1001", "text": "t", "created_at": "2024-01-01T00:00:00Z"})
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE tweets SET created_at_epoch = NULL;")
+    conn.commit()
+    conn.close()
+
+    run_migrations(db_path)
+
+    conn = sqlite3.connect(db_path)
+    (epoch,) = conn.execute("SELECT created_at_epoch FROM tweets WHERE tweet_id = '1001';").fetchone()
+    conn.close()
+    assert epoch == 1704067200
+
+
+def test_signals_fingerprint_tracks_writes_from_any_connection(tmp_path):
+    import sqlite3
+
+    from signal_harvester.db import get_signals_fingerprint
+
+    db_path = str(tmp_path / "fingerprint.db")
+    init_db(db_path)
+    upsert_tweet(db_path, {"tweet_id": "1001", "text": "t", "created_at": "2024-01-01T00:00:00Z"})
+    before = get_signals_fingerprint(db_path)
+
+    # Another process's same-second update leaves COUNT and MAX(updated_at) alone
+    conn = sqlite3.connect(db_path)
+    conn.execute("UPDATE tweets SET salience = 99.0 WHERE tweet_id = '1001';")
+    conn.commit()
+    conn.close()
+
+    after = get_signals_fingerprint(db_path)
+    assert after != before
+    assert get_signals_fingerprint(db_path) == after
+
+
+def test_insert_fills_created_at_epoch_in_one_write(tmp_path):
+    db_path = str(tmp_path / "insert.db")
+    init_db(db_path)
+    run_migrations(db_path)
+
+    before = int(get_signals_fingerprint(db_path))
+    upsert_tweet(db_path, {"tweet_id": "1001", "text": "t", "created_at": "2024-01-01T00:00:00Z"})
+    # The INSERT itself plus upsert_tweet's follow-up UPDATE, nothing more
+    assert int(get_signals_fingerprint(db_path)) == before + 2
+    assert get_tweet(db_path, "1001")["created_at_epoch"] == 1704067200
+
+    before = int(get_signals_fingerprint(db_path))
+    signal = create_signal(db_path, "s", "x", "active")
+    assert int(get_signals_fingerprint(db_path)) == before + 1
+    assert get_tweet(db_path, signal["id"])["created_at_epoch"] is not None
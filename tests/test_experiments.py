@@ -13,6 +13,7 @@ from signal_harvester.db import init_db, run_migrations
 from signal_harvester.experiment import (
     ExperimentConfig,
     add_discovery_label,
+    add_discovery_labels_bulk,
     calculate_metrics,
     compare_experiments,
     create_experiment,
@@ -297,6 +298,43 @@ class TestExperimentComparison:
         comparison = compare_experiments(temp_db, exp_a, exp_b)
         assert "error" in comparison
 
+    def test_compare_uses_latest_completed_run(self, temp_db):
+        """Test both experiments' latest runs are read in one statement."""
+        import sqlite3
+        
+        config = ExperimentConfig(scoring_weights={"novelty": 0.5, "impact": 0.5})
+        exp_a = create_experiment(temp_db, "exp_a", config)
+        exp_b = create_experiment(temp_db, "exp_b", config)
+        stale_run = create_experiment_run(temp_db, exp_a, calculate_metrics(1, 9, 0, 0))
+        create_experiment_run(temp_db, exp_a, calculate_metrics(8, 2, 5, 5))
+        create_experiment_run(temp_db, exp_b, calculate_metrics(8, 2, 5, 5))
+        
+        conn = sqlite3.connect(temp_db)
+        with conn:
+            conn.execute(
+                "UPDATE experiment_runs SET completed_at = '2000-01-01T00:00:00Z' WHERE id = ?",
+                (stale_run,),
+            )
+        conn.close()
+        
+        comparison = compare_experiments(temp_db, exp_a, exp_b)
+        assert comparison["deltas"]["f1Score"] == 0.0
+        assert comparison["winner"] == "tie"
+        
+        same = compare_experiments(temp_db, exp_b, exp_b)
+        assert same["experimentA"] == same["experimentB"]
+    
+    def test_compare_route_not_shadowed_by_experiment_id(self):
+        """Test /experiments/compare resolves to the compare endpoint."""
+        from starlette.routing import Match
+        
+        from signal_harvester.api import create_app
+        
+        app = create_app()
+        scope = {"type": "http", "path": "/experiments/compare", "method": "GET"}
+        route = next(r for r in app.routes if r.matches(scope)[0] == Match.FULL)
+        assert route.name == "compare_experiments_endpoint"
+
 
 class TestDiscoveryLabels:
     """Test ground truth labeling functionality."""
@@ -402,6 +440,45 @@ class TestDiscoveryLabels:
         assert len(tp_labels) == 1
         assert tp_labels[0]["label"] == "true_positive"
 
+    def test_bulk_labels_upsert_in_one_statement(self, temp_db):
+        """Test bulk labelling inserts new labels and updates existing ones."""
+        from signal_harvester.db import upsert_artifact
+        
+        artifact_ids = [
+            upsert_artifact(
+                temp_db,
+                artifact_type="paper",
+                source="test",
+                source_id=f"bulk_{i}",
+                title=f"Bulk {i}",
+                url=f"https://example.com/bulk/{i}",
+                published_at="2025-11-11T00:00:00Z",
+            )
+            for i in range(3)
+        ]
+        existing_id = add_discovery_label(temp_db, artifact_ids[0], "true_positive")
+        
+        written = add_discovery_labels_bulk(
+            temp_db,
+            [
+                {"artifact_id": artifact_ids[0], "label": "false_positive", "confidence": 0.7},
+                {"artifact_id": artifact_ids[1], "label": "relevant", "annotator": "bulk_user"},
+                {"artifact_id": artifact_ids[2], "label": "relevant"},
+                {"artifact_id": artifact_ids[2], "label": "irrelevant", "notes": "second look"},
+            ],
+        )
+        
+        assert written == 3
+        labels = {label["artifactId"]: label for label in get_labeled_artifacts(temp_db)}
+        assert len(labels) == 3
+        assert labels[artifact_ids[0]]["id"] == existing_id
+        assert labels[artifact_ids[0]]["label"] == "false_positive"
+        assert labels[artifact_ids[0]]["confidence"] == 0.7
+        assert labels[artifact_ids[1]]["annotator"] == "bulk_user"
+        assert labels[artifact_ids[2]]["label"] == "irrelevant"
+        assert labels[artifact_ids[2]]["notes"] == "second look"
+        assert add_discovery_labels_bulk(temp_db, []) == 0
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -21,3 +21,64 @@ def test_prometheus_metrics_endpoint_exposes_instrumentation():
     assert r.status_code == 200
     assert "http_requests_total" in r.text
     assert r.headers["content-type"].startswith("text/plain")
+
+
+def test_database_health_reuses_recent_healthy_probe(monkeypatch):
+    import asyncio
+
+    from signal_harvester import health
+
+    probes = []
+
+    class FakeConnection:
+        def execute(self, sql):
+            probes.append(sql)
+            return self
+
+        def fetchone(self):
+            return {"result": 1}
+
+        def close(self):
+            pass
+
+    settings = health.get_config()
+    monkeypatch.setattr(health, "get_config", lambda: settings)
+    monkeypatch.setattr(health, "_sqlite_pool_for", lambda settings: None)
+    monkeypatch.setattr(health, "get_database_connection", lambda config: FakeConnection())
+    monkeypatch.setattr(health, "_database_health_cache", {})
+
+    first = asyncio.run(health.check_database_health())
+    second = asyncio.run(health.check_database_health())
+    assert first.status == health.HealthStatus.HEALTHY
+    assert second is first
+    assert len(probes) == 2  # SELECT 1 and the artifact count, once
+
+    url = settings.app.database.url
+    health._database_health_cache[url] = (0.0, first)
+    asyncio.run(health.check_database_health())
+    assert len(probes) == 4
+
+    # A different database is probed on its own
+    settings.app.database.url = "sqlite:///other.db"
+    asyncio.run(health.check_database_health())
+    assert len(probes) == 6
+
+
+def test_probe_timestamps_are_utc_and_formatted_once_per_second(monkeypatch):
+    from datetime import datetime, timezone
+
+    from signal_harvester import health, utils
+
+    def clock():
+        return 1_700_000_000.75
+
+    monkeypatch.setattr(utils, "_utc_now_iso_cache", (-1, ""))
+    assert utils.utc_now_iso(clock) == "2023-11-14T22:13:20Z"
+    assert utils.utc_now_iso(clock) is utils.utc_now_iso(clock)
+
+    first = health._utc_now(clock)
+    assert health._utc_now(clock) is first
+    assert first == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+    payload = TestClient(create_app()).get("/health/live").json()
+    assert payload["timestamp"].endswith("Z")
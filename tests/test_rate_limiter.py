@@ -110,6 +110,38 @@ class TestInMemoryRateLimiter:
         # Note: This is timing-sensitive, so we just check it doesn't crash
         assert "key3" in limiter.buckets
 
+    def test_sweep_removes_only_expired_buckets(self):
+        """Test sweep drops idle buckets and defers the per-request cleanup."""
+        limiter = InMemoryRateLimiter(cleanup_interval=60)
+
+        limiter.check_rate_limit("key1", 10, 60)
+        limiter.check_rate_limit("key2", 10, 60)
+        limiter.buckets["key1"].last_check -= 120
+
+        assert limiter.sweep() == 1
+        assert list(limiter.buckets) == ["key2"]
+        assert time.time() - limiter.last_cleanup < 1
+
+    def test_bucket_count_is_capped(self):
+        """Test least recently used buckets are evicted past max_buckets."""
+        limiter = InMemoryRateLimiter(max_buckets=2)
+
+        limiter.check_rate_limit("key1", 10, 60)
+        limiter.check_rate_limit("key2", 10, 60)
+        limiter.check_rate_limit("key1", 10, 60)  # key1 is now most recent
+        limiter.check_rate_limit("key3", 10, 60)
+
+        assert list(limiter.buckets) == ["key1", "key3"]
+
+    def test_buckets_are_slotted(self):
+        """Test per-client state carries no instance dict."""
+        limiter = InMemoryRateLimiter()
+        limiter.check_rate_limit("key1", 10, 60)
+
+        bucket = limiter.buckets["key1"]
+        assert not hasattr(bucket, "__dict__")
+        assert (bucket.tokens, bucket.max_tokens) == (9, 10)
+
 
 class TestRateLimitConfig:
     """Tests for rate limit configuration."""
@@ -158,6 +190,23 @@ class TestDistributedRateLimiter:
         assert limiter.memory_limiter is not None
         assert limiter.redis_limiter is None
 
+    def test_in_memory_scope_warns_for_multiple_workers(self, monkeypatch):
+        """The in-memory fallback is per-worker and says so when several workers run."""
+        from signal_harvester import rate_limiter
+
+        warnings = []
+        monkeypatch.setattr(rate_limiter.log, "warning", lambda msg, *args: warnings.append(msg))
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        limiter = DistributedRateLimiter(RateLimitConfig(redis_enabled=False))
+
+        assert limiter.scope == "per-worker"
+        assert any("4 workers" in msg for msg in warnings)
+
+        warnings.clear()
+        monkeypatch.setenv("WEB_CONCURRENCY", "1")
+        DistributedRateLimiter(RateLimitConfig(redis_enabled=False))
+        assert not any("workers" in msg for msg in warnings)
+
     def test_admin_tier_always_allowed(self):
         """Test admin tier is always allowed."""
         config = RateLimitConfig(redis_enabled=False)
@@ -614,6 +614,39 @@ def test_get_citation_graph_depth_limiting(test_db, sample_artifacts):
     assert len(graph_d2["nodes"]) >= len(graph_d1["nodes"])
 
 
+def test_get_citation_graph_queries_once_per_level(test_db, sample_artifacts, monkeypatch):
+    """Graph expansion batches each BFS level into one query and dedupes edges."""
+    import signal_harvester.relationship_detection as rd
+    
+    # Chain: tweet -> arxiv -> arxiv2 -> github
+    chain = ["tweet", "arxiv", "arxiv2", "github"]
+    for source, target in zip(chain, chain[1:]):
+        create_artifact_relationship(
+            db_path=test_db,
+            source_artifact_id=sample_artifacts[source],
+            target_artifact_id=sample_artifacts[target],
+            relationship_type="related",
+            confidence=0.9,
+        )
+    
+    frontiers = []
+    original = rd.get_relationships_for_artifacts
+    
+    def counting(db_path, artifact_ids, min_confidence):
+        frontiers.append(list(artifact_ids))
+        return original(db_path, artifact_ids, min_confidence)
+    
+    monkeypatch.setattr(rd, "get_relationships_for_artifacts", counting)
+    graph = get_citation_graph(test_db, sample_artifacts["tweet"], depth=1, min_confidence=0.5)
+    
+    assert frontiers == [[sample_artifacts["tweet"]], [sample_artifacts["arxiv"]]]
+    assert {n["id"] for n in graph["nodes"]} == {
+        sample_artifacts["tweet"], sample_artifacts["arxiv"], sample_artifacts["arxiv2"]
+    }
+    # tweet->arxiv is returned at both levels but reported once
+    assert graph["edge_count"] == 2
+
+
 # Helper function for tests
 def get_artifact_by_id(db_path: str, artifact_id: int) -> dict[str, Any]:
     """Get artifact by ID (helper for tests)."""
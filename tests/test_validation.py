@@ -0,0 +1,36 @@
+"""Tests for request input validation helpers."""
+
+import pytest
+from fastapi import HTTPException
+
+from signal_harvester.validation import sanitize_string, validate_api_key, validate_tweet_id
+
+
+def test_validate_tweet_id_accepts_numeric_ids() -> None:
+    assert validate_tweet_id("1234567890123456789") == "1234567890123456789"
+
+
+@pytest.mark.parametrize(
+    "tweet_id",
+    ["", "12345", "12345abcde12345", "1234567890\n", "١٢٣٤٥٦٧٨٩٠١٢", "1" * 21],
+)
+def test_validate_tweet_id_rejects_invalid_ids(tweet_id: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        validate_tweet_id(tweet_id)
+    assert exc_info.value.status_code == 400
+
+
+def test_validate_api_key_checks_format() -> None:
+    assert validate_api_key(None) is None
+    assert validate_api_key("abcdef0123456789-_") == "abcdef0123456789-_"
+
+    for bad_key in ("short", "a" * 129, "abcdef0123456789!"):
+        with pytest.raises(HTTPException):
+            validate_api_key(bad_key)
+    # Rejected keys keep failing on repeat calls
+    with pytest.raises(HTTPException):
+        validate_api_key("abcdef0123456789!")
+
+
+def test_sanitize_string_strips_control_characters() -> None:
+    assert sanitize_string("ok\x00 text\x07\n") == "ok text\n"